@@ -0,0 +1,264 @@
+import json
+import os
+import subprocess
+
+from math import ceil
+from statistics import median, stdev
+from time import perf_counter, time
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+import click
+
+from advent_of_code.loader import (
+    IMPLEMENTATION_PYTHON,
+    IMPLEMENTATIONS,
+    list_puzzle_implementations,
+    list_puzzle_solvers,
+    load_puzzle_answer,
+    load_puzzle_input,
+    load_puzzle_solver,
+)
+from advent_of_code.solve_puzzle import format_duration
+
+
+BENCHMARK_HISTORY_PATH = os.path.join(os.path.dirname(__file__), "..", "puzzles", "benchmarks.jsonl")
+
+BenchmarkKey = Tuple[int, int, int, str]
+
+
+class Benchmark(NamedTuple):
+    result: Any
+    timings: List[float]
+    implementation: str
+
+    @property
+    def min(self) -> float:
+        return min(self.timings)
+
+    @property
+    def median(self) -> float:
+        return median(self.timings)
+
+    @property
+    def p95(self) -> float:
+        # nearest-rank percentile
+        timings = sorted(self.timings)
+        return timings[ceil(0.95 * len(timings)) - 1]
+
+    @property
+    def stddev(self) -> float:
+        return stdev(self.timings) if len(self.timings) > 1 else 0.0
+
+
+def benchmark_puzzle(year: int, day: int, part: int, implementation: str, runs: int, warmup: int) -> Benchmark:
+    puzzle_input = load_puzzle_input(year, day)
+    fn = load_puzzle_solver(year, day, part, implementation)
+
+    for _ in range(warmup):
+        fn(puzzle_input)
+
+    result = None
+    timings = []
+    for _ in range(runs):
+        t0 = perf_counter()
+        result = fn(puzzle_input)
+        t1 = perf_counter()
+        timings.append(t1 - t0)
+
+    return Benchmark(result=result, timings=timings, implementation=implementation)
+
+
+def check_answer(year: int, day: int, part: int, actual_answer: Any) -> Optional[bool]:
+    try:
+        expected_answer = load_puzzle_answer(year, day, part)
+    except FileNotFoundError:
+        return None
+
+    # coerce expected answer to correct type, if needed
+    if type(actual_answer) is not str:
+        expected_answer = (type(actual_answer))(expected_answer)
+
+    return actual_answer == expected_answer
+
+
+def get_git_revision() -> str:
+    try:
+        proc = subprocess.run(
+            ["git", "describe", "--always", "--dirty"],
+            cwd=os.path.dirname(__file__),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            check=True,
+            universal_newlines=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+    return proc.stdout.strip()
+
+
+def load_benchmark_history(filename: str = BENCHMARK_HISTORY_PATH) -> List[Dict[str, Any]]:
+    if not os.path.exists(filename):
+        return []
+
+    with open(filename, mode="r") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def save_benchmark(record: Dict[str, Any], filename: str = BENCHMARK_HISTORY_PATH):
+    with open(filename, mode="a") as f:
+        f.write(json.dumps(record, sort_keys=True) + "\n")
+
+
+def create_benchmark_record(year: int, day: int, part: int, benchmark: Benchmark, revision: str) -> Dict[str, Any]:
+    return {
+        "year": year,
+        "day": day,
+        "part": part,
+        "implementation": benchmark.implementation,
+        "revision": revision,
+        "timestamp": time(),
+        "runs": len(benchmark.timings),
+        "min": benchmark.min,
+        "median": benchmark.median,
+        "p95": benchmark.p95,
+        "stddev": benchmark.stddev,
+    }
+
+
+def find_baselines(history: List[Dict[str, Any]], revision: Optional[str]) -> Dict[BenchmarkKey, Dict[str, Any]]:
+    baselines = {}
+    for record in history:
+        if revision is not None and record["revision"] != revision:
+            continue
+        key = (record["year"], record["day"], record["part"], record["implementation"])
+        # the history is append-only, so the last record wins
+        baselines[key] = record
+    return baselines
+
+
+def print_benchmark(year: int, day: int, part: int, benchmark: Benchmark, correct: Optional[bool]):
+    verdict = {True: "correct", False: "WRONG", None: "unverified"}[correct]
+    print(
+        f"Benchmark for puzzle year{year}-day{day}-part{part} using {benchmark.implementation}"
+        f" ({len(benchmark.timings)} runs, {verdict} answer):"
+    )
+    print(
+        f"\tmin {format_duration(benchmark.min)}"
+        f" | median {format_duration(benchmark.median)}"
+        f" | p95 {format_duration(benchmark.p95)}"
+        f" | stddev {format_duration(benchmark.stddev)}"
+    )
+
+
+def print_comparison(benchmark: Benchmark, baseline: Dict[str, Any], threshold: float) -> bool:
+    ratio = benchmark.median / baseline["median"] if baseline["median"] > 0 else 1.0
+    regressed = ratio > 1 + threshold
+    print(
+        f"\t{'REGRESSION' if regressed else 'compared'} against {baseline['revision']}:"
+        f" median {format_duration(baseline['median'])} -> {format_duration(benchmark.median)} ({ratio - 1:+.1%})"
+    )
+    return regressed
+
+
+def compare_implementations(benchmarks: List[Benchmark]) -> bool:
+    results = {str(benchmark.result) for benchmark in benchmarks}
+    if len(results) > 1:
+        answers = ", ".join(f"{benchmark.implementation}={benchmark.result}" for benchmark in benchmarks)
+        print(f"\tDIVERGENCE between implementations: {answers}")
+        return False
+
+    python = next((benchmark for benchmark in benchmarks if benchmark.implementation == IMPLEMENTATION_PYTHON), None)
+    if python is not None:
+        for benchmark in benchmarks:
+            if benchmark is not python and benchmark.median > 0:
+                print(f"\t{benchmark.implementation} is {python.median / benchmark.median:.1f}x as fast as python")
+    return True
+
+
+@click.command()
+@click.option("--year", type=int, default=None)
+@click.option("--day", type=int, default=None)
+@click.option("--part", type=int, default=None)
+@click.option("--runs", type=click.IntRange(min=1), default=10, help="Number of timed runs per puzzle")
+@click.option("--warmup", type=click.IntRange(min=0), default=1, help="Number of untimed runs per puzzle")
+@click.option(
+    "--impl", "implementation", type=click.Choice(IMPLEMENTATIONS), default=None, help="Force an implementation"
+)
+@click.option("--all-impls", is_flag=True, help="Benchmark every available implementation and check they agree")
+@click.option("--save", is_flag=True, help="Store the results in the benchmark history")
+@click.option("--compare", is_flag=True, help="Compare the results against the benchmark history")
+@click.option("--baseline", type=str, default=None, help="Git revision to compare against (default: latest run)")
+@click.option(
+    "--threshold",
+    type=click.FloatRange(min=0),
+    default=0.1,
+    help="Allowed relative slowdown of the median before failing",
+)
+def main(
+    year: Optional[int],
+    day: Optional[int],
+    part: Optional[int],
+    runs: int,
+    warmup: int,
+    implementation: Optional[str],
+    all_impls: bool,
+    save: bool,
+    compare: bool,
+    baseline: Optional[str],
+    threshold: float,
+):
+    revision = get_git_revision()
+    baselines = find_baselines(load_benchmark_history(), baseline) if compare else {}
+
+    puzzles = [
+        puzzle
+        for puzzle in list_puzzle_solvers(year)
+        if (day is None or puzzle[1] == day) and (part is None or puzzle[2] == part)
+    ]
+
+    wrong_answers = 0
+    regressions = 0
+    divergences = 0
+    for year, day, part in puzzles:
+        implementations = list_puzzle_implementations(year, day, part)
+        if implementation is not None:
+            implementations = (implementation,) if implementation in implementations else ()
+        elif not all_impls:
+            implementations = implementations[:1]
+
+        benchmarks = []
+        for puzzle_implementation in implementations:
+            benchmark = benchmark_puzzle(year, day, part, puzzle_implementation, runs=runs, warmup=warmup)
+            benchmarks.append(benchmark)
+            correct = check_answer(year, day, part, benchmark.result)
+            print_benchmark(year, day, part, benchmark, correct)
+            if correct is False:
+                wrong_answers += 1
+
+            if compare:
+                puzzle_baseline = baselines.get((year, day, part, benchmark.implementation))
+                if puzzle_baseline is None:
+                    print("\tno baseline found to compare against")
+                elif print_comparison(benchmark, puzzle_baseline, threshold):
+                    regressions += 1
+            print("")
+
+            if save:
+                save_benchmark(create_benchmark_record(year, day, part, benchmark, revision))
+
+        if len(benchmarks) > 1:
+            print(f"Comparison of implementations for puzzle year{year}-day{day}-part{part}:")
+            if not compare_implementations(benchmarks):
+                divergences += 1
+            print("")
+
+    if wrong_answers > 0:
+        raise click.ClickException(f"{wrong_answers} puzzle(s) returned a wrong answer")
+    if divergences > 0:
+        raise click.ClickException(f"{divergences} puzzle(s) have implementations which disagree")
+    if regressions > 0:
+        raise click.ClickException(f"{regressions} puzzle(s) got slower than the baseline")
+
+
+if __name__ == "__main__":
+    main()
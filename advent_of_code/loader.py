@@ -1,7 +1,30 @@
 import os
+import pkgutil
+import re
+import sys
+import threading
 
+from functools import lru_cache
+from glob import iglob
 from importlib import import_module
-from typing import Any, Callable
+from importlib.machinery import EXTENSION_SUFFIXES
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+
+Puzzle = Tuple[int, int, int]
+
+RE_YEAR = re.compile(r"^year(\d{4})$")
+RE_DAY = re.compile(r"^day(\d{2})$")
+RE_PART = re.compile(r"^part([12])$")
+RE_NATIVE_MODULE = re.compile(r"^(shared|part[12])_native$")
+
+IMPLEMENTATION_PYTHON = "python"
+IMPLEMENTATION_NATIVE = "native"
+IMPLEMENTATION_RUST = "rust"
+IMPLEMENTATIONS = (IMPLEMENTATION_PYTHON, IMPLEMENTATION_NATIVE, IMPLEMENTATION_RUST)
+
+# loading the pure Python solver temporarily swaps modules in sys.modules, other threads must not import in between
+_SOLVER_LOADER_LOCK = threading.Lock()
 
 
 def _read_file(filename: str) -> str:
@@ -41,6 +64,56 @@ def _load_puzzle_solver_from_python(year: int, day: int, part: int) -> Callable[
     return module.calculate
 
 
+def _find_native_modules(year: int, day: int, part: int) -> List[str]:
+    package_path = os.path.join(os.path.dirname(__file__), f"year{year}", f"day{day:02d}")
+    modules = []
+    for suffix in EXTENSION_SUFFIXES:
+        for filename in iglob(os.path.join(package_path, f"*_native{suffix}")):
+            name = os.path.basename(filename)[: -len(suffix)]
+            match = RE_NATIVE_MODULE.match(name)
+            # shared Cython code is used by both parts, otherwise it's only used by its own part
+            if match and match.group(1) in ("shared", f"part{part}"):
+                modules.append(f"advent_of_code.year{year}.day{day:02d}.{name}")
+    return modules
+
+
+def _load_puzzle_solver_from_native(year: int, day: int, part: int) -> Callable[[str], Any]:
+    # import these explicitly, as the Python code silently falls back to its pure Python implementation
+    for module_name in _find_native_modules(year, day, part):
+        import_module(module_name)
+
+    return _load_puzzle_solver_from_python(year, day, part)
+
+
+def _load_puzzle_solver_from_pure_python(year: int, day: int, part: int) -> Callable[[str], Any]:
+    native_modules = _find_native_modules(year, day, part)
+    if not native_modules:
+        return _load_puzzle_solver_from_python(year, day, part)
+
+    package_name = f"advent_of_code.year{year}.day{day:02d}"
+    package = import_module(package_name)
+    loaded_modules = {
+        name: module for name, module in sys.modules.items() if name.startswith(f"{package_name}.") and module
+    }
+
+    try:
+        # importing a module which is None in sys.modules raises an ImportError, which makes the Python code fall
+        # back to its pure Python implementation
+        for name in loaded_modules:
+            del sys.modules[name]
+        for name in native_modules:
+            sys.modules[name] = None
+
+        return _load_puzzle_solver_from_python(year, day, part)
+    finally:
+        # make sure the freshly imported modules don't leak into other solvers
+        for name in [name for name in sys.modules if name.startswith(f"{package_name}.")]:
+            del sys.modules[name]
+        for name, module in loaded_modules.items():
+            sys.modules[name] = module
+            setattr(package, name.rpartition(".")[2], module)
+
+
 def _load_puzzle_solver_from_rust(year: int, day: int, part: int) -> Callable[[str], Any]:
     module = import_module("aoc_rust")
     if not hasattr(module, f"year{year}"):
@@ -57,9 +130,105 @@ def _load_puzzle_solver_from_rust(year: int, day: int, part: int) -> Callable[[s
     return getattr(module, f"part{part}")
 
 
-def load_puzzle_solver(year: int, day: int, part: int) -> Callable[[str], Any]:
+_SOLVER_LOADERS = {
+    IMPLEMENTATION_PYTHON: _load_puzzle_solver_from_pure_python,
+    IMPLEMENTATION_NATIVE: _load_puzzle_solver_from_native,
+    IMPLEMENTATION_RUST: _load_puzzle_solver_from_rust,
+}
+
+
+def load_puzzle_solver(year: int, day: int, part: int, implementation: Optional[str] = None) -> Callable[[str], Any]:
+    implementations = list_puzzle_implementations(year, day, part)
+    if not implementations:
+        raise ModuleNotFoundError(f"No puzzle solution found for year{year}-day{day}-part{part}")
+
+    if implementation is None:
+        implementation = implementations[0]
+    elif implementation not in implementations:
+        raise ModuleNotFoundError(f"No {implementation} puzzle solution found for year{year}-day{day}-part{part}")
+
+    with _SOLVER_LOADER_LOCK:
+        return _SOLVER_LOADERS[implementation](year, day, part)
+
+
+def load_puzzle_self_checks(year: int, day: int, part: int) -> Dict[str, Callable[[], None]]:
+    package_path = os.path.join(os.path.dirname(__file__), f"year{year}", f"day{day:02d}")
+    if not os.path.isdir(package_path):
+        # puzzles solved in Rust are tested by cargo
+        return {}
+
+    self_checks = {}
+    for module_info in pkgutil.iter_modules([package_path]):
+        name = module_info.name
+        if name.endswith("_native") or (RE_PART.match(name) and name != f"part{part}"):
+            continue
+
+        module = import_module(f"advent_of_code.year{year}.day{day:02d}.{name}")
+        if hasattr(module, "self_check"):
+            self_checks[module.__name__] = module.self_check
+    return self_checks
+
+
+def _list_puzzle_solvers_from_python() -> Iterator[Puzzle]:
+    package_path = os.path.dirname(__file__)
+    for filename in iglob(os.path.join(package_path, "year*", "day*", "part?.py")):
+        path_parts = os.path.splitext(os.path.relpath(filename, package_path))[0].split(os.sep)
+        year, day, part = RE_YEAR.match(path_parts[0]), RE_DAY.match(path_parts[1]), RE_PART.match(path_parts[2])
+        if year and day and part:
+            yield int(year.group(1)), int(day.group(1)), int(part.group(1))
+
+
+def _list_puzzle_solvers_from_native() -> Iterator[Puzzle]:
+    for year, day, part in _list_puzzle_solvers_from_python():
+        if _find_native_modules(year, day, part):
+            yield year, day, part
+
+
+def _list_puzzle_solvers_from_rust() -> Iterator[Puzzle]:
     try:
-        return _load_puzzle_solver_from_python(year, day, part)
+        module = import_module("aoc_rust")
     except ImportError:
-        # try loading from Rust
-        return _load_puzzle_solver_from_rust(year, day, part)
+        return
+
+    for year_name in dir(module):
+        year = RE_YEAR.match(year_name)
+        if not year:
+            continue
+        year_module = getattr(module, year_name)
+        for day_name in dir(year_module):
+            day = RE_DAY.match(day_name)
+            if not day:
+                continue
+            day_module = getattr(year_module, day_name)
+            for part_name in dir(day_module):
+                part = RE_PART.match(part_name)
+                if part:
+                    yield int(year.group(1)), int(day.group(1)), int(part.group(1))
+
+
+@lru_cache(maxsize=None)
+def _get_solver_registry() -> Dict[Puzzle, Tuple[str, ...]]:
+    # maps every puzzle to its available implementations, in order of preference
+    registry: Dict[Puzzle, Tuple[str, ...]] = {}
+    for implementation, puzzles in (
+        # the Python solutions prefer their Cython modules (if available), so that's the default
+        (IMPLEMENTATION_NATIVE, _list_puzzle_solvers_from_native()),
+        (IMPLEMENTATION_PYTHON, _list_puzzle_solvers_from_python()),
+        (IMPLEMENTATION_RUST, _list_puzzle_solvers_from_rust()),
+    ):
+        for puzzle in puzzles:
+            registry[puzzle] = registry.get(puzzle, ()) + (implementation,)
+    return registry
+
+
+def list_puzzle_implementations(year: int, day: int, part: int) -> Tuple[str, ...]:
+    return _get_solver_registry().get((year, day, part), ())
+
+
+def list_puzzle_solvers(year: Optional[int] = None) -> List[Puzzle]:
+    return sorted(
+        (puzzle_year, day, part)
+        for puzzle_year, day, part in _get_solver_registry()
+        # the last day of each year only has a single part
+        if (year is None or puzzle_year == year) and not (day == 25 and part == 2)
+    )
@@ -0,0 +1,86 @@
+import multiprocessing
+
+from multiprocessing.connection import Connection
+from time import perf_counter
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from advent_of_code.loader import load_puzzle_input, load_puzzle_solver
+
+
+# maps a year to its time budget (in seconds), the `None` key applies to all years
+TimeBudgets = Dict[Optional[int], float]
+
+# the personal goals, as stated in the README
+DEFAULT_TIME_BUDGETS: TimeBudgets = {
+    2020: 1.0,
+}
+
+
+class PuzzleTimeoutError(Exception):
+    def __init__(self, year: int, day: int, part: int, timeout: float):
+        super().__init__(f"Puzzle year{year}-day{day}-part{part} did not finish within {timeout:.2f}s")
+        self.timeout = timeout
+
+
+def parse_time_budgets(values: Iterable[str], enforce_goals: bool = False) -> TimeBudgets:
+    budgets: TimeBudgets = dict(DEFAULT_TIME_BUDGETS) if enforce_goals else {}
+    for value in values:
+        year, sep, seconds = value.rpartition("=")
+        try:
+            budgets[int(year) if sep else None] = float(seconds)
+        except ValueError:
+            raise ValueError(f"Invalid time budget {value!r}, expected SECONDS or YEAR=SECONDS")
+    return budgets
+
+
+def get_time_budget(year: int, budgets: TimeBudgets) -> Optional[float]:
+    return budgets.get(year, budgets.get(None))
+
+
+def solve_puzzle(year: int, day: int, part: int, implementation: Optional[str] = None) -> Tuple[Any, float]:
+    puzzle_input = load_puzzle_input(year, day)
+    fn = load_puzzle_solver(year, day, part, implementation)
+
+    t0 = perf_counter()
+    result = fn(puzzle_input)
+    t1 = perf_counter()
+
+    return result, t1 - t0
+
+
+def _solve_puzzle_worker(conn: Connection, year: int, day: int, part: int, implementation: Optional[str]):
+    try:
+        conn.send((True, solve_puzzle(year, day, part, implementation)))
+    except BaseException as e:
+        conn.send((False, e))
+    finally:
+        conn.close()
+
+
+def solve_puzzle_in_subprocess(
+    year: int, day: int, part: int, timeout: Optional[float], implementation: Optional[str] = None
+) -> Tuple[Any, float]:
+    recv_conn, send_conn = multiprocessing.Pipe(duplex=False)
+    process = multiprocessing.Process(
+        target=_solve_puzzle_worker, args=(send_conn, year, day, part, implementation), daemon=True
+    )
+    process.start()
+    send_conn.close()
+
+    try:
+        if not recv_conn.poll(timeout):
+            raise PuzzleTimeoutError(year, day, part, timeout)
+
+        try:
+            success, value = recv_conn.recv()
+        except EOFError:
+            raise RuntimeError(f"Worker for puzzle year{year}-day{day}-part{part} died unexpectedly")
+    finally:
+        recv_conn.close()
+        if process.is_alive():
+            process.kill()
+        process.join()
+
+    if not success:
+        raise value
+    return value
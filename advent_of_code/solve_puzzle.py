@@ -1,9 +1,26 @@
-from time import perf_counter
-from typing import Optional
+import os
+
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Any, Callable, Iterable, List, Optional, Tuple
 
 import click
 
-from advent_of_code.loader import load_puzzle_input, load_puzzle_solver
+from advent_of_code.loader import (
+    IMPLEMENTATIONS,
+    Puzzle,
+    list_puzzle_implementations,
+    list_puzzle_solvers,
+    load_puzzle_self_checks,
+)
+from advent_of_code.runner import (
+    PuzzleTimeoutError,
+    TimeBudgets,
+    get_time_budget,
+    parse_time_budgets,
+    solve_puzzle,
+    solve_puzzle_in_subprocess,
+)
+from advent_of_code.utils.parallel import create_executor
 
 
 def read_file(filename: str) -> str:
@@ -21,38 +38,129 @@ def format_duration(secs: float) -> str:
         return f"{secs:.2f}s"
 
 
-def run_puzzle(year: int, day: int, part: int):
-    puzzle_input = load_puzzle_input(year, day)
-    fn = load_puzzle_solver(year, day, part)
+def solve_puzzle_within_budget(
+    year: int, day: int, part: int, budgets: TimeBudgets, implementation: Optional[str]
+) -> Tuple[Any, float]:
+    if not budgets:
+        return solve_puzzle(year, day, part, implementation)
+
+    # run the solver in a separate process, so it can be killed when it exceeds its budget
+    return solve_puzzle_in_subprocess(year, day, part, get_time_budget(year, budgets), implementation)
+
 
-    t0 = perf_counter()
-    result = fn(puzzle_input)
-    t1 = perf_counter()
+def report_puzzle(year: int, day: int, part: int, solve: Callable[[], Tuple[Any, float]]) -> bool:
+    try:
+        result, duration = solve()
+    except PuzzleTimeoutError as e:
+        print(f"Puzzle year{year}-day{day}-part{part} is over budget:")
+        print(f"\tit was killed after {format_duration(e.timeout)}")
+        print("")
+        return False
 
     print(f"Result for puzzle year{year}-day{day}-part{part} is: {result}")
-    print(f"\tsolving this took {format_duration(t1 - t0)}")
+    print(f"\tsolving this took {format_duration(duration)}")
     print("")
+    return True
+
+
+def run_puzzle(year: int, day: int, part: int, budgets: TimeBudgets, implementation: Optional[str]) -> bool:
+    return report_puzzle(year, day, part, lambda: solve_puzzle_within_budget(year, day, part, budgets, implementation))
+
+
+def run_puzzles_in_parallel(
+    puzzles: Iterable[Puzzle], jobs: int, budgets: TimeBudgets, implementation: Optional[str]
+) -> List[bool]:
+    # with a budget every puzzle already runs in its own (killable) process, so threads suffice to wait on them.
+    # Otherwise the CPUs are shared by the workers, for puzzles which solve parts of themselves in parallel.
+    if budgets:
+        executor: Executor = ThreadPoolExecutor(max_workers=jobs)
+    else:
+        executor = create_executor(jobs, worker_jobs=max(1, (os.cpu_count() or 1) // jobs))
+    with executor:
+        # submit everything upfront, so a slow puzzle doesn't hold up the others
+        futures = [
+            (puzzle, executor.submit(solve_puzzle_within_budget, *puzzle, budgets, implementation))
+            for puzzle in puzzles
+        ]
+
+        # but report the results in a deterministic order
+        return [report_puzzle(year, day, part, future.result) for (year, day, part), future in futures]
+
+
+def run_self_checks(puzzles: Iterable[Puzzle]):
+    self_checks = {}
+    for puzzle in puzzles:
+        # puzzle parts can share modules, only check those once
+        self_checks.update(load_puzzle_self_checks(*puzzle))
+
+    for name, self_check in self_checks.items():
+        self_check()
+        print(f"Self-check of {name} passed")
+    print("")
+
+
+def _parse_time_budgets_option(ctx: click.Context, param: click.Parameter, values: Tuple[str, ...]) -> TimeBudgets:
+    try:
+        return parse_time_budgets(values, enforce_goals=ctx.params.get("enforce_goals", False))
+    except ValueError as e:
+        raise click.BadParameter(str(e))
 
 
 @click.command()
-@click.option("--year", type=int, required=True)
+@click.option("--year", type=int, default=None)
 @click.option("--day", type=int, default=None)
 @click.option("--part", type=int, default=None)
-def main(year: int, day: Optional[int], part: Optional[int]):
-    def run_parts(day: int):
-        if part is None:
-            run_puzzle(year, day, part=1)
-            run_puzzle(year, day, part=2)
-        else:
-            run_puzzle(year, day, part=part)
-
-    if day is None:
-        # run all the puzzles
-        for day in range(1, 26):
-            run_parts(day)
-    else:
+@click.option("--jobs", type=click.IntRange(min=1), default=1, help="Number of puzzles to solve in parallel")
+@click.option(
+    "--enforce-goals", is_flag=True, is_eager=True, help="Apply the time budgets of the personal goals in the README"
+)
+@click.option(
+    "--time-budget",
+    "budgets",
+    multiple=True,
+    metavar="[YEAR=]SECONDS",
+    callback=_parse_time_budgets_option,
+    help="Kill puzzles which take longer than this, optionally only for a certain year",
+)
+@click.option("--self-check", is_flag=True, help="Verify the examples of the puzzles before solving them")
+@click.option(
+    "--impl", "implementation", type=click.Choice(IMPLEMENTATIONS), default=None, help="Force an implementation"
+)
+def main(
+    year: Optional[int],
+    day: Optional[int],
+    part: Optional[int],
+    jobs: int,
+    enforce_goals: bool,
+    budgets: TimeBudgets,
+    self_check: bool,
+    implementation: Optional[str],
+):
+    if year is not None and day is not None:
         # run the requested puzzle
-        run_parts(day)
+        parts = (1, 2) if part is None else (part,)
+        puzzles: List[Puzzle] = [(year, day, part) for part in parts]
+    else:
+        # run all the puzzles we have a solver for
+        puzzles = [
+            puzzle
+            for puzzle in list_puzzle_solvers(year)
+            if (day is None or puzzle[1] == day)
+            and (part is None or puzzle[2] == part)
+            and (implementation is None or implementation in list_puzzle_implementations(*puzzle))
+        ]
+
+    if self_check:
+        run_self_checks(puzzles)
+
+    if jobs == 1:
+        within_budget = [run_puzzle(*puzzle, budgets, implementation) for puzzle in puzzles]
+    else:
+        within_budget = run_puzzles_in_parallel(puzzles, jobs, budgets, implementation)
+
+    over_budget = within_budget.count(False)
+    if over_budget > 0:
+        raise click.ClickException(f"{over_budget} puzzle(s) exceeded their time budget")
 
 
 if __name__ == "__main__":
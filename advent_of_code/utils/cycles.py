@@ -0,0 +1,80 @@
+from typing import Callable, Hashable, List, NamedTuple, Optional, Tuple, TypeVar
+
+
+T = TypeVar("T")
+StepFunction = Callable[[T], T]
+KeyFunction = Callable[[T], Hashable]
+
+
+class Cycle(NamedTuple):
+    # index of the first state which is part of the cycle
+    start: int
+    # amount of steps after which the states repeat
+    length: int
+
+
+def _identity(state: T) -> T:
+    return state
+
+
+def detect_cycle(initial: T, step: StepFunction, key: Optional[KeyFunction] = None) -> Cycle:
+    # Brent's algorithm, only keeps two states in memory. States are compared through `key`.
+    if key is None:
+        key = _identity
+
+    # find the cycle length by looking for a repeat of the state at increasing powers of two
+    power = length = 1
+    tortoise = key(initial)
+    hare = step(initial)
+    while tortoise != key(hare):
+        if power == length:
+            tortoise = key(hare)
+            power *= 2
+            length = 0
+        hare = step(hare)
+        length += 1
+
+    # with the hare `length` steps ahead of the tortoise, they meet at the start of the cycle
+    tortoise = initial
+    hare = initial
+    for _ in range(length):
+        hare = step(hare)
+    start = 0
+    while key(tortoise) != key(hare):
+        tortoise = step(tortoise)
+        hare = step(hare)
+        start += 1
+
+    return Cycle(start=start, length=length)
+
+
+def record_cycle(
+    initial: T, step: StepFunction, key: Optional[KeyFunction] = None, max_steps: Optional[int] = None
+) -> Tuple[List[T], Optional[Cycle]]:
+    # Keeps a history of all states, indexed by their `key`, until a state repeats or `max_steps` steps were taken.
+    # The returned states start with `initial` and end with the repeated state, if a cycle was found.
+    if key is None:
+        key = _identity
+
+    states = [initial]
+    history = {key(initial): 0}
+    state = initial
+    while max_steps is None or len(states) <= max_steps:
+        state = step(state)
+        states.append(state)
+
+        state_key = key(state)
+        if state_key in history:
+            start = history[state_key]
+            return states, Cycle(start=start, length=len(states) - 1 - start)
+        history[state_key] = len(states) - 1
+
+    return states, None
+
+
+def fast_forward(initial: T, step: StepFunction, steps: int, key: Optional[KeyFunction] = None) -> T:
+    # returns the state after `steps` steps, skipping all full repetitions of a cycle
+    states, cycle = record_cycle(initial, step, key, max_steps=steps)
+    if cycle is None:
+        return states[steps]
+    return states[cycle.start + (steps - cycle.start) % cycle.length]
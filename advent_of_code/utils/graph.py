@@ -0,0 +1,95 @@
+import math
+
+from operator import add
+from typing import Dict, Hashable, List, Optional, Sequence, Tuple, TypeVar
+
+
+N = TypeVar("N", bound=Hashable)
+
+# distances[a][b] is the weight of the edge between nodes `a` and `b`, which are indexed from 0
+DistanceMatrix = Sequence[Sequence[int]]
+
+
+def build_distance_matrix(weights: Dict[Tuple[N, N], int]) -> Tuple[List[N], List[List[int]]]:
+    # converts a mapping of (from, to) pairs to a matrix, missing edges are treated as having no weight
+    nodes = sorted({node for edge in weights.keys() for node in edge})
+    return nodes, [[weights.get((a, b), 0) for b in nodes] for a in nodes]
+
+
+def find_optimal_route(distances: DistanceMatrix, maximize: bool = False, closed: bool = False) -> int:
+    # Held-Karp: the best route visiting a set of nodes and ending in a given node only depends on that set and node,
+    # not on the order the other nodes were visited in. This takes O(2^n * n^2) time instead of O(n!).
+    n = len(distances)
+    sign = -1 if maximize else 1
+    weights = [[sign * d for d in row] for row in distances]
+    if not closed:
+        # an open route is a closed route through an extra node which is connected to all others without any weight
+        for row in weights:
+            row.append(0)
+        weights.append([0] * (n + 1))
+        n += 1
+    if n <= 1:
+        return 0
+
+    # a closed route is the same regardless of where it starts, so it always starts (and ends) in the last node, which
+    # is left out of the masks below
+    start = n - 1
+    size = n - 1
+    # columns[node] are the weights of the edges from every other node towards `node`
+    columns = [[weights[other][node] for other in range(size)] for node in range(size)]
+
+    # best[mask][node] is the lowest weight of a path from the start through the nodes in `mask`, ending in `node`.
+    # Nodes outside of `mask` are infinite, so they can be included when taking the minimum over a whole row.
+    best: List[Optional[List[float]]] = [None] * (1 << size)
+    for node in range(size):
+        costs = [math.inf] * size
+        costs[node] = weights[start][node]
+        best[1 << node] = costs
+
+    # every mask only depends on smaller masks, so visiting them in increasing order is enough
+    for mask in range(3, 1 << size):
+        if not mask & (mask - 1):
+            continue
+        costs = [math.inf] * size
+        remaining = mask
+        while remaining:
+            bit = remaining & -remaining
+            remaining ^= bit
+            node = bit.bit_length() - 1
+            costs[node] = min(map(add, best[mask ^ bit], columns[node]))
+        best[mask] = costs
+
+    return sign * min(map(add, best[(1 << size) - 1], (row[start] for row in weights)))
+
+
+class DisjointSet(object):
+    # union-find over the integers 0..n-1, with path halving and union by size
+    __slots__ = ("parents", "sizes")
+
+    def __init__(self, size: int = 0):
+        self.parents = list(range(size))
+        self.sizes = [1] * size
+
+    def add(self) -> int:
+        node = len(self.parents)
+        self.parents.append(node)
+        self.sizes.append(1)
+        return node
+
+    def find(self, node: int) -> int:
+        parents = self.parents
+        while parents[node] != node:
+            parents[node] = parents[parents[node]]
+            node = parents[node]
+        return node
+
+    def union(self, a: int, b: int) -> bool:
+        # returns whether `a` and `b` were in different sets
+        a, b = self.find(a), self.find(b)
+        if a == b:
+            return False
+        if self.sizes[a] < self.sizes[b]:
+            a, b = b, a
+        self.parents[b] = a
+        self.sizes[a] += self.sizes[b]
+        return True
@@ -0,0 +1,48 @@
+from typing import Iterator, List, Sequence, Tuple
+
+from advent_of_code.utils.graph import DisjointSet
+
+
+# a run of set bits in a row, as (start, stop) bit positions with `stop` exclusive
+Run = Tuple[int, int]
+
+
+def iter_runs(row: int) -> Iterator[Run]:
+    # yields the runs of set bits in `row`, from the least significant bit upwards
+    while row:
+        lowest_bit = row & -row
+        # adding the lowest bit carries through the lowest run, which leaves just that run after masking
+        run = row & ~(row + lowest_bit)
+        yield lowest_bit.bit_length() - 1, run.bit_length()
+        row ^= run
+
+
+def label_regions(rows: Sequence[int]) -> List[List[Tuple[int, int, int]]]:
+    # Labels the regions of set bits which are connected horizontally or vertically, where every row is packed into
+    # an integer. Returns the (start, stop, label) runs of every row, runs in the same region share the same label.
+    regions = DisjointSet()
+    runs_per_row = []
+    previous_runs: List[Tuple[int, int, int]] = []
+    for row in rows:
+        runs = [(start, stop, regions.add()) for start, stop in iter_runs(row)]
+
+        # both lists are ordered, so walk them side by side to merge the overlapping runs
+        i = j = 0
+        while i < len(runs) and j < len(previous_runs):
+            start, stop, node = runs[i]
+            previous_start, previous_stop, previous_node = previous_runs[j]
+            if start < previous_stop and previous_start < stop:
+                regions.union(node, previous_node)
+            if stop < previous_stop:
+                i += 1
+            else:
+                j += 1
+
+        runs_per_row.append(runs)
+        previous_runs = runs
+
+    return [[(start, stop, regions.find(node)) for start, stop, node in runs] for runs in runs_per_row]
+
+
+def count_regions(rows: Sequence[int]) -> int:
+    return len({label for runs in label_regions(rows) for _, _, label in runs})
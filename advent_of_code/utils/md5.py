@@ -0,0 +1,63 @@
+from collections import deque
+from hashlib import md5
+from typing import Iterator, List, Optional, Tuple
+
+from advent_of_code.utils.parallel import create_executor, default_jobs
+
+
+# amount of indices a worker hashes per task, large enough to amortize the IPC overhead
+CHUNK_SIZE = 50_000
+
+
+def _search_chunk(prefix: str, leading_zeroes: int, start: int, stop: int) -> List[Tuple[int, bytes]]:
+    # hash the fixed prefix once and only feed the index into a copy of that state
+    base = md5(prefix.encode())
+    # a hex digit is a nibble, so check whole zero bytes and the high nibble of the next byte if the count is odd
+    zero_bytes = bytes(leading_zeroes // 2)
+    limit = 0x10 if leading_zeroes % 2 else 0x100
+    length = len(zero_bytes)
+
+    hits = []
+    for idx in range(start, stop):
+        h = base.copy()
+        h.update(str(idx).encode())
+        digest = h.digest()
+        if digest.startswith(zero_bytes) and digest[length] < limit:
+            hits.append((idx, digest))
+    return hits
+
+
+def find_hashes(
+    prefix: str, leading_zeroes: int, start: int = 0, jobs: Optional[int] = None
+) -> Iterator[Tuple[int, bytes]]:
+    # yields (index, digest) for every md5(f"{prefix}{index}") starting with `leading_zeroes` zero hex digits, in
+    # increasing index order
+    if jobs is None:
+        jobs = default_jobs()
+
+    if jobs <= 1:
+        while True:
+            yield from _search_chunk(prefix, leading_zeroes, start, start + CHUNK_SIZE)
+            start += CHUNK_SIZE
+
+    with create_executor(jobs) as executor:
+        # keep every worker busy while consuming the chunks in order
+        pending = deque()
+        try:
+            while True:
+                while len(pending) < 2 * jobs:
+                    pending.append(executor.submit(_search_chunk, prefix, leading_zeroes, start, start + CHUNK_SIZE))
+                    start += CHUNK_SIZE
+                yield from pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def find_hash(prefix: str, leading_zeroes: int, start: int = 0, jobs: Optional[int] = None) -> int:
+    gen = find_hashes(prefix, leading_zeroes, start, jobs)
+    try:
+        idx, _ = next(gen)
+    finally:
+        gen.close()
+    return idx
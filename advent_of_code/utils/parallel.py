@@ -0,0 +1,153 @@
+import multiprocessing
+import os
+
+from concurrent.futures import Executor, ProcessPoolExecutor, as_completed
+from typing import Callable, Iterable, List, Optional, Tuple, TypeVar
+
+
+T = TypeVar("T")
+U = TypeVar("U")
+
+# (highest failing candidate, (lowest succeeding candidate, its result))
+_Evaluation = Tuple[Optional[int], Optional[Tuple[int, T]]]
+
+
+# the amount of jobs the helpers below use by default, `None` uses every CPU
+_job_budget: Optional[int] = None
+
+
+def set_job_budget(jobs: Optional[int]):
+    global _job_budget
+    _job_budget = jobs
+
+
+def default_jobs() -> int:
+    if _job_budget is not None:
+        return _job_budget
+    # daemonic processes (e.g. puzzles running under a time budget) are not allowed to spawn workers
+    if multiprocessing.current_process().daemon:
+        return 1
+    return os.cpu_count() or 1
+
+
+def create_executor(jobs: int, worker_jobs: int = 1) -> ProcessPoolExecutor:
+    # the workers of a pool already occupy the CPUs, so they get a budget of `worker_jobs` for any pools of their own
+    return ProcessPoolExecutor(max_workers=jobs, initializer=set_job_budget, initargs=(worker_jobs,))
+
+
+def parallel_map(fn: Callable[[T], U], items: Iterable[T], jobs: Optional[int] = None) -> List[U]:
+    # like `map`, but spread over a process pool when more than one job is available
+    if jobs is None:
+        jobs = default_jobs()
+
+    if jobs <= 1:
+        return list(map(fn, items))
+
+    items = list(items)
+    with create_executor(jobs) as executor:
+        return list(executor.map(fn, items, chunksize=max(1, len(items) // (4 * jobs))))
+
+
+def scan_for_first_success(fn: Callable[[int], Optional[T]], start: int, jobs: Optional[int] = None) -> Tuple[int, T]:
+    # finds the lowest candidate >= `start` for which `fn` returns a result (anything but `None`), by trying every
+    # candidate in increasing order. Unlike `find_first_success` this makes no assumption about the candidates above
+    # the first success, `jobs` consecutive candidates are tried at once.
+    if jobs is None:
+        jobs = default_jobs()
+
+    if jobs <= 1:
+        candidate = start
+        while True:
+            result = fn(candidate)
+            if result is not None:
+                return candidate, result
+            candidate += 1
+
+    with create_executor(jobs) as executor:
+        while True:
+            candidates = range(start, start + jobs)
+            for candidate, result in zip(candidates, executor.map(fn, candidates)):
+                if result is not None:
+                    return candidate, result
+            start += jobs
+
+
+def _evaluate_sequentially(fn: Callable[[int], Optional[T]], candidates: Iterable[int]) -> _Evaluation:
+    highest_failure = None
+    for candidate in sorted(candidates):
+        result = fn(candidate)
+        if result is not None:
+            return highest_failure, (candidate, result)
+        highest_failure = candidate
+    return highest_failure, None
+
+
+def _evaluate_in_parallel(
+    executor: Executor, fn: Callable[[int], Optional[T]], candidates: Iterable[int]
+) -> _Evaluation:
+    futures = {executor.submit(fn, candidate): candidate for candidate in candidates}
+    lowest_success = None
+    for future in as_completed(futures):
+        if future.cancelled():
+            continue
+
+        candidate = futures[future]
+        result = future.result()
+        if result is not None and (lowest_success is None or candidate < lowest_success[0]):
+            lowest_success = (candidate, result)
+            # higher candidates are no longer relevant, cancel those which didn't start yet
+            for other_future, other_candidate in futures.items():
+                if other_candidate > candidate:
+                    other_future.cancel()
+
+    highest_failure = max(
+        (
+            candidate
+            for future, candidate in futures.items()
+            if not future.cancelled()
+            and future.result() is None
+            and (lowest_success is None or candidate < lowest_success[0])
+        ),
+        default=None,
+    )
+    return highest_failure, lowest_success
+
+
+def find_first_success(fn: Callable[[int], Optional[T]], start: int, jobs: Optional[int] = None) -> Tuple[int, T]:
+    # finds the lowest candidate >= `start` for which `fn` returns a result (anything but `None`), assuming that every
+    # candidate above it succeeds as well. Every round evaluates `jobs` candidates at once: first galloping upwards to
+    # bracket the threshold, then splitting the bracket in `jobs + 1` parts. With a single job, this is a plain
+    # exponential search followed by a binary search.
+    if jobs is None:
+        jobs = default_jobs()
+
+    executor = create_executor(jobs) if jobs > 1 else None
+    try:
+
+        def evaluate(candidates: Iterable[int]) -> _Evaluation:
+            if executor is None:
+                return _evaluate_sequentially(fn, candidates)
+            return _evaluate_in_parallel(executor, fn, candidates)
+
+        lower = start - 1
+        success = None
+        step = 1
+        while success is None:
+            failure, success = evaluate(lower + step * k for k in range(1, jobs + 1))
+            if failure is not None:
+                lower = failure
+            step *= jobs + 1
+
+        while success[0] - lower > 1:
+            gap = success[0] - lower
+            candidates = {lower + gap * k // (jobs + 1) for k in range(1, jobs + 1)} - {lower}
+            failure, new_success = evaluate(candidates)
+            if failure is not None:
+                lower = failure
+            if new_success is not None:
+                success = new_success
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    return success
@@ -0,0 +1,105 @@
+from typing import Callable, Iterator, List, Optional, Sequence, Tuple
+
+
+# all functions below expect positive values
+
+
+def _find_subset_indices(values: Sequence[int], total: int, size: Optional[int]) -> Iterator[Tuple[int, ...]]:
+    # branch and bound over `values`, which have to be sorted in descending order. Yields the indices of every subset
+    # summing to `total` (with exactly `size` items, if given) in lexicographic order of the indices.
+    n = len(values)
+    # prefix[i] is the sum of values[:i]
+    prefix = [0]
+    for value in values:
+        prefix.append(prefix[-1] + value)
+
+    chosen = []
+
+    def search(start: int, remaining_total: int, remaining_size: Optional[int]) -> Iterator[Tuple[int, ...]]:
+        if remaining_total == 0 and not remaining_size:
+            yield tuple(chosen)
+            return
+        elif remaining_total <= 0 or remaining_size == 0:
+            return
+
+        if remaining_size is not None:
+            # even the smallest remaining values are too big
+            if n - start < remaining_size or prefix[n] - prefix[n - remaining_size] > remaining_total:
+                return
+
+        for idx in range(start, n):
+            value = values[idx]
+            if value > remaining_total:
+                continue
+
+            # the values are descending, so later indices only reach smaller totals
+            if remaining_size is None:
+                if prefix[n] - prefix[idx] < remaining_total:
+                    break
+            elif n - idx < remaining_size or prefix[idx + remaining_size] - prefix[idx] < remaining_total:
+                break
+
+            chosen.append(idx)
+            yield from search(idx + 1, remaining_total - value, None if remaining_size is None else remaining_size - 1)
+            chosen.pop()
+
+    return search(0, total, size)
+
+
+def _without(values: Sequence[int], indices: Tuple[int, ...]) -> List[int]:
+    excluded = set(indices)
+    return [value for idx, value in enumerate(values) if idx not in excluded]
+
+
+def _can_partition(values: Sequence[int], total: int, groups: int) -> bool:
+    # `values` are sorted in descending order and sum to `groups * total`
+    if groups <= 1:
+        return True
+
+    # the largest value has to end up in some group, fixing it avoids trying the same partition in every group order
+    others = values[1:]
+    for indices in _find_subset_indices(others, total - values[0], None):
+        if _can_partition(_without(others, indices), total, groups - 1):
+            return True
+    return False
+
+
+def find_balanced_groups(
+    values: Sequence[int], groups: int, key: Optional[Callable[[Tuple[int, ...]], int]] = None
+) -> Iterator[Tuple[int, ...]]:
+    # lazily yields every group of values which can be the first of `groups` groups with equal sums, the remaining
+    # values can always be split in the other groups. Groups are ordered by size, then by `key`.
+    total, remainder = divmod(sum(values), groups)
+    if remainder != 0:
+        return
+
+    ordered = sorted(values, reverse=True)
+    for size in range(1, len(ordered) + 1):
+        # equal values make for equal groups, only keep one of those
+        candidates = list(
+            dict.fromkeys(
+                tuple(ordered[idx] for idx in indices) for indices in _find_subset_indices(ordered, total, size)
+            )
+        )
+        if key is not None:
+            candidates.sort(key=key)
+
+        for candidate in candidates:
+            remaining = list(ordered)
+            for value in candidate:
+                remaining.remove(value)
+            if _can_partition(remaining, total, groups - 1):
+                yield candidate
+
+
+def count_subsets_by_size(values: Sequence[int], total: int) -> List[int]:
+    # counts[size] is the amount of subsets with `size` values summing to `total`, using a 0/1 knapsack counting DP
+    counts = [[0] * (total + 1) for _ in range(len(values) + 1)]
+    counts[0][0] = 1
+    for number_of_values, value in enumerate(values, start=1):
+        # iterate downwards, so every value is used at most once
+        for size in range(number_of_values, 0, -1):
+            previous, current = counts[size - 1], counts[size]
+            for subtotal in range(total, value - 1, -1):
+                current[subtotal] += previous[subtotal - value]
+    return [row[total] for row in counts]
@@ -10,16 +10,17 @@ def calculate(text: str) -> int:
     return floor
 
 
-testcases = {
-    "(())": 0,
-    "()()": 0,
-    "(((": 3,
-    "(()(()(": 3,
-    "))(((((": 3,
-    "())": -1,
-    "))(": -1,
-    ")))": -3,
-    ")())())": -3,
-}
-for input, expected in testcases.items():
-    assert calculate(input) == expected
+def self_check():
+    testcases = {
+        "(())": 0,
+        "()()": 0,
+        "(((": 3,
+        "(()(()(": 3,
+        "))(((((": 3,
+        "())": -1,
+        "))(": -1,
+        ")))": -3,
+        ")())())": -3,
+    }
+    for input, expected in testcases.items():
+        assert calculate(input) == expected
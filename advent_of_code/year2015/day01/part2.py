@@ -12,9 +12,10 @@ def calculate(text: str) -> int:
             return index + 1
 
 
-testcases = {
-    ")": 1,
-    "()())": 5,
-}
-for input, expected in testcases.items():
-    assert calculate(input) == expected
+def self_check():
+    testcases = {
+        ")": 1,
+        "()())": 5,
+    }
+    for input, expected in testcases.items():
+        assert calculate(input) == expected
@@ -3,5 +3,6 @@ def calculate(text: str) -> int:
     return sum(2 * l * w + 2 * w * h + 2 * h * l + min(l * w, w * h, h * l) for l, w, h in dimensions)
 
 
-assert calculate("2x3x4") == 58
-assert calculate("1x1x10") == 43
+def self_check():
+    assert calculate("2x3x4") == 58
+    assert calculate("1x1x10") == 43
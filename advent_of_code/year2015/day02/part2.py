@@ -8,5 +8,6 @@ def calculate(text: str) -> int:
     return sum(solve(l, w, h) for l, w, h in dimensions)
 
 
-assert calculate("2x3x4") == 34
-assert calculate("1x1x10") == 14
+def self_check():
+    assert calculate("2x3x4") == 34
+    assert calculate("1x1x10") == 14
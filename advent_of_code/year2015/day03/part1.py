@@ -17,6 +17,7 @@ def calculate(text: str) -> int:
     return len(houses_visited)
 
 
-assert calculate(">") == 2
-assert calculate("^>v<") == 4
-assert calculate("^v^v^v^v^v") == 2
+def self_check():
+    assert calculate(">") == 2
+    assert calculate("^>v<") == 4
+    assert calculate("^v^v^v^v^v") == 2
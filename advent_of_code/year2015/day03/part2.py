@@ -24,6 +24,7 @@ def calculate(text: str) -> int:
     return len(houses_visited)
 
 
-assert calculate("^v") == 3
-assert calculate("^>v<") == 3
-assert calculate("^v^v^v^v^v") == 11
+def self_check():
+    assert calculate("^v") == 3
+    assert calculate("^>v<") == 3
+    assert calculate("^v^v^v^v^v") == 11
@@ -5,5 +5,6 @@ def calculate(text: str) -> int:
     return find_index(text, 5)
 
 
-assert calculate("abcdef") == 609043
-assert calculate("pqrstuv") == 1048970
+def self_check():
+    assert calculate("abcdef") == 609043
+    assert calculate("pqrstuv") == 1048970
@@ -1,11 +1,5 @@
-from hashlib import md5
+from advent_of_code.utils.md5 import find_hash
 
 
 def find_index(text: str, number_of_leading_zeroes: int) -> int:
-    idx = 0
-    prefix = "0" * number_of_leading_zeroes
-    while True:
-        hash = md5(f"{text}{idx}".encode("utf8")).hexdigest()
-        if hash.startswith(prefix):
-            return idx
-        idx += 1
+    return find_hash(text, number_of_leading_zeroes)
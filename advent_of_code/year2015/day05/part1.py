@@ -16,8 +16,9 @@ def calculate(text: str) -> int:
     return sum(1 if is_nice(line) else 0 for line in text.splitlines())
 
 
-assert calculate("ugknbfddgicrmopn") == 1
-assert calculate("aaa") == 1
-assert calculate("jchzalrnumimnmhp") == 0
-assert calculate("haegwjzuvuyypxyu") == 0
-assert calculate("dvszwmarrgswjxmb") == 0
+def self_check():
+    assert calculate("ugknbfddgicrmopn") == 1
+    assert calculate("aaa") == 1
+    assert calculate("jchzalrnumimnmhp") == 0
+    assert calculate("haegwjzuvuyypxyu") == 0
+    assert calculate("dvszwmarrgswjxmb") == 0
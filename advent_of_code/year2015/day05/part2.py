@@ -15,7 +15,8 @@ def calculate(text: str) -> int:
     return sum(1 if is_nice(line) else 0 for line in text.splitlines())
 
 
-assert calculate("qjhvhtzxzqqjkmpb") == 1
-assert calculate("xxyxx") == 1
-assert calculate("uurcxstgmygtbstg") == 0
-assert calculate("ieodomkazucvgmuy") == 0
+def self_check():
+    assert calculate("qjhvhtzxzqqjkmpb") == 1
+    assert calculate("xxyxx") == 1
+    assert calculate("uurcxstgmygtbstg") == 0
+    assert calculate("ieodomkazucvgmuy") == 0
@@ -1,7 +1,9 @@
+from typing import Callable
+
 from .shared import execute_light_configuration, parse_lines
 
 
-def action_parser(action: str) -> callable:
+def action_parser(action: str) -> Callable:
     if action == "turn on":
         return lambda val: val + 1
     elif action == "turn off":
@@ -14,8 +16,8 @@ def action_parser(action: str) -> callable:
 
 def calculate(text: str) -> int:
     lines = parse_lines(text.splitlines())
-    light_configuration = execute_light_configuration(lines, 0, action_parser)
-    return sum(x for row in light_configuration for x in row)
+    return execute_light_configuration(lines, 0, action_parser)
 
 
-assert calculate("toggle 0,0 through 999,999") == 2_000_000
+def self_check():
+    assert calculate("toggle 0,0 through 999,999") == 2_000_000
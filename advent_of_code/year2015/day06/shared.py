@@ -1,6 +1,6 @@
 import re
 
-from typing import Iterable, NamedTuple, Tuple
+from typing import Callable, Iterable, List, NamedTuple, Tuple
 
 
 RE_LIGHT = re.compile(r"^(turn on|turn off|toggle) (\d+),(\d+) through (\d+),(\d+)$")
@@ -25,11 +25,47 @@ def parse_lines(lines: Iterable[str]) -> Iterable[Line]:
         )
 
 
-def execute_light_configuration(lines: Iterable[Line], default_val, action_parser: callable):
-    configuration = list([default_val] * MAX_SIZE for _ in range(MAX_SIZE))
+def _compress(boundaries: Iterable[int]) -> List[int]:
+    return sorted(set(boundaries) | {0, MAX_SIZE})
+
+
+def execute_light_configuration(lines: Iterable[Line], default_val: int, action_parser: Callable) -> int:
+    # Returns the sum of all lights. Only the rectangle edges of the instructions matter, so the grid is compressed to
+    # the cells between those edges, where every cell stands for all the lights it covers.
+    lines = tuple(lines)
+    xs = _compress(x for line in lines for x in (line.start[0], line.stop[0] + 1))
+    ys = _compress(y for line in lines for y in (line.start[1], line.stop[1] + 1))
+    x_index = {x: idx for idx, x in enumerate(xs)}
+    y_index = {y: idx for idx, y in enumerate(ys)}
+
+    # the values a light can take are bounded by the amount of instructions, so every action becomes a lookup table
+    ops = {}
+    max_val = default_val
     for line in lines:
-        op = action_parser(line.action)
-        for x in range(line.start[0], line.stop[0] + 1):
-            for y in range(line.start[1], line.stop[1] + 1):
-                configuration[x][y] = op(configuration[x][y])
-    return configuration
+        if line.action not in ops:
+            ops[line.action] = action_parser(line.action)
+        max_val = max(max_val, max(ops[line.action](val) for val in range(max_val + 1)))
+    tables = {action: [int(op(val)) for val in range(max_val + 1)] for action, op in ops.items()}
+
+    # configuration[x][y] is the value of the cell at compressed coordinates (x, y). When all values fit in a byte, the
+    # rows are bytearrays which are updated a whole slice at a time by `bytes.translate`.
+    use_bytes = max_val < 256
+    row_type = bytearray if use_bytes else list
+    configuration = [row_type([int(default_val)]) * (len(ys) - 1) for _ in range(len(xs) - 1)]
+    if use_bytes:
+        tables = {action: bytes(table).ljust(256, b"\0") for action, table in tables.items()}
+
+    for line in lines:
+        table = tables[line.action]
+        y_start, y_stop = y_index[line.start[1]], y_index[line.stop[1] + 1]
+        for x in range(x_index[line.start[0]], x_index[line.stop[0] + 1]):
+            row = configuration[x]
+            if use_bytes:
+                row[y_start:y_stop] = row[y_start:y_stop].translate(table)
+            else:
+                row[y_start:y_stop] = map(table.__getitem__, row[y_start:y_stop])
+
+    heights = [b - a for a, b in zip(ys, ys[1:])]
+    return sum(
+        (b - a) * sum(val * height for val, height in zip(row, heights)) for a, b, row in zip(xs, xs[1:], configuration)
+    )
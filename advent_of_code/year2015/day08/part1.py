@@ -7,10 +7,11 @@ def calculate(text: str) -> int:
     return s
 
 
-puzzle = r"""
+def self_check():
+    puzzle = r"""
 ""
 "abc"
 "aaa\"aaa"
 "\x27"
 """.strip()
-assert calculate(puzzle) == 12
+    assert calculate(puzzle) == 12
@@ -19,15 +19,16 @@ def calculate(text: str) -> int:
     return s
 
 
-assert escape(r'""') == r'"\"\""'
-assert escape(r'"abc"') == r'"\"abc\""'
-assert escape(r'"aaa\"aaa"') == r'"\"aaa\\\"aaa\""'
-assert escape(r'"\x27"') == r'"\"\\x27\""'
+def self_check():
+    assert escape(r'""') == r'"\"\""'
+    assert escape(r'"abc"') == r'"\"abc\""'
+    assert escape(r'"aaa\"aaa"') == r'"\"aaa\\\"aaa\""'
+    assert escape(r'"\x27"') == r'"\"\\x27\""'
 
-puzzle = r"""
+    puzzle = r"""
 ""
 "abc"
 "aaa\"aaa"
 "\x27"
 """.strip()
-assert calculate(puzzle) == 19
+    assert calculate(puzzle) == 19
@@ -1,14 +1,17 @@
-from .shared import find_possible_routes, parse_lines
+from advent_of_code.utils.graph import build_distance_matrix, find_optimal_route
+
+from .shared import parse_lines
 
 
 def calculate(text: str) -> int:
-    distances = parse_lines(text)
-    return max(distance for route, distance in find_possible_routes(distances))
+    _, distances = build_distance_matrix(parse_lines(text))
+    return find_optimal_route(distances, maximize=True)
 
 
-puzzle = """
+def self_check():
+    puzzle = """
 London to Dublin = 464
 London to Belfast = 518
 Dublin to Belfast = 141
 """.strip()
-assert calculate(puzzle) == 982
+    assert calculate(puzzle) == 982
@@ -1,6 +1,5 @@
 import re
 
-from itertools import permutations
 from typing import Dict, Tuple
 
 
@@ -21,11 +20,3 @@ def parse_lines(text: str) -> Distances:
         distances[(a, b)] = dist
         distances[(b, a)] = dist
     return distances
-
-
-def find_possible_routes(distances: Distances):
-    possible_destinations = set(a for a, b in distances.keys()) | set(b for a, b in distances.keys())
-    for combination in permutations(possible_destinations, len(possible_destinations)):
-        route_paths = tuple(zip(combination, combination[1:]))
-        distance = sum(distances[route] for route in route_paths)
-        yield combination, distance
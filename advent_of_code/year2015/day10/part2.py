@@ -1,7 +1,5 @@
-from .shared import look_and_say
+from .shared import look_and_say_length
 
 
 def calculate(text: str) -> int:
-    for _ in range(50):
-        text = look_and_say(text)
-    return len(text)
+    return look_and_say_length(text, 50)
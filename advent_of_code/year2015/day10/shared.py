@@ -1,20 +1,92 @@
+import re
+
+from collections import Counter
+from functools import lru_cache
+from typing import FrozenSet, List, Optional
+
+
+RE_RUN = re.compile(rb"(\d)\1*")
+
+# amount of leading digits tracked when predicting how the start of a sequence evolves
+WINDOW_SIZE = 16
+
+
+@lru_cache(maxsize=None)
+def _say_run(run: bytes) -> bytes:
+    return b"%d%c" % (len(run), run[0])
+
+
+def _look_and_say(digits: bytes) -> bytes:
+    return RE_RUN.sub(lambda m: _say_run(m.group()), digits)
+
+
 def look_and_say(text: str) -> str:
-    i = 0
-    out = ""
-    while i < len(text):
-        char = text[i]
-        counter = 1
-        while i + 1 < len(text) and text[i + 1] == char:
-            counter += 1
-            i += 1
-        out += f"{counter}{char}"
-        i += 1
-    return out
-
-
-assert look_and_say("211") == "1221"
-assert look_and_say("1") == "11"
-assert look_and_say("11") == "21"
-assert look_and_say("21") == "1211"
-assert look_and_say("1211") == "111221"
-assert look_and_say("111221") == "312211"
+    return _look_and_say(text.encode()).decode()
+
+
+@lru_cache(maxsize=None)
+def _future_first_digits(window: bytes, is_complete: bool) -> Optional[FrozenSet[int]]:
+    # all digits a sequence will ever start with, given its leading digits (or the whole sequence, if complete).
+    # Returns `None` when this can't be determined from the window alone.
+    first_digits = set()
+    seen = set()
+    while (window, is_complete) not in seen:
+        seen.add((window, is_complete))
+        first_digits.add(window[0])
+
+        window = _look_and_say(window)
+        if not is_complete:
+            # the last run in the window might continue beyond it, so its count isn't known yet
+            window = window[:-2]
+        if len(window) == 0:
+            return None
+        elif len(window) > WINDOW_SIZE:
+            window = window[:WINDOW_SIZE]
+            is_complete = False
+
+    return frozenset(first_digits)
+
+
+@lru_cache(maxsize=None)
+def split_elements(digits: bytes) -> List[bytes]:
+    # Splits a sequence in parts that evolve independently of each other, forever. Every iteration keeps the last digit
+    # of a part and the boundary only merges two runs when that digit equals the first digit of the next part, so a
+    # boundary is safe when the next part never starts with it. The resulting parts are Conway's "elements".
+    elements = []
+    start = 0
+    for idx in range(1, len(digits)):
+        if digits[idx - 1] == digits[idx]:
+            continue
+
+        first_digits = _future_first_digits(digits[idx : idx + WINDOW_SIZE], len(digits) - idx <= WINDOW_SIZE)
+        if first_digits is not None and digits[idx - 1] not in first_digits:
+            elements.append(digits[start:idx])
+            start = idx
+    elements.append(digits[start:])
+    return elements
+
+
+@lru_cache(maxsize=None)
+def _decay(element: bytes) -> List[bytes]:
+    return split_elements(_look_and_say(element))
+
+
+def look_and_say_length(text: str, iterations: int) -> int:
+    # only tracks how many times every element occurs, so the sequence itself is never built
+    elements = Counter(split_elements(text.encode()))
+    for _ in range(iterations):
+        new_elements = Counter()
+        for element, count in elements.items():
+            for decayed_element in _decay(element):
+                new_elements[decayed_element] += count
+        elements = new_elements
+    return sum(len(element) * count for element, count in elements.items())
+
+
+def self_check():
+    assert look_and_say("211") == "1221"
+    assert look_and_say("1") == "11"
+    assert look_and_say("11") == "21"
+    assert look_and_say("21") == "1211"
+    assert look_and_say("1211") == "111221"
+    assert look_and_say("111221") == "312211"
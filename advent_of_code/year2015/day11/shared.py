@@ -19,16 +19,6 @@ def from_base26(text: str) -> int:
     return number
 
 
-assert to_base26(10) == "k"
-assert to_base26(26) == "ba"
-assert from_base26("a") == 0
-assert from_base26("z") == 25
-assert from_base26("ab") == 1
-assert from_base26("ba") == 26
-assert from_base26(to_base26(115)) == 115
-assert to_base26(from_base26("santa")) == "santa"
-
-
 def create_santa_passwords(start: str = "a") -> Iterator[str]:
     n = from_base26(start)
     while True:
@@ -81,3 +71,14 @@ def find_next_valid_password(password: str) -> str:
         if is_valid_password(password):
             return password
         n += 1
+
+
+def self_check():
+    assert to_base26(10) == "k"
+    assert to_base26(26) == "ba"
+    assert from_base26("a") == 0
+    assert from_base26("z") == 25
+    assert from_base26("ab") == 1
+    assert from_base26("ba") == 26
+    assert from_base26(to_base26(115)) == 115
+    assert to_base26(from_base26("santa")) == "santa"
@@ -19,11 +19,12 @@ def calculate(text: str) -> int:
     return walk(item)
 
 
-assert calculate("""[1,2,3]""") == 6
-assert calculate("""{"a":2,"b":4}""") == 6
-assert calculate("""[[[3]]]""") == 3
-assert calculate("""{"a":{"b":4},"c":-1}""") == 3
-assert calculate("""{"a":[-1,1]}""") == 0
-assert calculate("""[-1,{"a":1}]""") == 0
-assert calculate("""[]""") == 0
-assert calculate("""{}""") == 0
+def self_check():
+    assert calculate("""[1,2,3]""") == 6
+    assert calculate("""{"a":2,"b":4}""") == 6
+    assert calculate("""[[[3]]]""") == 3
+    assert calculate("""{"a":{"b":4},"c":-1}""") == 3
+    assert calculate("""{"a":[-1,1]}""") == 0
+    assert calculate("""[-1,{"a":1}]""") == 0
+    assert calculate("""[]""") == 0
+    assert calculate("""{}""") == 0
@@ -21,7 +21,8 @@ def calculate(text: str) -> int:
     return walk(item)
 
 
-assert calculate("""[1,2,3]""") == 6
-assert calculate("""[1,{"c":"red","b":2},3]""") == 4
-assert calculate("""{"d":"red","e":[1,2,3,4],"f":5}""") == 0
-assert calculate("""[1,"red",5]""") == 6
+def self_check():
+    assert calculate("""[1,2,3]""") == 6
+    assert calculate("""[1,{"c":"red","b":2},3]""") == 4
+    assert calculate("""{"d":"red","e":[1,2,3,4],"f":5}""") == 0
+    assert calculate("""[1,"red",5]""") == 6
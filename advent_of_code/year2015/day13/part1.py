@@ -5,7 +5,8 @@ def calculate(text: str) -> int:
     return find_maximum_happiness(parse_text(text))
 
 
-puzzle = """
+def self_check():
+    puzzle = """
 Alice would gain 54 happiness units by sitting next to Bob.
 Alice would lose 79 happiness units by sitting next to Carol.
 Alice would lose 2 happiness units by sitting next to David.
@@ -19,4 +20,4 @@ David would gain 46 happiness units by sitting next to Alice.
 David would lose 7 happiness units by sitting next to Bob.
 David would gain 41 happiness units by sitting next to Carol.
 """.strip()
-assert calculate(puzzle) == 330
+    assert calculate(puzzle) == 330
@@ -1,8 +1,9 @@
 import re
 
-from itertools import permutations
 from typing import Dict, Tuple
 
+from advent_of_code.utils.graph import build_distance_matrix, find_optimal_route
+
 
 RE_LINE = re.compile(r"^(\w+) would (gain|lose) (\d+) happiness units by sitting next to (\w+).$")
 Configuration = Dict[Tuple[str, str], int]
@@ -20,13 +21,8 @@ def parse_text(text: str) -> Configuration:
     return configuration
 
 
-def calculate_happiness(config: Configuration, combination: Tuple[str]) -> int:
-    combination = combination[:] + combination[:1]
-    return sum(config[(a, b)] + config[(b, a)] for a, b in zip(combination, combination[1:]))
-
-
 def find_maximum_happiness(config: Configuration) -> int:
-    unique_names = {x[0] for x in config.keys()}
-    return max(
-        calculate_happiness(config, permutation) for permutation in permutations(unique_names, len(unique_names))
-    )
+    # the happiness between two neighbours is what both of them gain from sitting next to each other
+    names, happiness = build_distance_matrix(config)
+    distances = [[happiness[a][b] + happiness[b][a] for b in range(len(names))] for a in range(len(names))]
+    return find_optimal_route(distances, maximize=True, closed=True)
@@ -6,9 +6,10 @@ def calculate(text: str) -> int:
     return calculate_score(reindeers, 2503)
 
 
-puzzle = """
+def self_check():
+    puzzle = """
 Comet can fly 14 km/s for 10 seconds, but then must rest for 127 seconds.
 Dancer can fly 16 km/s for 11 seconds, but then must rest for 162 seconds.
 """.strip()
-reindeers = parse_text(puzzle)
-assert calculate_score(reindeers, 1000) == 689
+    reindeers = parse_text(puzzle)
+    assert calculate_score(reindeers, 1000) == 689
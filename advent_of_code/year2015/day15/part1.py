@@ -15,8 +15,9 @@ def calculate(text: str) -> int:
     return max(calculate_score(recipy.values(), w) for w in possible_weights)
 
 
-puzzle = """
+def self_check():
+    puzzle = """
 Butterscotch: capacity -1, durability -2, flavor 6, texture 3, calories 8
 Cinnamon: capacity 2, durability 3, flavor -2, texture -1, calories 3
 """.strip()
-assert calculate(puzzle) == 62842880
+    assert calculate(puzzle) == 62842880
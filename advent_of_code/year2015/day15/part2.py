@@ -21,8 +21,9 @@ def calculate(text: str) -> int:
     return max(calculate_score(recipy_without_calories.values(), w) for w in possible_weights)
 
 
-puzzle = """
+def self_check():
+    puzzle = """
 Butterscotch: capacity -1, durability -2, flavor 6, texture 3, calories 8
 Cinnamon: capacity 2, durability 3, flavor -2, texture -1, calories 3
 """.strip()
-assert calculate(puzzle) == 57600000
+    assert calculate(puzzle) == 57600000
@@ -1,21 +1,19 @@
-from itertools import combinations
+from advent_of_code.utils.subsets import count_subsets_by_size
 
 from .shared import parse_text
 
 
 def calculate(text: str, total: int = 150) -> int:
-    containers = tuple(parse_text(text))
-    for container_count in range(1, len(containers) + 1):
-        count = sum(1 for c in combinations(containers, container_count) if sum(c) == total)
-        if count > 0:
-            return count
+    # the amount of ways to use the minimum amount of containers
+    return next(count for count in count_subsets_by_size(tuple(parse_text(text)), total)[1:] if count > 0)
 
 
-puzzle = """
+def self_check():
+    puzzle = """
 20
 15
 10
 5
 5
 """.strip()
-assert calculate(puzzle, 25) == 3
+    assert calculate(puzzle, 25) == 3
@@ -10,7 +10,8 @@ def calculate(text: str, number_of_steps: int = 100) -> int:
     return sum(chain.from_iterable(lights))
 
 
-puzzle = """
+def self_check():
+    puzzle = """
 .#.#.#
 ...##.
 #....#
@@ -18,4 +19,4 @@ puzzle = """
 #.#..#
 ####..
 """.strip()
-assert calculate(puzzle, number_of_steps=4) == 4
+    assert calculate(puzzle, number_of_steps=4) == 4
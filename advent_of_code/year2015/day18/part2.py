@@ -18,7 +18,8 @@ def calculate(text: str, number_of_steps: int = 100) -> int:
     return sum(chain.from_iterable(lights))
 
 
-puzzle = """
+def self_check():
+    puzzle = """
 ##.#.#
 ...##.
 #....#
@@ -26,4 +27,4 @@ puzzle = """
 #.#..#
 ####.#
 """.strip()
-assert calculate(puzzle, number_of_steps=5) == 17
+    assert calculate(puzzle, number_of_steps=5) == 17
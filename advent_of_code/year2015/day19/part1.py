@@ -7,20 +7,21 @@ def calculate(text: str) -> int:
     return len(possibilities)
 
 
-puzzle = """
+def self_check():
+    puzzle = """
 H => HO
 H => OH
 O => HH
 
 HOH
 """.strip()
-assert calculate(puzzle) == 4
+    assert calculate(puzzle) == 4
 
-puzzle = """
+    puzzle = """
 H => HO
 H => OH
 O => HH
 
 HOHOHO
 """.strip()
-assert calculate(puzzle) == 7
+    assert calculate(puzzle) == 7
@@ -6,7 +6,8 @@ def calculate(text: str) -> int:
     return find_fewest_steps(outcome, replacements)
 
 
-puzzle = """
+def self_check():
+    puzzle = """
 e => H
 e => O
 H => HO
@@ -15,9 +16,9 @@ O => HH
 
 HOH
 """.strip()
-assert calculate(puzzle) == 3
+    assert calculate(puzzle) == 3
 
-puzzle = """
+    puzzle = """
 e => H
 e => O
 H => HO
@@ -26,4 +27,4 @@ O => HH
 
 HOHOHO
 """.strip()
-assert calculate(puzzle) == 6
+    assert calculate(puzzle) == 6
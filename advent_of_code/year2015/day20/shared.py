@@ -0,0 +1,52 @@
+from array import array
+from itertools import repeat
+from operator import add
+from typing import Optional
+
+
+# amount of houses sieved at once, which bounds the memory use to a single array of this size
+CHUNK_SIZE = 1 << 17
+
+
+def find_first_house(min_number_of_presents: int, presents_per_elf: int, houses_per_elf: Optional[int] = None) -> int:
+    # every elf visits the houses which are a multiple of its number, so a house receives `presents_per_elf` times the
+    # sum of its (visiting) divisors. Elf `target` delivers enough presents to its first house on its own, so the
+    # answer is never beyond that house.
+    target = -(-min_number_of_presents // presents_per_elf)
+    for start in range(1, target + 1, CHUNK_SIZE):
+        stop = min(start + CHUNK_SIZE, target + 1)
+
+        # divisor sums of the houses in [start, stop)
+        sums = array("L", bytes(array("L").itemsize * (stop - start)))
+
+        # Small elves visit many houses of this chunk, add their presents a slice at a time. The other elves only visit
+        # a few of them: rather than going over all those elves, go over their n-th visits, which are n houses apart
+        # for consecutive elves. Splitting them at the square root keeps both loops short.
+        split = max(1, int((stop - 1) ** 0.5))
+        # with a limit on the visited houses, elves which stopped before this chunk are skipped
+        first_elf = 1 if houses_per_elf is None else max(1, -(-start // houses_per_elf))
+
+        for elf in range(first_elf, split):
+            # first house in this chunk visited by this elf
+            first_house = max(elf, -(-start // elf) * elf)
+            last_house = stop if houses_per_elf is None else min(stop, elf * houses_per_elf + 1)
+            if first_house >= last_house:
+                continue
+            visited = slice(first_house - start, last_house - start, elf)
+            sums[visited] = array("L", map(add, sums[visited], repeat(elf, len(range(first_house, last_house, elf)))))
+
+        max_visit = (stop - 1) // split
+        if houses_per_elf is not None:
+            max_visit = min(max_visit, houses_per_elf)
+        for visit in range(1, max_visit + 1):
+            elves = range(max(split, first_elf, -(-start // visit)), (stop - 1) // visit + 1)
+            if len(elves) == 0:
+                continue
+            visited = slice(elves.start * visit - start, elves.stop * visit - start, visit)
+            sums[visited] = array("L", map(add, sums[visited], elves))
+
+        for idx, total in enumerate(sums):
+            if total >= target:
+                return start + idx
+
+    raise ValueError(f"No house receives {min_number_of_presents} presents")
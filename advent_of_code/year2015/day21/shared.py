@@ -98,23 +98,6 @@ def calculate_winner(player: Character, enemy: Character) -> CharacterType:
             return type
 
 
-_enemy = parse_character(
-    """
-Hit Points: 12
-Damage: 7
-Armor: 2
-""".strip()
-)
-_player = parse_character(
-    """
-Hit Points: 8
-Damage: 5
-Armor: 5
-""".strip()
-)
-assert calculate_winner(_player, _enemy) == CharacterType.PLAYER
-
-
 def all_shop_combinations():
     possible_combinations = []
     for category in SHOP.categories:
@@ -139,3 +122,21 @@ def build_character_from_items(hit_points: int, items: Iterable[Item]) -> Tuple[
         Character(hit_points=hit_points, damage_score=damage_score, armor_score=armor_score),
         total_cost,
     )
+
+
+def self_check():
+    _enemy = parse_character(
+        """
+Hit Points: 12
+Damage: 7
+Armor: 2
+""".strip()
+    )
+    _player = parse_character(
+        """
+Hit Points: 8
+Damage: 5
+Armor: 5
+""".strip()
+    )
+    assert calculate_winner(_player, _enemy) == CharacterType.PLAYER
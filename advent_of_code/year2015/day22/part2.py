@@ -1,21 +1,8 @@
-from .shared import (
-    BattleState,
-    Character,
-    CharacterType,
-    DifficultyHardEffect,
-    find_win_for_lowest_spent_mana,
-    parse_character,
-)
+from .shared import BattleState, find_win_for_lowest_spent_mana, parse_character
 
 
 def calculate(text: str) -> int:
-    # create new state
-    state = BattleState(
-        player=Character(hit_points=50, damage_score=0, armor_score=0),
-        enemy=parse_character(text),
-        active_character=CharacterType.PLAYER,
-        player_mana=500,
-        active_effects=[DifficultyHardEffect()],
-    )
+    enemy = parse_character(text)
+    state = BattleState(player_hit_points=50, player_mana=500, enemy_hit_points=enemy.hit_points)
 
-    return find_win_for_lowest_spent_mana(state)
+    return find_win_for_lowest_spent_mana(state, enemy, hard_mode=True)
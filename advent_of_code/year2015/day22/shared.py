@@ -1,280 +1,182 @@
-import math
+from heapq import heappop, heappush
+from typing import NamedTuple, Optional
 
-from typing import List, NamedTuple, Optional, Type
+from ..day21.shared import Character, parse_character  # noqa: F401
 
-from ..day21.shared import Character, CharacterType, parse_character  # noqa: F401
 
+# a battle state is packed in a single integer, so it is cheap to hash and to store in the search queue. From the least
+# significant bits onwards: the shield, poison and recharge timers, the enemy's hit points, the player's hit points
+# and finally the player's mana, which is left unbounded
+TIMER_BITS = 3
+HIT_POINTS_BITS = 16
+TIMER_MASK = (1 << TIMER_BITS) - 1
+HIT_POINTS_MASK = (1 << HIT_POINTS_BITS) - 1
+SHIELD_SHIFT = 0
+POISON_SHIFT = SHIELD_SHIFT + TIMER_BITS
+RECHARGE_SHIFT = POISON_SHIFT + TIMER_BITS
+ENEMY_HIT_POINTS_SHIFT = RECHARGE_SHIFT + TIMER_BITS
+PLAYER_HIT_POINTS_SHIFT = ENEMY_HIT_POINTS_SHIFT + HIT_POINTS_BITS
+PLAYER_MANA_SHIFT = PLAYER_HIT_POINTS_SHIFT + HIT_POINTS_BITS
 
-class BattleState(NamedTuple):
-    player: Character
-    enemy: Character
-    active_character: CharacterType
-    player_mana: int
-    active_effects: List["_Effect"]
-
-    def winning_party(self) -> Optional[CharacterType]:
-        if self.player.hit_points <= 0:
-            return CharacterType.ENEMY
-        elif self.enemy.hit_points <= 0:
-            return CharacterType.PLAYER
-        else:
-            return None
-
-    def next_state(self, spell: Optional["_Spell"] = None) -> Optional["BattleState"]:
-        state = self
-
-        assert state.winning_party() is None
-
-        # apply effects' turn start
-        effects = state.active_effects
-        for effect in effects:
-            state = effect.turn_start(state)
-
-        # reduce effect timers for previously active effects
-        new_effects = [e.decremented_with(1) for e in effects]
-
-        # apply wear-off for effects that ended
-        for effect in new_effects:
-            if effect.timer == 0:
-                state = effect.effect_off(state)
-
-        # remove effects that have ended
-        new_effects = [e for e in new_effects if e.timer > 0]
-        state = state._replace(active_effects=new_effects)
-
-        if state.active_character == CharacterType.PLAYER and state.player.hit_points > 0:
-            assert spell is not None
-
-            # check if spell can be cast
-            if not spell.can_apply(state) or state.player_mana < spell.cost:
-                return None
-
-            # cast spell
-            state = state._replace(player_mana=state.player_mana - spell.cost)
-            state = spell.apply(state)
-        elif state.active_character == CharacterType.ENEMY and state.enemy.hit_points > 0:
-            assert spell is None
-
-            # deal damage
-            damage = max(state.enemy.damage_score - state.player.armor_score, 1)
-            new_player = state.player._replace(hit_points=state.player.hit_points - damage)
-            state = state._replace(player=new_player)
-
-        # flip active character
-        state = state._replace(active_character=state.active_character.opposite())
-
-        return state
-
-
-class _Effect(object):
-    duration: int
-
-    def __init__(self, timer: int = None):
-        self.timer = self.duration if timer is None else timer
-
-    def turn_start(self, state: BattleState) -> BattleState:
-        return state
-
-    def effect_on(self, state: BattleState) -> BattleState:
-        return state
-
-    def effect_off(self, state: BattleState) -> BattleState:
-        return state
-
-    @property
-    def name(self):
-        return self.__class__.__name__.replace("Effect", "")
-
-    def decremented_with(self, decrement: int) -> "_Effect":
-        return type(self)(self.timer - decrement)
-
-    def __repr__(self):
-        return f"{self.name}(timer={self.timer})"
-
-
-class ShieldEffect(_Effect):
-    duration = 6
-
-    def effect_on(self, state: BattleState):
-        new_player = state.player._replace(armor_score=state.player.armor_score + 7)
-        return state._replace(player=new_player)
-
-    def effect_off(self, state: BattleState):
-        new_player = state.player._replace(armor_score=state.player.armor_score - 7)
-        return state._replace(player=new_player)
-
-
-class PoisonEffect(_Effect):
-    duration = 6
-
-    def turn_start(self, state: BattleState):
-        new_enemy = state.enemy._replace(hit_points=state.enemy.hit_points - 3)
-        return state._replace(enemy=new_enemy)
-
-
-class RechargeEffect(_Effect):
-    duration = 5
-
-    def turn_start(self, state: BattleState):
-        return state._replace(player_mana=state.player_mana + 101)
-
-
-class DifficultyHardEffect(_Effect):
-    duration = math.inf
-
-    def turn_start(self, state: BattleState):
-        new_player = state.player._replace(hit_points=state.player.hit_points - 1)
-        return state._replace(player=new_player)
+# marks a won battle in the search queue, packed states are never negative
+WON = -1
 
 
-class _Spell(object):
+class BattleState(NamedTuple):
+    player_hit_points: int
+    player_mana: int
+    enemy_hit_points: int
+    shield_timer: int = 0
+    poison_timer: int = 0
+    recharge_timer: int = 0
+
+    def pack(self) -> int:
+        return (
+            self.shield_timer << SHIELD_SHIFT
+            | self.poison_timer << POISON_SHIFT
+            | self.recharge_timer << RECHARGE_SHIFT
+            | self.enemy_hit_points << ENEMY_HIT_POINTS_SHIFT
+            | self.player_hit_points << PLAYER_HIT_POINTS_SHIFT
+            | self.player_mana << PLAYER_MANA_SHIFT
+        )
+
+    @classmethod
+    def unpack(cls, state: int) -> "BattleState":
+        return cls(
+            player_hit_points=(state >> PLAYER_HIT_POINTS_SHIFT) & HIT_POINTS_MASK,
+            player_mana=state >> PLAYER_MANA_SHIFT,
+            enemy_hit_points=(state >> ENEMY_HIT_POINTS_SHIFT) & HIT_POINTS_MASK,
+            shield_timer=(state >> SHIELD_SHIFT) & TIMER_MASK,
+            poison_timer=(state >> POISON_SHIFT) & TIMER_MASK,
+            recharge_timer=(state >> RECHARGE_SHIFT) & TIMER_MASK,
+        )
+
+
+class Spell(NamedTuple):
+    name: str
     cost: int
+    damage: int = 0
+    heal: int = 0
+    shield_timer: int = 0
+    poison_timer: int = 0
+    recharge_timer: int = 0
 
-    def can_apply(self, state: BattleState) -> bool:
-        return True
-
-    def apply(self, state: BattleState):
-        raise NotImplementedError()
-
-    @property
-    def name(self):
-        return self.__class__.__name__.replace("Spell", "")
-
-    def __repr__(self):
-        return f"<{self.name}>"
-
-
-class MagicMissileSpell(_Spell):
-    cost = 53
-
-    def apply(self, state: BattleState):
-        new_enemy = state.enemy._replace(hit_points=state.enemy.hit_points - 4)
-        return state._replace(enemy=new_enemy)
-
-
-class DrainSpell(_Spell):
-    cost = 73
-
-    def apply(self, state: BattleState):
-        new_enemy = state.enemy._replace(hit_points=state.enemy.hit_points - 2)
-        new_player = state.player._replace(hit_points=state.player.hit_points + 2)
-        return state._replace(enemy=new_enemy, player=new_player)
-
-
-class _EffectSpell(_Spell):
-    def __init__(self, effect_type: Type[_Effect]):
-        self.effect_type = effect_type
-
-    def can_apply(self, state: BattleState):
-        active_effect_types = {type(e) for e in state.active_effects}
-        return self.effect_type not in active_effect_types
-
-    def apply(self, state: BattleState):
-        effect = self.effect_type()
-        state = effect.effect_on(state)
-        new_active_effects = state.active_effects + [effect]
-        return state._replace(active_effects=new_active_effects)
-
-
-class ShieldSpell(_EffectSpell):
-    cost = 113
-
-    def __init__(self):
-        super(ShieldSpell, self).__init__(ShieldEffect)
-
-
-class PoisonSpell(_EffectSpell):
-    cost = 173
-
-    def __init__(self):
-        super(PoisonSpell, self).__init__(PoisonEffect)
-
-
-class RechargeSpell(_EffectSpell):
-    cost = 229
-
-    def __init__(self):
-        super(RechargeSpell, self).__init__(RechargeEffect)
 
+SHIELD_ARMOR = 7
+POISON_DAMAGE = 3
+RECHARGE_MANA = 101
 
 SPELLS = (
-    MagicMissileSpell(),
-    DrainSpell(),
-    ShieldSpell(),
-    PoisonSpell(),
-    RechargeSpell(),
-)
-
-
-# tests
-_state = BattleState(
-    player=Character(hit_points=10, damage_score=0, armor_score=0),
-    enemy=Character(hit_points=13, damage_score=8, armor_score=0),
-    active_character=CharacterType.PLAYER,
-    player_mana=250,
-    active_effects=[],
+    Spell(name="Magic Missile", cost=53, damage=4),
+    Spell(name="Drain", cost=73, damage=2, heal=2),
+    Spell(name="Shield", cost=113, shield_timer=6),
+    Spell(name="Poison", cost=173, poison_timer=6),
+    Spell(name="Recharge", cost=229, recharge_timer=5),
 )
-_state = _state.next_state(spell=PoisonSpell())
-_state = _state.next_state()
-_state = _state.next_state(spell=MagicMissileSpell())
-_state = _state.next_state()
-assert _state.winning_party() == CharacterType.PLAYER
 
 
-_state = BattleState(
-    player=Character(hit_points=10, damage_score=0, armor_score=0),
-    enemy=Character(hit_points=14, damage_score=8, armor_score=0),
-    active_character=CharacterType.PLAYER,
-    player_mana=250,
-    active_effects=[],
-)
-_state = _state.next_state(spell=RechargeSpell())
-_state = _state.next_state()
-_state = _state.next_state(spell=ShieldSpell())
-_state = _state.next_state()
-_state = _state.next_state(spell=DrainSpell())
-_state = _state.next_state()
-_state = _state.next_state(spell=PoisonSpell())
-_state = _state.next_state()
-_state = _state.next_state(spell=MagicMissileSpell())
-_state = _state.next_state()
-assert _state.winning_party() == CharacterType.PLAYER
-
-
-SearchState = NamedTuple("SearchState", battle_state=BattleState, spent_mana=int)
-
-
-def find_win_for_lowest_spent_mana(initial_state: BattleState):
-    queue = [SearchState(battle_state=initial_state, spent_mana=0)]
-    lowest_mana_spent = None
+def find_win_for_lowest_spent_mana(
+    initial_state: BattleState, enemy: Character, hard_mode: bool = False
+) -> Optional[int]:
+    # Dijkstra on spent mana, every node is the state at the start of a player's turn. Equal states reached through
+    # different spell orders are only expanded once.
+    queue = [(0, initial_state.pack())]
+    seen = set()
 
     while len(queue) > 0:
-        current_state, current_spent_mana = queue.pop()
-        if lowest_mana_spent is not None and current_spent_mana > lowest_mana_spent:
-            # prune this branch
+        spent_mana, state = heappop(queue)
+        if state == WON:
+            return spent_mana
+        elif state in seen:
+            continue
+        seen.add(state)
+
+        player_hit_points = (state >> PLAYER_HIT_POINTS_SHIFT) & HIT_POINTS_MASK
+        player_mana = state >> PLAYER_MANA_SHIFT
+        enemy_hit_points = (state >> ENEMY_HIT_POINTS_SHIFT) & HIT_POINTS_MASK
+        shield_timer = (state >> SHIELD_SHIFT) & TIMER_MASK
+        poison_timer = (state >> POISON_SHIFT) & TIMER_MASK
+        recharge_timer = (state >> RECHARGE_SHIFT) & TIMER_MASK
+
+        # player's turn start
+        if hard_mode:
+            player_hit_points -= 1
+            if player_hit_points <= 0:
+                continue
+        if shield_timer:
+            shield_timer -= 1
+        if poison_timer:
+            enemy_hit_points -= POISON_DAMAGE
+            poison_timer -= 1
+        if recharge_timer:
+            player_mana += RECHARGE_MANA
+            recharge_timer -= 1
+        if enemy_hit_points <= 0:
+            heappush(queue, (spent_mana, WON))
             continue
 
-        while current_state.winning_party() is None:
-            if current_state.active_character == CharacterType.ENEMY:
-                current_state = current_state.next_state()
-            elif current_state.active_character == CharacterType.PLAYER:
-                for spell in SPELLS:
-                    new_state = current_state.next_state(spell=spell)
-                    if new_state is None or new_state.winning_party() == CharacterType.ENEMY:
-                        # spell can't be cast or it results in player death, skip it
-                        continue
-
-                    queue.append(
-                        SearchState(
-                            battle_state=new_state,
-                            spent_mana=current_spent_mana + spell.cost,
-                        )
-                    )
-                break
-
-        if current_state.winning_party() == CharacterType.PLAYER and (
-            lowest_mana_spent is None or current_spent_mana < lowest_mana_spent
-        ):
-            lowest_mana_spent = current_spent_mana
-
-    return lowest_mana_spent
+        for spell in SPELLS:
+            if spell.cost > player_mana:
+                continue
+            # effects can only be cast when they are not active
+            if (
+                (spell.shield_timer and shield_timer)
+                or (spell.poison_timer and poison_timer)
+                or (spell.recharge_timer and recharge_timer)
+            ):
+                continue
+
+            new_spent_mana = spent_mana + spell.cost
+            new_enemy_hit_points = enemy_hit_points - spell.damage
+            new_player_hit_points = player_hit_points + spell.heal
+            new_player_mana = player_mana - spell.cost
+            new_shield_timer = shield_timer or spell.shield_timer
+            new_poison_timer = poison_timer or spell.poison_timer
+            new_recharge_timer = recharge_timer or spell.recharge_timer
+            if new_enemy_hit_points <= 0:
+                heappush(queue, (new_spent_mana, WON))
+                continue
+
+            # enemy's turn start, the shield wears off as soon as its timer runs out
+            armor = 0
+            if new_shield_timer:
+                new_shield_timer -= 1
+                armor = SHIELD_ARMOR if new_shield_timer else 0
+            if new_poison_timer:
+                new_enemy_hit_points -= POISON_DAMAGE
+                new_poison_timer -= 1
+            if new_recharge_timer:
+                new_player_mana += RECHARGE_MANA
+                new_recharge_timer -= 1
+            if new_enemy_hit_points <= 0:
+                heappush(queue, (new_spent_mana, WON))
+                continue
+
+            # enemy attacks
+            new_player_hit_points -= max(enemy.damage_score - armor, 1)
+            if new_player_hit_points <= 0:
+                continue
+
+            new_state = (
+                new_shield_timer << SHIELD_SHIFT
+                | new_poison_timer << POISON_SHIFT
+                | new_recharge_timer << RECHARGE_SHIFT
+                | new_enemy_hit_points << ENEMY_HIT_POINTS_SHIFT
+                | new_player_hit_points << PLAYER_HIT_POINTS_SHIFT
+                | new_player_mana << PLAYER_MANA_SHIFT
+            )
+            if new_state not in seen:
+                heappush(queue, (new_spent_mana, new_state))
+
+    return None
+
+
+def self_check():
+    _state = BattleState(player_hit_points=10, player_mana=250, enemy_hit_points=13)
+    assert BattleState.unpack(_state.pack()) == _state
+    # Poison, Magic Missile
+    assert find_win_for_lowest_spent_mana(_state, Character(hit_points=13, damage_score=8, armor_score=0)) == 226
+
+    _state = BattleState(player_hit_points=10, player_mana=250, enemy_hit_points=14)
+    # Recharge, Shield, Drain, Poison, Magic Missile
+    assert find_win_for_lowest_spent_mana(_state, Character(hit_points=14, damage_score=8, armor_score=0)) == 641
@@ -1,23 +1,12 @@
-from itertools import combinations
-
-from .shared import parse_packages, quantum_entanglement
+from .shared import find_minimum_quantum_entanglement, parse_packages
 
 
 def calculate(text: str) -> int:
-    packages = tuple(parse_packages(text))
-    single_group_sum = sum(packages) // 3
-
-    # find the smallest group
-    for i in range(1, len(packages)):
-        first_group_combos = {x for x in combinations(packages, i) if sum(x) == single_group_sum}
-        if len(first_group_combos) > 0:
-            break
-
-    # return the minimum quantum entanglement of the possible combinations
-    return min(quantum_entanglement(c) for c in first_group_combos)
+    return find_minimum_quantum_entanglement(tuple(parse_packages(text)), groups=3)
 
 
-puzzle = """
+def self_check():
+    puzzle = """
 1
 2
 3
@@ -29,4 +18,4 @@ puzzle = """
 10
 11
 """.strip()
-assert calculate(puzzle) == 99
+    assert calculate(puzzle) == 99
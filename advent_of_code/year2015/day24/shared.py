@@ -1,5 +1,7 @@
 from functools import reduce
-from typing import Iterable
+from typing import Iterable, Sequence
+
+from advent_of_code.utils.subsets import find_balanced_groups
 
 
 def parse_packages(text: str) -> Iterable[int]:
@@ -8,3 +10,9 @@ def parse_packages(text: str) -> Iterable[int]:
 
 def quantum_entanglement(packages: Iterable[int]) -> int:
     return reduce(lambda a, b: a * b, packages)
+
+
+def find_minimum_quantum_entanglement(packages: Sequence[int], groups: int) -> int:
+    # the smallest first group with the lowest quantum entanglement, for which the other packages can be balanced too
+    first_group = next(find_balanced_groups(packages, groups, key=quantum_entanglement))
+    return quantum_entanglement(first_group)
@@ -35,13 +35,16 @@ def calculate(puzzle: str) -> int:
             return code
 
 
-assert (
-    calculate("To continue, please consult the code grid in the manual.  Enter the code at row 2, column 4.") == 7726640
-)
-assert (
-    calculate("To continue, please consult the code grid in the manual.  Enter the code at row 5, column 4.") == 6899651
-)
-assert (
-    calculate("To continue, please consult the code grid in the manual.  Enter the code at row 6, column 6.")
-    == 27995004
-)
+def self_check():
+    assert (
+        calculate("To continue, please consult the code grid in the manual.  Enter the code at row 2, column 4.")
+        == 7726640
+    )
+    assert (
+        calculate("To continue, please consult the code grid in the manual.  Enter the code at row 5, column 4.")
+        == 6899651
+    )
+    assert (
+        calculate("To continue, please consult the code grid in the manual.  Enter the code at row 6, column 6.")
+        == 27995004
+    )
@@ -9,6 +9,7 @@ def calculate(text: str) -> int:
     return manhattan_distance((0, 0), (x, y))
 
 
-assert calculate("R2, L3") == 5
-assert calculate("R2, R2, R2") == 2
-assert calculate("R5, L5, R5, R3") == 12
+def self_check():
+    assert calculate("R2, L3") == 5
+    assert calculate("R2, R2, R2") == 2
+    assert calculate("R5, L5, R5, R3") == 12
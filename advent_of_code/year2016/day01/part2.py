@@ -12,4 +12,5 @@ def calculate(text: str) -> int:
             locations_visited.add((x, y))
 
 
-assert calculate("R8, R4, R4, R8") == 4
+def self_check():
+    assert calculate("R8, R4, R4, R8") == 4
@@ -24,10 +24,11 @@ def calculate(text: str) -> int:
     return int(combination)
 
 
-puzzle = """
+def self_check():
+    puzzle = """
 ULL
 RRDDD
 LURDL
 UUUUD
 """.strip()
-assert calculate(puzzle) == 1985
+    assert calculate(puzzle) == 1985
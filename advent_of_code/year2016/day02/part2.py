@@ -28,10 +28,11 @@ def calculate(text: str) -> str:
     return combination
 
 
-puzzle = """
+def self_check():
+    puzzle = """
 ULL
 RRDDD
 LURDL
 UUUUD
 """.strip()
-assert calculate(puzzle) == "5DB3"
+    assert calculate(puzzle) == "5DB3"
@@ -11,12 +11,6 @@ def decrypt_name(instruction: Instruction) -> str:
     return decrypted
 
 
-assert (
-    decrypt_name(Instruction(encrypted_name="qzmt-zixmtkozy-ivhz", sector_id=343, checksum="foobar"))
-    == "very encrypted name"
-)
-
-
 def calculate(text: str) -> int:
     for instruction in parse_instructions(text):
         if not is_real_room(instruction):
@@ -24,3 +18,10 @@ def calculate(text: str) -> int:
 
         if decrypt_name(instruction) == "northpole object storage":
             return instruction.sector_id
+
+
+def self_check():
+    assert (
+        decrypt_name(Instruction(encrypted_name="qzmt-zixmtkozy-ivhz", sector_id=343, checksum="foobar"))
+        == "very encrypted name"
+    )
@@ -1,16 +1,15 @@
-from hashlib import md5
+from contextlib import closing
+from itertools import islice
+
+from advent_of_code.utils.md5 import find_hashes
 
 
 def calculate(text: str) -> str:
-    password = ""
-    index = 0
-    while len(password) < 8:
-        digest = ""
-        while not digest.startswith("00000"):
-            digest = md5(f"{text}{index}".encode()).hexdigest()
-            index += 1
-        password += digest[5]
-    return password
+    # closing the search shuts down its worker processes
+    with closing(find_hashes(text, 5)) as hashes:
+        # the 6th hex digit is the low nibble of the 3rd byte
+        return "".join(f"{digest[2] & 0xF:x}" for _, digest in islice(hashes, 8))
 
 
-assert calculate("abc") == "18f47a30"
+def self_check():
+    assert calculate("abc") == "18f47a30"
@@ -1,26 +1,28 @@
-from hashlib import md5
+from contextlib import closing
+
+from advent_of_code.utils.md5 import find_hashes
 
 
 def calculate(text: str) -> str:
     password = ["_"] * 8
     found = 0
-    index = 0
-    while found < 8:
-        digest = ""
-        while not digest.startswith("00000"):
-            digest = md5(f"{text}{index}".encode()).hexdigest()
-            index += 1
-
-        position = int(digest[5], 16)
-        char = digest[6]
-        if position > 7 or password[position] != "_":
-            # invalid position, skip
-            continue
-
-        password[position] = char
-        found += 1
+    # closing the search shuts down its worker processes
+    with closing(find_hashes(text, 5)) as hashes:
+        while found < 8:
+            _, digest = next(hashes)
+
+            # the 6th and 7th hex digits are the low nibble of the 3rd byte and the high nibble of the 4th byte
+            position = digest[2] & 0xF
+            char = f"{digest[3] >> 4:x}"
+            if position > 7 or password[position] != "_":
+                # invalid position, skip
+                continue
+
+            password[position] = char
+            found += 1
 
     return "".join(password)
 
 
-assert calculate("abc") == "05ace8e3"
+def self_check():
+    assert calculate("abc") == "05ace8e3"
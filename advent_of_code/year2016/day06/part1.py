@@ -6,7 +6,8 @@ def calculate(text: str) -> str:
     return "".join(sorted_freq_count(col)[0] for col in columns)
 
 
-puzzle = """
+def self_check():
+    puzzle = """
 eedadn
 drvtee
 eandsr
@@ -24,4 +25,4 @@ vrdear
 dvrsen
 enarar
 """.strip()
-assert calculate(puzzle) == "easter"
+    assert calculate(puzzle) == "easter"
@@ -11,10 +11,11 @@ def calculate(text: str) -> int:
     return has_tls
 
 
-puzzle = """
+def self_check():
+    puzzle = """
 abba[mnop]qrst
 abcd[bddb]xyyx
 aaaa[qwer]tyui
 ioxxoj[asdfgh]zxcvbn
 """.strip()
-assert calculate(puzzle) == 2
+    assert calculate(puzzle) == 2
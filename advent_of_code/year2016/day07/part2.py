@@ -17,10 +17,11 @@ def calculate(text: str) -> int:
     return has_ssl
 
 
-puzzle = """
+def self_check():
+    puzzle = """
 aba[bab]xyz
 xyx[xyx]xyx
 aaa[kek]eke
 zazbz[bzb]cdb
 """.strip()
-assert calculate(puzzle) == 3
+    assert calculate(puzzle) == 3
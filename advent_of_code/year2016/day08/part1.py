@@ -10,10 +10,11 @@ def calculate(text: str, width: int = 50, height: int = 6) -> int:
     return sum(1 for lit in matrix.values() if lit)
 
 
-puzzle = """
+def self_check():
+    puzzle = """
 rect 3x2
 rotate column x=1 by 1
 rotate row y=0 by 4
 rotate column x=1 by 1
 """.strip()
-assert calculate(puzzle, width=7, height=3) == 6
+    assert calculate(puzzle, width=7, height=3) == 6
@@ -27,9 +27,10 @@ def calculate(text: str) -> int:
     return len(decompressed)
 
 
-assert calculate("ADVENT") == 6
-assert calculate("A(1x5)BC") == 7
-assert calculate("(3x3)XYZ") == 9
-assert calculate("A(2x2)BCD(2x2)EFG") == 11
-assert calculate("(6x1)(1x3)A") == 6
-assert calculate("X(8x2)(3x3)ABCY") == 18
+def self_check():
+    assert calculate("ADVENT") == 6
+    assert calculate("A(1x5)BC") == 7
+    assert calculate("(3x3)XYZ") == 9
+    assert calculate("A(2x2)BCD(2x2)EFG") == 11
+    assert calculate("(6x1)(1x3)A") == 6
+    assert calculate("X(8x2)(3x3)ABCY") == 18
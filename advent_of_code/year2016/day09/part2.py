@@ -30,7 +30,8 @@ def calculate(text: str) -> int:
     return decompressed_size(text)
 
 
-assert calculate("(3x3)XYZ") == 9
-assert calculate("X(8x2)(3x3)ABCY") == 20
-assert calculate("(27x12)(20x12)(13x14)(7x10)(1x12)A") == 241920
-assert calculate("(25x3)(3x3)ABC(2x3)XY(5x2)PQRSTX(18x9)(3x2)TWO(5x7)SEVEN") == 445
+def self_check():
+    assert calculate("(3x3)XYZ") == 9
+    assert calculate("X(8x2)(3x3)ABCY") == 20
+    assert calculate("(27x12)(20x12)(13x14)(7x10)(1x12)A") == 241920
+    assert calculate("(25x3)(3x3)ABC(2x3)XY(5x2)PQRSTX(18x9)(3x2)TWO(5x7)SEVEN") == 445
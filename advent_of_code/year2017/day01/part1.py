@@ -4,11 +4,12 @@ def calculate(x: str) -> int:
     return sum(int(a) for a, b in zip(x, x[1:]) if a == b)
 
 
-testcases = (
-    ("1122", 3),
-    ("1111", 4),
-    ("1234", 0),
-    ("91212129", 9),
-)
-for puzzle, expected_answer in testcases:
-    assert calculate(puzzle) == expected_answer
+def self_check():
+    testcases = (
+        ("1122", 3),
+        ("1111", 4),
+        ("1234", 0),
+        ("91212129", 9),
+    )
+    for puzzle, expected_answer in testcases:
+        assert calculate(puzzle) == expected_answer
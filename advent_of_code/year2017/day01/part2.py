@@ -10,12 +10,13 @@ def calculate(x: str) -> int:
     return s
 
 
-testcases = (
-    ("1212", 6),
-    ("1221", 0),
-    ("123425", 4),
-    ("123123", 12),
-    ("12131415", 4),
-)
-for puzzle, expected_answer in testcases:
-    assert calculate(puzzle) == expected_answer
+def self_check():
+    testcases = (
+        ("1212", 6),
+        ("1221", 0),
+        ("123425", 4),
+        ("123123", 12),
+        ("12131415", 4),
+    )
+    for puzzle, expected_answer in testcases:
+        assert calculate(puzzle) == expected_answer
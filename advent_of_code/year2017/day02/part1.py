@@ -6,9 +6,10 @@ def calculate(text: str) -> int:
     return sum(max(row) - min(row) for row in matrix)
 
 
-puzzle = """
+def self_check():
+    puzzle = """
 5	1	9	5
 7	5	3
 2	4	6	8
 """.strip()
-assert calculate(puzzle) == 18
+    assert calculate(puzzle) == 18
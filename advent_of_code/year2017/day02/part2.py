@@ -15,9 +15,10 @@ def calculate(text: str) -> int:
     return s
 
 
-puzzle = """
+def self_check():
+    puzzle = """
 5	9	2	8
 9	4	7	3
 3	8	6	5
 """.strip()
-assert calculate(puzzle) == 9
+    assert calculate(puzzle) == 9
@@ -34,11 +34,12 @@ def calculate(text: str) -> int:
     return abs(x) + abs(y)
 
 
-testcases = (
-    ("1", 0),
-    ("12", 3),
-    ("23", 2),
-    ("1024", 31),
-)
-for puzzle, expected_answer in testcases:
-    assert calculate(puzzle) == expected_answer
+def self_check():
+    testcases = (
+        ("1", 0),
+        ("12", 3),
+        ("23", 2),
+        ("1024", 31),
+    )
+    for puzzle, expected_answer in testcases:
+        assert calculate(puzzle) == expected_answer
@@ -11,10 +11,11 @@ def calculate(text: str) -> int:
     return sum(1 for line in text.splitlines() if is_valid_passphrase(line))
 
 
-testcases = (
-    ("aa bb cc dd ee", True),
-    ("aa bb cc dd aa", False),
-    ("aa bb cc dd aaa", True),
-)
-for puzzle, expected_answer in testcases:
-    assert is_valid_passphrase(puzzle) == expected_answer
+def self_check():
+    testcases = (
+        ("aa bb cc dd ee", True),
+        ("aa bb cc dd aa", False),
+        ("aa bb cc dd aaa", True),
+    )
+    for puzzle, expected_answer in testcases:
+        assert is_valid_passphrase(puzzle) == expected_answer
@@ -12,12 +12,13 @@ def calculate(text: str) -> int:
     return sum(1 for line in text.splitlines() if is_valid_passphrase(line))
 
 
-testcases = (
-    ("abcde fghij", True),
-    ("abcde xyz ecdab", False),
-    ("a ab abc abd abf abj", True),
-    ("iiii oiii ooii oooi oooo", True),
-    ("oiii ioii iioi iiio", False),
-)
-for puzzle, expected_answer in testcases:
-    assert is_valid_passphrase(puzzle) == expected_answer
+def self_check():
+    testcases = (
+        ("abcde fghij", True),
+        ("abcde xyz ecdab", False),
+        ("a ab abc abd abf abj", True),
+        ("iiii oiii ooii oooi oooo", True),
+        ("oiii ioii iioi iiio", False),
+    )
+    for puzzle, expected_answer in testcases:
+        assert is_valid_passphrase(puzzle) == expected_answer
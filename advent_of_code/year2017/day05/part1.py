@@ -10,11 +10,12 @@ def calculate(text: str) -> int:
     return counter
 
 
-puzzle = """
+def self_check():
+    puzzle = """
 0
 3
 0
 1
 -3
 """.strip()
-assert calculate(puzzle) == 5
+    assert calculate(puzzle) == 5
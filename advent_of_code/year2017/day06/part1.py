@@ -1,15 +1,13 @@
+from advent_of_code.utils.cycles import detect_cycle
+
 from .shared import parse, redistribute
 
 
 def calculate(text: str) -> int:
-    banks = parse(text)
-    already_seen = set()
-    counter = 0
-    while tuple(banks) not in already_seen:
-        already_seen.add(tuple(banks))
-        banks = redistribute(banks)
-        counter += 1
-    return counter
+    # amount of redistributions until the first repeated configuration
+    cycle = detect_cycle(parse(text), redistribute)
+    return cycle.start + cycle.length
 
 
-assert calculate("0	2	7	0") == 5
+def self_check():
+    assert calculate("0	2	7	0") == 5
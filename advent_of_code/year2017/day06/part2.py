@@ -1,19 +1,11 @@
+from advent_of_code.utils.cycles import detect_cycle
+
 from .shared import parse, redistribute
 
 
 def calculate(text: str) -> int:
-    banks = parse(text)
-    already_seen = set()
-    while tuple(banks) not in already_seen:
-        already_seen.add(tuple(banks))
-        banks = redistribute(banks)
-    banks_to_look_for = banks.copy()
-    counter = 1
-    banks = redistribute(banks)
-    while banks != banks_to_look_for:
-        banks = redistribute(banks)
-        counter += 1
-    return counter
+    return detect_cycle(parse(text), redistribute).length
 
 
-assert calculate("0	2	7	0") == 4
+def self_check():
+    assert calculate("0	2	7	0") == 4
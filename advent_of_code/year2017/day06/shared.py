@@ -1,5 +1,12 @@
-def redistribute(banks):
-    max_idx = next(i for i, x in enumerate(banks) if x == max(banks))
+from typing import Tuple
+
+
+Banks = Tuple[int, ...]
+
+
+def redistribute(banks: Banks) -> Banks:
+    banks = list(banks)
+    max_idx = banks.index(max(banks))
     block_count = banks[max_idx]
     banks[max_idx] = 0
 
@@ -8,8 +15,8 @@ def redistribute(banks):
         idx = (idx + 1) % len(banks)
         banks[idx] += 1
 
-    return banks
+    return tuple(banks)
 
 
-def parse(text: str):
-    return list(map(int, text.split("\t")))
+def parse(text: str) -> Banks:
+    return tuple(map(int, text.split("\t")))
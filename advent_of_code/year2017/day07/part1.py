@@ -6,7 +6,8 @@ def calculate(text: str) -> str:
     return find_root(parse_lines(lines))
 
 
-puzzle = """
+def self_check():
+    puzzle = """
 pbga (66)
 xhth (57)
 ebii (61)
@@ -22,4 +23,4 @@ gyxo (61)
 cntj (57)
 """.strip()
 
-assert calculate(puzzle) == "tknk"
+    assert calculate(puzzle) == "tknk"
@@ -45,7 +45,8 @@ def calculate(text: str) -> int:
             cur_diff = outlier - standard
 
 
-puzzle = """
+def self_check():
+    puzzle = """
 pbga (66)
 xhth (57)
 ebii (61)
@@ -61,4 +62,4 @@ gyxo (61)
 cntj (57)
 """.strip()
 
-assert calculate(puzzle) == 60
+    assert calculate(puzzle) == 60
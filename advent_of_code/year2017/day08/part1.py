@@ -9,10 +9,11 @@ def calculate(text: str) -> int:
     return max(cpu.registers.values())
 
 
-puzzle = """
+def self_check():
+    puzzle = """
 b inc 5 if a > 1
 a inc 1 if b < 5
 c dec -10 if a >= 1
 c inc -20 if c == 10
 """.strip()
-assert calculate(puzzle) == 1
+    assert calculate(puzzle) == 1
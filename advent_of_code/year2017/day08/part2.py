@@ -11,10 +11,11 @@ def calculate(text: str) -> int:
     return max_value
 
 
-puzzle = """
+def self_check():
+    puzzle = """
 b inc 5 if a > 1
 a inc 1 if b < 5
 c dec -10 if a >= 1
 c inc -20 if c == 10
 """.strip()
-assert calculate(puzzle) == 10
+    assert calculate(puzzle) == 10
@@ -15,15 +15,16 @@ def calculate(text: str) -> int:
     return calculate_score(parse(text))
 
 
-GROUPS_SCORE = {
-    "{}": 1,
-    "{{{}}}": 6,
-    "{{},{}}": 5,
-    "{{{},{},{{}}}}": 16,
-    "{<a>,<a>,<a>,<a>}": 1,
-    "{{<ab>},{<ab>},{<ab>},{<ab>}}": 9,
-    "{{<!!>},{<!!>},{<!!>},{<!!>}}": 9,
-    "{{<a!>},{<a!>},{<a!>},{<ab>}}": 3,
-}
-for line, score in GROUPS_SCORE.items():
-    assert calculate(line) == score
+def self_check():
+    GROUPS_SCORE = {
+        "{}": 1,
+        "{{{}}}": 6,
+        "{{},{}}": 5,
+        "{{{},{},{{}}}}": 16,
+        "{<a>,<a>,<a>,<a>}": 1,
+        "{{<ab>},{<ab>},{<ab>},{<ab>}}": 9,
+        "{{<!!>},{<!!>},{<!!>},{<!!>}}": 9,
+        "{{<a!>},{<a!>},{<a!>},{<ab>}}": 3,
+    }
+    for line, score in GROUPS_SCORE.items():
+        assert calculate(line) == score
@@ -21,14 +21,15 @@ def calculate(text: str) -> int:
     return calculate_total_garbage_length(parse(text))
 
 
-GARBAGE_LENGTH = {
-    "<>": 0,
-    "<random characters>": 17,
-    "<<<<>": 3,
-    "<{!>}>": 2,
-    "<!!>": 0,
-    "<!!!>>": 0,
-    '<{o"i!a,<{i<a>': 10,
-}
-for line, garbage_length in GARBAGE_LENGTH.items():
-    assert calculate_total_garbage_length(parse(line)) == garbage_length
+def self_check():
+    GARBAGE_LENGTH = {
+        "<>": 0,
+        "<random characters>": 17,
+        "<<<<>": 3,
+        "<{!>}>": 2,
+        "<!!>": 0,
+        "<!!!>>": 0,
+        '<{o"i!a,<{i<a>': 10,
+    }
+    for line, garbage_length in GARBAGE_LENGTH.items():
+        assert calculate_total_garbage_length(parse(line)) == garbage_length
@@ -84,7 +84,7 @@ def parse(text: str) -> GroupOrGarbage:
     return last_value
 
 
-if __name__ == "__main__":
+def self_check():
     GARBAGE_LINES = (
         "<>",
         "<random characters>",
@@ -7,4 +7,5 @@ def calculate(text: str, list_length: int = 256) -> int:
     return result[0] * result[1]
 
 
-assert calculate("3,4,1,5", 5) == 12
+def self_check():
+    assert calculate("3,4,1,5", 5) == 12
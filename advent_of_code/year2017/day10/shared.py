@@ -1,32 +1,33 @@
 from functools import reduce
+from operator import xor
 from typing import Iterable, List
 
 
-def reverse_part(numbers: List[int], start: int, stop: int) -> List[int]:
-    for idx in range(0, (stop - start) // 2):
-        # swap items
-        begin_idx = (start + idx) % len(numbers)
-        end_idx = (stop - 1 - idx) % len(numbers)
-        numbers[begin_idx], numbers[end_idx] = numbers[end_idx], numbers[begin_idx]
-    return numbers
+HASH_SUFFIX = [17, 31, 73, 47, 23]
 
 
 def tie_knots(list_length: int, lengths: Iterable[int], rounds: int = 1) -> List[int]:
-    index = 0
+    # The list is kept rotated so that the current position is always at its start, which turns every reversal into a
+    # reversed slice and every move into a rotation. `offset` tracks where the original start of the list went.
+    lengths = list(lengths)
+    numbers = bytearray(range(list_length)) if list_length <= 256 else list(range(list_length))
+    offset = 0
     skip_size = 0
-    numbers = list(range(list_length))
     for _ in range(rounds):
         for length in lengths:
-            numbers = reverse_part(numbers, index, index + length)
+            numbers[:length] = numbers[length - 1 :: -1] if length > 0 else b""
 
-            index += length + skip_size
+            step = (length + skip_size) % list_length
+            numbers = numbers[step:] + numbers[:step]
+            offset = (offset - step) % list_length
             skip_size += 1
-    return numbers
+    return list(numbers[offset:] + numbers[:offset])
 
 
 def sparse_to_dense(numbers: List[int]) -> List[int]:
-    def reduce_block(block: List[int]) -> int:
-        return reduce(lambda a, b: a ^ b, block)
+    return [reduce(xor, numbers[x * 16 : (x + 1) * 16]) for x in range(16)]
 
-    blocks = map(reduce_block, (numbers[x * 16 : (x + 1) * 16] for x in range(16)))
-    return list(blocks)
+
+def knot_hash(text: str) -> bytes:
+    sparse = tie_knots(256, list(text.encode()) + HASH_SUFFIX, rounds=64)
+    return bytes(sparse_to_dense(sparse))
@@ -9,7 +9,8 @@ def calculate(text: str) -> int:
     return path_distance(x, y)
 
 
-assert calculate("ne,ne,ne") == 3
-assert calculate("ne,ne,sw,sw") == 0
-assert calculate("ne,ne,s,s") == 2
-assert calculate("se,sw,se,sw,sw") == 3
+def self_check():
+    assert calculate("ne,ne,ne") == 3
+    assert calculate("ne,ne,sw,sw") == 0
+    assert calculate("ne,ne,s,s") == 2
+    assert calculate("se,sw,se,sw,sw") == 3
@@ -7,7 +7,8 @@ def calculate(text: str) -> int:
     return len(groups)
 
 
-puzzle = """
+def self_check():
+    puzzle = """
 0 <-> 2
 1 <-> 1
 2 <-> 0, 3, 4
@@ -16,4 +17,4 @@ puzzle = """
 5 <-> 6
 6 <-> 4, 5
 """.strip()
-assert calculate(puzzle) == 2
+    assert calculate(puzzle) == 2
@@ -11,10 +11,11 @@ def calculate(text: str) -> int:
     return score
 
 
-puzzle = """
+def self_check():
+    puzzle = """
 0: 3
 1: 2
 4: 4
 6: 4
 """.strip()
-assert calculate(puzzle) == 24
+    assert calculate(puzzle) == 24
@@ -21,10 +21,11 @@ def calculate(text: str) -> int:
             delay += 1
 
 
-puzzle = """
+def self_check():
+    puzzle = """
 0: 3
 1: 2
 4: 4
 6: 4
 """.strip()
-assert calculate(puzzle) == 10
+    assert calculate(puzzle) == 10
@@ -9,4 +9,5 @@ def calculate(text: str) -> int:
     return count
 
 
-assert calculate("flqrgnkx") == 8108
+def self_check():
+    assert calculate("flqrgnkx") == 8108
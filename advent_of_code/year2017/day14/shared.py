@@ -1,25 +1,14 @@
-from functools import reduce
-from typing import Iterable, Tuple
+from typing import List
 
-from ..day10.shared import sparse_to_dense, tie_knots
+from advent_of_code.utils.parallel import parallel_map
 
+from ..day10.shared import knot_hash
 
-def reduce_to_big_number(numbers: Iterable[int]) -> int:
-    return reduce(lambda prev, cur: (prev << 8) | cur, numbers, 0)
 
+def calculate_row(key: str) -> int:
+    # every row is packed in a 128-bit integer, the most significant bit is the leftmost square
+    return int.from_bytes(knot_hash(key), "big")
 
-def calculate_rows(text: str) -> Iterable[int]:
-    for i in range(128):
-        lengths = list(map(lambda x: ord(x), f"{text}-{i}"))
-        lengths.extend([17, 31, 73, 47, 23])
-        sparse = tie_knots(256, lengths, rounds=64)
-        dense = sparse_to_dense(sparse)
-        big = reduce_to_big_number(dense)
-        yield big
 
-
-def walk_as_grid(numbers: Iterable[int]) -> Iterable[Tuple[int, int, bool]]:
-    for x, row in enumerate(numbers):
-        binary_str = bin(row).replace("0b", "").zfill(128)
-        for y, bit in enumerate(binary_str):
-            yield (x, y, bit == "1")
+def calculate_rows(text: str) -> List[int]:
+    return parallel_map(calculate_row, (f"{text}-{i}" for i in range(128)))
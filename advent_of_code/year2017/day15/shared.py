@@ -1,7 +1,11 @@
 import re
 
+from functools import partial
+from itertools import compress
 from typing import Iterator, Tuple
 
+from advent_of_code.utils.parallel import parallel_map
+
 
 RE_GENERATOR_LINE = re.compile(r"^Generator (\w+) starts with (\d+)$")
 GENERATOR_MULTIPLIERS = {
@@ -12,9 +16,21 @@ GENERATOR_MULTIPLES = {
     "A": 4,
     "B": 8,
 }
+MODULUS = 2147483647
 
+# amount of values which are generated at once
+BLOCK_SIZE = 1 << 14
+# amount of values a single (parallel) task generates
+CHUNK_SIZE = 1 << 21
 
-def parse_text(text: str, check_multiples: bool = False) -> Tuple[Iterator[int], Iterator[int]]:
+# translation tables marking the values which are a multiple, based on their lowest byte
+MULTIPLE_MASKS = {multiple: bytes(int(b % multiple == 0) for b in range(256)) for multiple in (1, 4, 8)}
+
+# the lowest 16 bits of a sequence of values, as separate byte strings of the low and high bytes
+LowWords = Tuple[bytes, bytes]
+
+
+def parse_start_values(text: str) -> Tuple[int, int]:
     start_values = {}
     for line in text.splitlines():
         m = RE_GENERATOR_LINE.match(line)
@@ -27,6 +43,12 @@ def parse_text(text: str, check_multiples: bool = False) -> Tuple[Iterator[int],
         "B",
     }, "Text did not contain both generators A and B"
 
+    return start_values["A"], start_values["B"]
+
+
+def parse_text(text: str, check_multiples: bool = False) -> Tuple[Iterator[int], Iterator[int]]:
+    start_values = dict(zip(("A", "B"), parse_start_values(text)))
+
     def create_generator(type: str) -> Iterator[int]:
         value = start_values[type]
         multiplier = GENERATOR_MULTIPLIERS[type]
@@ -34,16 +56,113 @@ def parse_text(text: str, check_multiples: bool = False) -> Tuple[Iterator[int],
             multiple = GENERATOR_MULTIPLES[type]
             while True:
                 value *= multiplier
-                value %= 2147483647
+                value %= MODULUS
                 if value % multiple == 0:
                     yield value
         else:
             while True:
                 value *= multiplier
-                value %= 2147483647
+                value %= MODULUS
                 yield value
 
     return (
         create_generator("A"),
         create_generator("B"),
     )
+
+
+def _repeat_field(value: int, count: int) -> int:
+    return int.from_bytes(value.to_bytes(8, "little") * count, "little")
+
+
+def iter_blocks(start_value: int, multiplier: int, start: int, count: int) -> Iterator[bytes]:
+    # Yields the `count` values after the first `start` ones, in blocks of 64-bit little-endian fields (the layout of
+    # an array("Q")). Every value is the previous one multiplied by `multiplier`, so the value `n` steps further is the
+    # current one multiplied by `multiplier ** n`. This allows jumping ahead to `start`, and computing a whole block
+    # from the previous one with a single multiplication of the block packed in one big integer.
+    value = start_value * pow(multiplier, start, MODULUS) % MODULUS
+    first_block = []
+    for _ in range(min(BLOCK_SIZE, count)):
+        value = value * multiplier % MODULUS
+        first_block.append(value)
+    size = len(first_block)
+    block = int.from_bytes(b"".join(value.to_bytes(8, "little") for value in first_block), "little")
+    yield block.to_bytes(8 * size, "little")
+
+    jump = pow(multiplier, size, MODULUS)
+    # the modulus is 2^31 - 1, so `x % MODULUS` can be computed by adding the bits above the 31st to the ones below
+    modulus_fields = _repeat_field(MODULUS, size)
+    one_fields = _repeat_field(1, size)
+    for remaining in range(count - size, 0, -size):
+        # every field is below 2^31 and so is `jump`, so the products fit in their 64-bit fields
+        block *= jump
+        block = (block & modulus_fields) + ((block >> 31) & modulus_fields)
+        # the fields are now below 2^32, fold once more to get them below the modulus
+        block = (block & modulus_fields) + ((block >> 31) & one_fields)
+        yield block.to_bytes(8 * size, "little")[: 8 * remaining]
+
+
+def generate_low_words(start_value: int, multiplier: int, multiple: int, start: int, count: int) -> LowWords:
+    # the lowest 16 bits of the values which are a multiple of `multiple`, out of `count` values after `start`
+    mask = MULTIPLE_MASKS[multiple]
+    low_parts = []
+    high_parts = []
+    for block in iter_blocks(start_value, multiplier, start, count):
+        low, high = block[0::8], block[1::8]
+        if multiple > 1:
+            selected = low.translate(mask)
+            low, high = bytes(compress(low, selected)), bytes(compress(high, selected))
+        low_parts.append(low)
+        high_parts.append(high)
+    return b"".join(low_parts), b"".join(high_parts)
+
+
+def count_matches(a: LowWords, b: LowWords, count: int) -> int:
+    # both low and high bytes XOR to zero for matching values, so count the zero bytes in the combined difference
+    (a_low, a_high), (b_low, b_high) = a, b
+    difference = (int.from_bytes(a_low[:count], "little") ^ int.from_bytes(b_low[:count], "little")) | (
+        int.from_bytes(a_high[:count], "little") ^ int.from_bytes(b_high[:count], "little")
+    )
+    return difference.to_bytes(count, "little").count(0)
+
+
+def _count_matches_in_chunk(start_values: Tuple[int, int], pairs: int, start: int) -> int:
+    count = min(CHUNK_SIZE, pairs - start)
+    start_a, start_b = start_values
+    a = generate_low_words(start_a, GENERATOR_MULTIPLIERS["A"], 1, start, count)
+    b = generate_low_words(start_b, GENERATOR_MULTIPLIERS["B"], 1, start, count)
+    return count_matches(a, b, count)
+
+
+def _generate_filtered_chunk(start_values: Tuple[int, int], task: Tuple[str, int]) -> LowWords:
+    type, start = task
+    start_value = start_values[0 if type == "A" else 1]
+    return generate_low_words(start_value, GENERATOR_MULTIPLIERS[type], GENERATOR_MULTIPLES[type], start, CHUNK_SIZE)
+
+
+def judge(start_values: Tuple[int, int], pairs: int, check_multiples: bool = False) -> int:
+    if not check_multiples:
+        # every chunk of pairs can be judged on its own, as the generators can jump ahead to it
+        return sum(parallel_map(partial(_count_matches_in_chunk, start_values, pairs), range(0, pairs, CHUNK_SIZE)))
+
+    # the amount of values needed to find enough multiples isn't known upfront, so keep generating chunks of both
+    # generators until there are enough of them
+    filtered = {"A": ([], [], 0), "B": ([], [], 0)}
+    next_start = {"A": 0, "B": 0}
+    while any(length < pairs for _, _, length in filtered.values()):
+        tasks = []
+        for type, (_, _, length) in filtered.items():
+            # estimate the amount of chunks, based on the frequency of the multiple
+            missing = (pairs - length) * GENERATOR_MULTIPLES[type]
+            for _ in range(max(0, -(-missing // CHUNK_SIZE))):
+                tasks.append((type, next_start[type]))
+                next_start[type] += CHUNK_SIZE
+
+        for (type, _), (low, high) in zip(tasks, parallel_map(partial(_generate_filtered_chunk, start_values), tasks)):
+            lows, highs, length = filtered[type]
+            lows.append(low)
+            highs.append(high)
+            filtered[type] = (lows, highs, length + len(low))
+
+    a, b = ((b"".join(lows), b"".join(highs)) for lows, highs, _ in filtered.values())
+    return count_matches(a, b, pairs)
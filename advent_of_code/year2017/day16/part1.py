@@ -1,4 +1,4 @@
-from .shared import Program, parse_text
+from .shared import parse_text, perform_dance
 
 
 def calculate(text: str, programs: str = None) -> str:
@@ -6,12 +6,10 @@ def calculate(text: str, programs: str = None) -> str:
         # default value
         programs = "".join(chr(x) for x in range(ord("a"), ord("p") + 1))
 
-    program = Program(programs)
-    for operation in parse_text(text):
-        program.execute_operation(operation)
-    return str(program)
+    return perform_dance(programs, parse_text(text))
 
 
-assert calculate("s1", "abcde") == "eabcd"
-assert calculate("s1,x3/4", "abcde") == "eabdc"
-assert calculate("s1,x3/4,pe/b", "abcde") == "baedc"
+def self_check():
+    assert calculate("s1", "abcde") == "eabcd"
+    assert calculate("s1,x3/4", "abcde") == "eabdc"
+    assert calculate("s1,x3/4,pe/b", "abcde") == "baedc"
@@ -1,6 +1,6 @@
 import re
 
-from typing import Iterable, Iterator, NamedTuple, Union
+from typing import Iterable, Iterator, NamedTuple, Tuple, Union
 
 
 RE_SPIN = re.compile(r"^s(\d+)$")
@@ -34,28 +34,47 @@ def parse_text(text: str) -> Iterator[Operation]:
         raise ValueError(f'Could not parse line "{line}"')
 
 
-class Program(object):
-    def __init__(self, programs: Iterable[str]):
-        self.programs = list(programs)
+# a permutation maps every index to the index it takes its value from
+Permutation = Tuple[int, ...]
 
-    def _swap(self, x, y):
-        self.programs[x], self.programs[y] = self.programs[y], self.programs[x]
 
-    def execute_operation(self, operation: Operation):
+def compose(first: Permutation, second: Permutation) -> Permutation:
+    # applying `first` and then `second`
+    return tuple(first[i] for i in second)
+
+
+def power(permutation: Permutation, exponent: int) -> Permutation:
+    # exponentiation by squaring
+    result = tuple(range(len(permutation)))
+    while exponent > 0:
+        if exponent & 1:
+            result = compose(result, permutation)
+        permutation = compose(permutation, permutation)
+        exponent >>= 1
+    return result
+
+
+def compile_dance(programs: str, dance: Iterable[Operation]) -> Tuple[Permutation, Permutation]:
+    # Spins and exchanges only move programs around, regardless of their names, while partners only swap names,
+    # regardless of where those programs are. So a dance is a permutation of positions and one of names (as indices
+    # in `programs`), which can be applied independently of each other.
+    positions = list(range(len(programs)))
+    names = list(range(len(programs)))
+    for operation in dance:
         if isinstance(operation, Spin):
-            self.programs = self.programs[-operation.amount :] + self.programs[: -operation.amount]
+            positions = positions[-operation.amount :] + positions[: -operation.amount]
         elif isinstance(operation, Exchange):
-            self._swap(operation.left_position, operation.right_position)
+            x, y = operation.left_position, operation.right_position
+            positions[x], positions[y] = positions[y], positions[x]
         elif isinstance(operation, Partner):
-            self._swap(
-                self.programs.index(operation.left_name),
-                self.programs.index(operation.right_name),
-            )
+            x, y = programs.index(operation.left_name), programs.index(operation.right_name)
+            names = [y if name == x else x if name == y else name for name in names]
         else:
             raise ValueError(f"Invalid operation {operation}")
+    return tuple(positions), tuple(names)
 
-    def __repr__(self):
-        return f"Program(programs={self.programs})"
 
-    def __str__(self):
-        return "".join(self.programs)
+def perform_dance(programs: str, dance: Iterable[Operation], rounds: int = 1) -> str:
+    positions, names = compile_dance(programs, dance)
+    positions, names = power(positions, rounds), power(names, rounds)
+    return "".join(programs[names[idx]] for idx in positions)
@@ -7,4 +7,5 @@ def calculate(text: str) -> int:
     return buffer[(buffer.index(2017) + 1) % len(buffer)]
 
 
-assert calculate("3") == 638
+def self_check():
+    assert calculate("3") == 638
@@ -11,7 +11,8 @@ def calculate(text: str) -> int:
     return mpu.recovered_frequency
 
 
-puzzle = """
+def self_check():
+    puzzle = """
 set a 1
 add a 2
 mul a a
@@ -23,4 +24,4 @@ jgz a -1
 set a 1
 jgz a -2
 """.strip()
-assert calculate(puzzle) == 4
+    assert calculate(puzzle) == 4
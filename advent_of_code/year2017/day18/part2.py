@@ -65,7 +65,8 @@ def calculate(text: str) -> int:
     return state1.sent_instructions
 
 
-puzzle = """
+def self_check():
+    puzzle = """
 snd 1
 snd 2
 snd p
@@ -74,4 +75,4 @@ rcv b
 rcv c
 rcv d
 """.strip()
-assert calculate(puzzle) == 3
+    assert calculate(puzzle) == 3
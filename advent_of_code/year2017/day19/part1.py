@@ -6,7 +6,8 @@ def calculate(text: str) -> str:
     return "".join(c for c in follow_path(m) if c.isalpha())
 
 
-puzzle = """
+def self_check():
+    puzzle = """
      |
      |  +--+
      A  |  C
@@ -14,6 +15,6 @@ puzzle = """
      |  |  |  D
      +B-+  +--+
 """.strip(
-    "\n"
-)
-assert calculate(puzzle) == "ABCDEF"
+        "\n"
+    )
+    assert calculate(puzzle) == "ABCDEF"
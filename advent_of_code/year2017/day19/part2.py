@@ -6,7 +6,8 @@ def calculate(text: str) -> int:
     return sum(1 for c in follow_path(m))
 
 
-puzzle = """
+def self_check():
+    puzzle = """
      |
      |  +--+
      A  |  C
@@ -14,6 +15,6 @@ puzzle = """
      |  |  |  D
      +B-+  +--+
 """.strip(
-    "\n"
-)
-assert calculate(puzzle) == 38
+        "\n"
+    )
+    assert calculate(puzzle) == 38
@@ -14,8 +14,9 @@ def calculate(text: str) -> int:
     return next(i for i, p in enumerate(particles) if manhattan_distance(p) == min_distance)
 
 
-puzzle = """
+def self_check():
+    puzzle = """
 p=<3,0,0>, v=<2,0,0>, a=<-1,0,0>
 p=<4,0,0>, v=<0,0,0>, a=<-2,0,0>
 """.strip()
-assert calculate(puzzle) == 0
+    assert calculate(puzzle) == 0
@@ -19,10 +19,11 @@ def calculate(text: str) -> int:
     return len(particles)
 
 
-puzzle = """
+def self_check():
+    puzzle = """
 p=<-6,0,0>, v=<3,0,0>, a=<0,0,0>
 p=<-4,0,0>, v=<2,0,0>, a=<0,0,0>
 p=<-2,0,0>, v=<1,0,0>, a=<0,0,0>
 p=<3,0,0>, v=<-1,0,0>, a=<0,0,0>
 """.strip()
-assert calculate(puzzle) == 1
+    assert calculate(puzzle) == 1
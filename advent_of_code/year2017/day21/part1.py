@@ -12,8 +12,9 @@ def calculate(text: str, iteration_count=5) -> int:
     return count_enabled(pattern)
 
 
-puzzle = """
+def self_check():
+    puzzle = """
 ../.# => ##./#../...
 .#./..#/### => #..#/..../..../#..#
 """.strip()
-assert calculate(puzzle, 2) == 12
+    assert calculate(puzzle, 2) == 12
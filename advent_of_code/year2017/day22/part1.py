@@ -6,9 +6,10 @@ def calculate(text: str) -> int:
     return infect(infections, 10_000, [State.CLEAN, State.INFECTED])
 
 
-puzzle = """
+def self_check():
+    puzzle = """
 ..#
 #..
 ...
 """.strip()
-assert calculate(puzzle) == 5587
+    assert calculate(puzzle) == 5587
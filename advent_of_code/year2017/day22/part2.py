@@ -10,9 +10,10 @@ def calculate(text: str) -> int:
     )
 
 
-puzzle = """
+def self_check():
+    puzzle = """
 ..#
 #..
 ...
 """.strip()
-assert calculate(puzzle) == 2511944
+    assert calculate(puzzle) == 2511944
@@ -8,7 +8,8 @@ def calculate(text: str) -> int:
     return max_strength
 
 
-puzzle = """
+def self_check():
+    puzzle = """
 0/2
 2/2
 2/3
@@ -18,4 +19,4 @@ puzzle = """
 10/1
 9/10
 """.strip()
-assert calculate(puzzle) == 31
+    assert calculate(puzzle) == 31
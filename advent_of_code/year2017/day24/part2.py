@@ -9,7 +9,8 @@ def calculate(text: str) -> int:
     return max_strength
 
 
-puzzle = """
+def self_check():
+    puzzle = """
 0/2
 2/2
 2/3
@@ -19,4 +20,4 @@ puzzle = """
 10/1
 9/10
 """.strip()
-assert calculate(puzzle) == 19
+    assert calculate(puzzle) == 19
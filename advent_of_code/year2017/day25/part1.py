@@ -8,7 +8,8 @@ def calculate(text: str) -> int:
     return sum(turing_machine.tape.values())
 
 
-puzzle = """
+def self_check():
+    puzzle = """
 Begin in state A.
 Perform a diagnostic checksum after 6 steps.
 
@@ -32,4 +33,4 @@ In state B:
     - Move one slot to the right.
     - Continue with state A.
 """.strip()
-assert calculate(puzzle) == 3
+    assert calculate(puzzle) == 3
@@ -2,10 +2,11 @@ def calculate(text: str) -> int:
     return sum(map(int, text.splitlines()))
 
 
-puzzle = """
+def self_check():
+    puzzle = """
 +1
 -2
 +3
 +1
 """.strip()
-assert calculate(puzzle) == 3
+    assert calculate(puzzle) == 3
@@ -12,10 +12,11 @@ def calculate(text: str) -> int:
             seen_frequencies.add(current_frequency)
 
 
-puzzle = """
+def self_check():
+    puzzle = """
 +1
 -2
 +3
 +1
 """.strip()
-assert calculate(puzzle) == 2
+    assert calculate(puzzle) == 2
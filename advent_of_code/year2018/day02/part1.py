@@ -30,7 +30,8 @@ def calculate(text: str) -> int:
     return boxes_with_two * boxes_with_three
 
 
-puzzle = """
+def self_check():
+    puzzle = """
 abcdef
 bababc
 abbcde
@@ -39,4 +40,4 @@ aabcdd
 abcdee
 ababab
 """.strip()
-assert calculate(puzzle) == 12
+    assert calculate(puzzle) == 12
@@ -18,7 +18,8 @@ def calculate(text: str) -> str:
     raise RuntimeError("Could not find boxes with hamming distance == 1")
 
 
-puzzle = """
+def self_check():
+    puzzle = """
 abcde
 fghij
 klmno
@@ -27,4 +28,4 @@ fguij
 axcye
 wvxyz
 """.strip()
-assert calculate(puzzle) == "fgij"
+    assert calculate(puzzle) == "fgij"
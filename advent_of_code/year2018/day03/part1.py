@@ -6,9 +6,10 @@ def calculate(text: str) -> int:
     return sum(1 for ids in fabric.values() if len(ids) >= 2)
 
 
-puzzle = """
+def self_check():
+    puzzle = """
 #1 @ 1,3: 4x4
 #2 @ 3,1: 4x4
 #3 @ 5,5: 2x2
 """.strip()
-assert calculate(puzzle) == 4
+    assert calculate(puzzle) == 4
@@ -17,9 +17,10 @@ def calculate(text: str) -> int:
     return result[0]
 
 
-puzzle = """
+def self_check():
+    puzzle = """
 #1 @ 1,3: 4x4
 #2 @ 3,1: 4x4
 #3 @ 5,5: 2x2
 """.strip()
-assert calculate(puzzle) == 3
+    assert calculate(puzzle) == 3
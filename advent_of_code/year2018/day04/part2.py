@@ -20,7 +20,8 @@ def calculate(text: str) -> int:
     )
 
 
-puzzle = """
+def self_check():
+    puzzle = """
 [1518-11-01 00:00] Guard #10 begins shift
 [1518-11-01 00:05] falls asleep
 [1518-11-01 00:25] wakes up
@@ -39,4 +40,4 @@ puzzle = """
 [1518-11-05 00:45] falls asleep
 [1518-11-05 00:55] wakes up
 """.strip()
-assert calculate(puzzle) == 4455
+    assert calculate(puzzle) == 4455
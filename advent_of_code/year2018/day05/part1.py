@@ -6,5 +6,6 @@ def calculate(text: str) -> int:
     return len(reacted_polymer)
 
 
-puzzle = "dabAcCaCBAcCcaDA"
-assert calculate(puzzle) == 10
+def self_check():
+    puzzle = "dabAcCaCBAcCcaDA"
+    assert calculate(puzzle) == 10
@@ -13,5 +13,6 @@ def calculate(text: str) -> int:
     return len(best_reduced_polymer)
 
 
-puzzle = "dabAcCaCBAcCcaDA"
-assert calculate(puzzle) == 4
+def self_check():
+    puzzle = "dabAcCaCBAcCcaDA"
+    assert calculate(puzzle) == 4
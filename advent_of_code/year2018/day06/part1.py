@@ -42,7 +42,8 @@ def calculate(text: str) -> int:
     return max(areas_by_label[i] for i in labels_to_look_for)
 
 
-puzzle = """
+def self_check():
+    puzzle = """
 1, 1
 1, 6
 8, 3
@@ -50,4 +51,4 @@ puzzle = """
 5, 5
 8, 9
 """.strip()
-assert calculate(puzzle) == 17
+    assert calculate(puzzle) == 17
@@ -16,7 +16,8 @@ def calculate(text: str, max_distance: int = 10000) -> int:
     return sum(1 for v in grid.values() if v == "#")
 
 
-puzzle = """
+def self_check():
+    puzzle = """
 1, 1
 1, 6
 8, 3
@@ -24,4 +25,4 @@ puzzle = """
 5, 5
 8, 9
 """.strip()
-assert calculate(puzzle, max_distance=32) == 16
+    assert calculate(puzzle, max_distance=32) == 16
@@ -25,7 +25,8 @@ def calculate(text: str) -> str:
     return "".join(node.name for node in walk_tree(tree))
 
 
-puzzle = """
+def self_check():
+    puzzle = """
 Step C must be finished before step A can begin.
 Step C must be finished before step F can begin.
 Step A must be finished before step B can begin.
@@ -34,4 +35,4 @@ Step B must be finished before step E can begin.
 Step D must be finished before step E can begin.
 Step F must be finished before step E can begin.
 """.strip()
-assert calculate(puzzle) == "CABDFE"
+    assert calculate(puzzle) == "CABDFE"
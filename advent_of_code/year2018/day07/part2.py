@@ -81,7 +81,8 @@ def calculate(text: str, worker_count: int = 5, step_overhead: int = 60) -> int:
     return elapsed_ticks
 
 
-puzzle = """
+def self_check():
+    puzzle = """
 Step C must be finished before step A can begin.
 Step C must be finished before step F can begin.
 Step A must be finished before step B can begin.
@@ -90,4 +91,4 @@ Step B must be finished before step E can begin.
 Step D must be finished before step E can begin.
 Step F must be finished before step E can begin.
 """.strip()
-assert calculate(puzzle, worker_count=2, step_overhead=0) == 15
+    assert calculate(puzzle, worker_count=2, step_overhead=0) == 15
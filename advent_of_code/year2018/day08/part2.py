@@ -22,4 +22,5 @@ def calculate(text: str) -> int:
     return calculate_node_value(root)
 
 
-assert calculate("2 3 0 3 10 11 12 1 1 0 1 99 2 1 1 2") == 66
+def self_check():
+    assert calculate("2 3 0 3 10 11 12 1 1 0 1 99 2 1 1 2") == 66
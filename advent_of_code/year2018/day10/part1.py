@@ -7,7 +7,8 @@ def calculate(text: str) -> str:
     return "\n" + visualize_points(points, 100, 17)
 
 
-puzzle = """
+def self_check():
+    puzzle = """
 position=< 9,  1> velocity=< 0,  2>
 position=< 7,  0> velocity=<-1,  0>
 position=< 3, -2> velocity=<-1,  1>
@@ -40,7 +41,7 @@ position=< 5,  9> velocity=< 1, -2>
 position=<14,  7> velocity=<-2,  0>
 position=<-3,  6> velocity=< 2, -1>
 """.strip()
-solution = """
+    solution = """
 ....................................................................................................
 ....................................................................................................
 ....................................................................................................
@@ -59,4 +60,4 @@ solution = """
 ....................................................................................................
 ....................................................................................................
 """
-assert calculate(puzzle) == solution
+    assert calculate(puzzle) == solution
@@ -34,5 +34,6 @@ def calculate(text: str) -> str:
     return best_square
 
 
-assert calculate("18") == "90,269,16"
-assert calculate("42") == "232,251,12"
+def self_check():
+    assert calculate("18") == "90,269,16"
+    assert calculate("42") == "232,251,12"
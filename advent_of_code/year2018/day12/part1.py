@@ -1,25 +1,19 @@
-from .shared import parse_input, transform
+from functools import partial
 
+from advent_of_code.utils.cycles import fast_forward
 
-def calculate(text: str) -> int:
-    initial_state, transformations = parse_input(text)
+from .shared import advance_generation, parse_input, sum_plant_indices
 
-    state = initial_state
-    min_index = 0
-    for i in range(20):
-        # make sure we go back early enough
-        if not state.startswith("..."):
-            state = "..." + state
-            min_index -= 3
-        # same for at the end
-        if not state.endswith("..."):
-            state = state + "..."
 
-        state = transform(state, transformations)
-    return sum(i + min_index for i, c in enumerate(state) if c == "#")
+def calculate(text: str) -> int:
+    initial_state, transformations = parse_input(text)
+    plants = (0, initial_state)
+    plants = fast_forward(plants, partial(advance_generation, transformations=transformations), 20)
+    return sum_plant_indices(plants)
 
 
-puzzle = """
+def self_check():
+    puzzle = """
 initial state: #..#.#..##......###...###
 
 ...## => #
@@ -37,4 +31,4 @@ initial state: #..#.#..##......###...###
 ###.# => #
 ####. => #
 """.strip()
-assert calculate(puzzle) == 325
+    assert calculate(puzzle) == 325
@@ -1,23 +1,29 @@
-from .shared import parse_input, transform
+from functools import partial
 
+from advent_of_code.utils.cycles import record_cycle
+
+from .shared import advance_generation, parse_input, sum_plant_indices
 
-def calculate(text: str) -> int:
-    initial_state, transformations = parse_input(text)
 
-    state = initial_state
-    min_index = 0
+GENERATIONS = 50_000_000_000
 
-    # make sure we go back early enough
-    if not state.startswith("..."):
-        state = "..." + state
-        min_index -= 3
-    # same for at the end
-    if not state.endswith("..."):
-        state = state + "..."
 
-    # keep transforming until we're out of possibilities
-    for i in range(200):
-        state = transform(state, transformations) + "."
+def calculate(text: str) -> int:
+    initial_state, transformations = parse_input(text)
+    plants = (0, initial_state)
+
+    # wait until the pots repeat, regardless of where they are
+    states, cycle = record_cycle(
+        plants,
+        partial(advance_generation, transformations=transformations),
+        key=lambda plants: plants[1],
+        max_steps=GENERATIONS,
+    )
+    if cycle is None:
+        return sum_plant_indices(states[GENERATIONS])
 
-    # after this, nothing seems to be happening except that it moves to the right
-    return sum(i + min_index + 50000000000 - 200 for i, c in enumerate(state) if c == "#")
+    # every cycle shifts the pots by the same amount
+    idx = cycle.start + (GENERATIONS - cycle.start) % cycle.length
+    shift = states[cycle.start + cycle.length][0] - states[cycle.start][0]
+    first_index, pots = states[idx]
+    return sum_plant_indices((first_index + (GENERATIONS - idx) // cycle.length * shift, pots))
@@ -1,6 +1,10 @@
 from typing import Dict, Tuple
 
 
+# the plants as (index of the first pot, pots), where the pots start and end with a plant
+Plants = Tuple[int, str]
+
+
 def parse_input(text: str) -> Tuple[str, Dict[str, str]]:
     lines = text.splitlines()
     initial_state = lines[0].split("initial state: ")[1]
@@ -22,3 +26,16 @@ def transform(text: str, transformations: Dict[str, str]) -> str:
         else:
             chars[i] = "."
     return "".join(chars)
+
+
+def advance_generation(plants: Plants, transformations: Dict[str, str]) -> Plants:
+    first_index, pots = plants
+    # a pot is influenced by the two pots on either side, so pad it with enough empty ones
+    pots = transform("...." + pots + "....", transformations)
+    stripped_pots = pots.lstrip(".")
+    return first_index - 4 + len(pots) - len(stripped_pots), stripped_pots.rstrip(".")
+
+
+def sum_plant_indices(plants: Plants) -> int:
+    first_index, pots = plants
+    return sum(first_index + i for i, c in enumerate(pots) if c == "#")
@@ -11,7 +11,8 @@ def calculate(text: str) -> str:
     return ",".join(map(str, crashes[0]))
 
 
-puzzle = r"""
+def self_check():
+    puzzle = r"""
 /->-\
 |   |  /----\
 | /-+--+-\  |
@@ -19,4 +20,4 @@ puzzle = r"""
 \-+-/  \-+--/
   \------/
 """.strip()
-assert calculate(puzzle) == "7,3"
+    assert calculate(puzzle) == "7,3"
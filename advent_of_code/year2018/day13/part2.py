@@ -15,7 +15,8 @@ def calculate(text: str) -> str:
     return f"{track.carts[0].x},{track.carts[0].y}"
 
 
-puzzle = r"""
+def self_check():
+    puzzle = r"""
 />-<\
 |   |
 | /<+-\
@@ -24,4 +25,4 @@ puzzle = r"""
   |   ^
   \<->/
 """.strip()
-assert calculate(puzzle) == "6,4"
+    assert calculate(puzzle) == "6,4"
@@ -10,7 +10,8 @@ def calculate(text: str) -> str:
     return "".join(map(str, scoreboard[required_recipe_count : required_recipe_count + 10]))
 
 
-assert calculate("9") == "5158916779"
-assert calculate("5") == "0124515891"
-assert calculate("18") == "9251071085"
-assert calculate("2018") == "5941429882"
+def self_check():
+    assert calculate("9") == "5158916779"
+    assert calculate("5") == "0124515891"
+    assert calculate("18") == "9251071085"
+    assert calculate("2018") == "5941429882"
@@ -14,7 +14,8 @@ def calculate(text: str) -> int:
     return len(scoreboard) - len(text) - (0 if scoreboard[-len(score) :] == score else 1)
 
 
-assert calculate("51589") == 9
-assert calculate("01245") == 5
-assert calculate("92510") == 18
-assert calculate("59414") == 2018
+def self_check():
+    assert calculate("51589") == 9
+    assert calculate("01245") == 5
+    assert calculate("92510") == 18
+    assert calculate("59414") == 2018
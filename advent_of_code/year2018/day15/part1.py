@@ -15,7 +15,8 @@ def calculate(text: str) -> int:
     return rounds * sum(c.hit_points for c in state.characters)
 
 
-puzzle = """
+def self_check():
+    puzzle = """
 #######
 #.G...#
 #...EG#
@@ -24,9 +25,9 @@ puzzle = """
 #.....#
 #######
 """.strip()
-assert calculate(puzzle) == 27730
+    assert calculate(puzzle) == 27730
 
-puzzle = """
+    puzzle = """
 #######
 #G..#E#
 #E#E.E#
@@ -35,9 +36,9 @@ puzzle = """
 #...E.#
 #######
 """.strip()
-assert calculate(puzzle) == 36334
+    assert calculate(puzzle) == 36334
 
-puzzle = """
+    puzzle = """
 #######
 #E..EG#
 #.#G.E#
@@ -46,9 +47,9 @@ puzzle = """
 #..E#.#
 #######
 """.strip()
-assert calculate(puzzle) == 39514
+    assert calculate(puzzle) == 39514
 
-puzzle = """
+    puzzle = """
 #######
 #E.G#.#
 #.#G..#
@@ -57,9 +58,9 @@ puzzle = """
 #...E.#
 #######
 """.strip()
-assert calculate(puzzle) == 27755
+    assert calculate(puzzle) == 27755
 
-puzzle = """
+    puzzle = """
 #######
 #.E...#
 #.#..G#
@@ -68,9 +69,9 @@ puzzle = """
 #...#G#
 #######
 """.strip()
-assert calculate(puzzle) == 28944
+    assert calculate(puzzle) == 28944
 
-puzzle = """
+    puzzle = """
 #########
 #G......#
 #.E.#...#
@@ -81,4 +82,4 @@ puzzle = """
 #.....G.#
 #########
 """.strip()
-assert calculate(puzzle) == 18740
+    assert calculate(puzzle) == 18740
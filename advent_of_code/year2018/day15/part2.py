@@ -1,5 +1,8 @@
+from functools import partial
 from typing import Optional
 
+from advent_of_code.utils.parallel import find_first_success
+
 from .shared import CharacterType, State, advance_state, parse_state
 
 
@@ -7,8 +10,13 @@ def count_elves(state: State) -> int:
     return sum(1 for c in state.characters if c.type == CharacterType.Elf)
 
 
-def try_battle(text: str, elf_attack_power: int) -> Optional[int]:
-    state = parse_state(text, elf_attack_power=elf_attack_power, goblin_attack_power=3)
+def try_battle(initial_state: State, elf_attack_power: int) -> Optional[int]:
+    state = initial_state._replace(
+        characters=tuple(
+            c._replace(attack_power=elf_attack_power) if c.type == CharacterType.Elf else c
+            for c in initial_state.characters
+        )
+    )
     number_of_elves = count_elves(state)
     rounds = 0
     was_full_round = True
@@ -27,34 +35,14 @@ def try_battle(text: str, elf_attack_power: int) -> Optional[int]:
 
 
 def calculate(text: str) -> int:
-    # try finding the upper bound first
-    has_won = False
-    cur_power = 4
-    cur_outcome = None
-    while not has_won:
-        cur_outcome = try_battle(text, cur_power)
-        has_won = cur_outcome is not None
-        if not has_won:
-            cur_power *= 2
-
-    # now try finding the exact minimum, using a binary search
-    lower = int(cur_power / 2)
-    upper = cur_power
-    upper_outcome = cur_outcome
-    while upper - lower > 1:
-        mid = int((lower + upper) / 2)
-        outcome = try_battle(text, mid)
-        has_won = outcome is not None
-        if has_won:
-            upper = mid
-            upper_outcome = outcome
-        else:
-            lower = mid
-
-    return upper_outcome
-
-
-puzzle = """
+    # the elves win with every attack power above the minimum one, so look for it in parallel
+    state = parse_state(text, goblin_attack_power=3)
+    _, outcome = find_first_success(partial(try_battle, state), start=4)
+    return outcome
+
+
+def self_check():
+    puzzle = """
 #######
 #.G...#
 #...EG#
@@ -63,9 +51,9 @@ puzzle = """
 #.....#
 #######
 """.strip()
-assert calculate(puzzle) == 4988
+    assert calculate(puzzle) == 4988
 
-puzzle = """
+    puzzle = """
 #######
 #E..EG#
 #.#G.E#
@@ -74,9 +62,9 @@ puzzle = """
 #..E#.#
 #######
 """.strip()
-assert calculate(puzzle) == 31284
+    assert calculate(puzzle) == 31284
 
-puzzle = """
+    puzzle = """
 #######
 #E.G#.#
 #.#G..#
@@ -85,9 +73,9 @@ puzzle = """
 #...E.#
 #######
 """.strip()
-assert calculate(puzzle) == 3478
+    assert calculate(puzzle) == 3478
 
-puzzle = """
+    puzzle = """
 #######
 #.E...#
 #.#..G#
@@ -96,9 +84,9 @@ puzzle = """
 #...#G#
 #######
 """.strip()
-assert calculate(puzzle) == 6474
+    assert calculate(puzzle) == 6474
 
-puzzle = """
+    puzzle = """
 #########
 #G......#
 #.E.#...#
@@ -109,4 +97,4 @@ puzzle = """
 #.....G.#
 #########
 """.strip()
-assert calculate(puzzle) == 1140
+    assert calculate(puzzle) == 1140
@@ -12,7 +12,8 @@ def calculate(text: str) -> int:
     return sum(1 for v in matrix.values() if v == "~")
 
 
-puzzle = """
+def self_check():
+    puzzle = """
 x=495, y=2..7
 y=7, x=495..501
 x=501, y=3..7
@@ -22,4 +23,4 @@ x=498, y=10..13
 x=504, y=10..13
 y=13, x=498..504
 """.strip()
-assert calculate(puzzle) == 29
+    assert calculate(puzzle) == 29
@@ -15,7 +15,8 @@ def calculate(text: str) -> int:
     return acre_count[ACRE_TREE] * acre_count[ACRE_LUMBERYARD]
 
 
-puzzle = """
+def self_check():
+    puzzle = """
 .#.#...|#.
 .....#|##|
 .|..|...#.
@@ -27,4 +28,4 @@ puzzle = """
 |.||||..|.
 ...#.|..|.
 """.strip()
-assert calculate(puzzle) == 1147
+    assert calculate(puzzle) == 1147
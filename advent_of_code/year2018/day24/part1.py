@@ -8,7 +8,8 @@ def calculate(text: str) -> int:
     return state.total_unit_count
 
 
-puzzle = """
+def self_check():
+    puzzle = """
 Immune System:
 17 units each with 5390 hit points (weak to radiation, bludgeoning) with an attack that does 4507 fire damage at initiative 2
 989 units each with 1274 hit points (immune to fire; weak to bludgeoning, slashing) with an attack that does 25 slashing damage at initiative 3
@@ -17,4 +18,4 @@ Infection:
 801 units each with 4706 hit points (weak to radiation) with an attack that does 116 bludgeoning damage at initiative 1
 4485 units each with 2961 hit points (immune to radiation; weak to fire, cold) with an attack that does 12 slashing damage at initiative 4
 """.strip()
-assert calculate(puzzle) == 5216
+    assert calculate(puzzle) == 5216
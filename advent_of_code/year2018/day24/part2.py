@@ -1,29 +1,44 @@
-from .shared import attack, parse_battle_state
+from functools import partial
+from typing import Optional
+
+from advent_of_code.utils.parallel import scan_for_first_success
+
+from .shared import BattleGroup, BattleState, attack, parse_battle_state
+
+
+def fight(initial_state: BattleState, boost: int) -> Optional[int]:
+    # groups are mutated while fighting, so every fight gets its own copies
+    state = BattleState(
+        immune_system=tuple(
+            BattleGroup(**{**vars(group), "attack_points": group.attack_points + boost})
+            for group in initial_state.immune_system
+        ),
+        infection=tuple(BattleGroup(**vars(group)) for group in initial_state.infection),
+    )
+
+    # fight till the death (or until we reached an equilibrum)
+    while len(state.infection) > 0 and len(state.immune_system) > 0:
+        prev_count = state.total_unit_count
+        state = attack(state)
+        cur_count = state.total_unit_count
+        if cur_count == prev_count:
+            # we're stuck
+            break
+
+    has_won = len(state.immune_system) > 0 and len(state.infection) == 0
+    return state.total_unit_count if has_won else None
 
 
 def calculate(text: str) -> int:
-    boost = 1
-    has_won = False
-    while not has_won:
-        state = parse_battle_state(text)
-        # apply boost
-        for group in state.immune_system:
-            group.attack_points += boost
-
-        # fight till the death (or until we reached an equilibrum)
-        while len(state.infection) > 0 and len(state.immune_system) > 0:
-            prev_count = state.total_unit_count
-            state = attack(state)
-            cur_count = state.total_unit_count
-            if cur_count == prev_count:
-                # we're stuck
-                break
-        has_won = len(state.immune_system) > 0 and len(state.infection) == 0
-        boost += 1
-    return state.total_unit_count
-
-
-puzzle = """
+    # a higher boost doesn't guarantee a win, a stalemate can be reached when the remaining groups can no longer damage
+    # each other. So every boost is tried in order, a batch of them at a time.
+    state = parse_battle_state(text)
+    _, outcome = scan_for_first_success(partial(fight, state), start=1)
+    return outcome
+
+
+def self_check():
+    puzzle = """
 Immune System:
 17 units each with 5390 hit points (weak to radiation, bludgeoning) with an attack that does 4507 fire damage at initiative 2
 989 units each with 1274 hit points (immune to fire; weak to bludgeoning, slashing) with an attack that does 25 slashing damage at initiative 3
@@ -32,4 +47,4 @@ Infection:
 801 units each with 4706 hit points (weak to radiation) with an attack that does 116 bludgeoning damage at initiative 1
 4485 units each with 2961 hit points (immune to radiation; weak to fire, cold) with an attack that does 12 slashing damage at initiative 4
 """.strip()
-assert calculate(puzzle) == 51
+    assert calculate(puzzle) == 51
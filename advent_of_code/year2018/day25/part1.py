@@ -47,7 +47,8 @@ def calculate(text: str) -> int:
     return len(constellations)
 
 
-_ = """
+def self_check():
+    _ = """
 0,0,0,0
 3,0,0,0
 0,3,0,0
@@ -57,9 +58,9 @@ _ = """
 9,0,0,0
 12,0,0,0
 """.strip()
-assert calculate(_) == 2
+    assert calculate(_) == 2
 
-_ = """
+    _ = """
 -1,2,2,0
 0,0,2,-2
 0,0,0,-2
@@ -71,9 +72,9 @@ _ = """
 0,2,1,-2
 3,0,0,0
 """.strip()
-assert calculate(_) == 4
+    assert calculate(_) == 4
 
-_ = """
+    _ = """
 1,-1,0,1
 2,0,-1,0
 3,2,-1,0
@@ -85,9 +86,9 @@ _ = """
 1,-1,0,-1
 3,2,0,2
 """.strip()
-assert calculate(_) == 3
+    assert calculate(_) == 3
 
-_ = """
+    _ = """
 1,-1,-1,-2
 -2,-2,0,1
 0,2,1,3
@@ -99,4 +100,4 @@ _ = """
 1,2,2,0
 -1,-2,0,-2
 """.strip()
-assert calculate(_) == 8
+    assert calculate(_) == 8
@@ -10,7 +10,8 @@ def calculate(text: str):
     return total_fuel_requirement
 
 
-assert calculate("12\n") == 2
-assert calculate("14\n") == 2
-assert calculate("1969\n") == 654
-assert calculate("100756\n") == 33583
+def self_check():
+    assert calculate("12\n") == 2
+    assert calculate("14\n") == 2
+    assert calculate("1969\n") == 654
+    assert calculate("100756\n") == 33583
@@ -16,6 +16,7 @@ def calculate(text: str):
     return total_fuel_requirement
 
 
-assert calculate("14\n") == 2
-assert calculate("1969\n") == 966
-assert calculate("100756\n") == 50346
+def self_check():
+    assert calculate("14\n") == 2
+    assert calculate("1969\n") == 966
+    assert calculate("100756\n") == 50346
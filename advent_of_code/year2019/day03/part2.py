@@ -45,6 +45,7 @@ def calculate(lines: str) -> int:
     return min(first_wire_steps[k] + second_wire_steps[k] for k, v in path.items() if len(v) > 1 and k != (0, 0))
 
 
-assert calculate("R8,U5,L5,D3\nU7,R6,D4,L4\n") == 30
-assert calculate("R75,D30,R83,U83,L12,D49,R71,U7,L72\nU62,R66,U55,R34,D71,R55,D58,R83") == 610
-assert calculate("R98,U47,R26,D63,R33,U87,L62,D20,R33,U53,R51\nU98,R91,D20,R16,D67,R40,U7,R15,U6,R7") == 410
+def self_check():
+    assert calculate("R8,U5,L5,D3\nU7,R6,D4,L4\n") == 30
+    assert calculate("R75,D30,R83,U83,L12,D49,R71,U7,L72\nU62,R66,U55,R34,D71,R55,D58,R83") == 610
+    assert calculate("R98,U47,R26,D63,R33,U87,L62,D20,R33,U53,R51\nU98,R91,D20,R16,D67,R40,U7,R15,U6,R7") == 410
@@ -24,11 +24,12 @@ def validate_password(password: str) -> bool:
     return has_double_digits
 
 
-assert validate_password("112233")
-assert not validate_password("123444")
-assert validate_password("111122")
-
-
 def calculate(text: str) -> int:
     start, stop = map(int, text.split("-"))
     return sum(1 for password in range(start, stop) if validate_password(str(password)))
+
+
+def self_check():
+    assert validate_password("112233")
+    assert not validate_password("123444")
+    assert validate_password("111122")
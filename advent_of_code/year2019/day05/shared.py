@@ -1,6 +1,4 @@
-from collections import defaultdict
-from math import floor
-from typing import Generator, List, Tuple
+from typing import Generator, List, NoReturn, Optional, Tuple
 
 
 Instructions = List[int]
@@ -26,102 +24,183 @@ def parse_instructions(text: str) -> Instructions:
     return list(map(int, text.strip().split(",")))
 
 
-def streaming_evaluate(instructions: Instructions) -> Generator[int, int, None]:
-    memory = defaultdict(int)
-    memory.update(dict(enumerate(instructions)))
+def _decode(instruction: int) -> Tuple[int, int, int, int]:
+    return instruction % 100, instruction // 100 % 10, instruction // 1000 % 10, instruction // 10000 % 10
+
+
+def _invalid_address(addr: int, index: int) -> NoReturn:
+    # memory is a list, so negative addresses would silently wrap around instead of failing
+    raise RuntimeError(f"Invalid address {addr} at index {index}")
+
+
+class IntcodeMachine:
+    # runs until it needs I/O, so its state can be cloned at any point in between
+    __slots__ = ("memory", "decoded", "index", "relative_base", "halted")
+
+    def __init__(self, instructions: Instructions):
+        # memory is a flat list which grows on demand, alongside a cache of the decoded (opcode, modes) per address
+        self.memory = list(instructions)
+        self.decoded: List[Optional[Tuple[int, int, int, int]]] = [None] * len(self.memory)
+        self.index = 0
+        self.relative_base = 0
+        self.halted = False
+
+    def clone(self) -> "IntcodeMachine":
+        machine = IntcodeMachine.__new__(IntcodeMachine)
+        machine.memory = self.memory[:]
+        machine.decoded = self.decoded[:]
+        machine.index = self.index
+        machine.relative_base = self.relative_base
+        machine.halted = self.halted
+        return machine
+
+    def _grow_memory(self):
+        self.memory.extend([0] * len(self.memory))
+        self.decoded.extend([None] * len(self.decoded))
+
+    def send(self, value: int):
+        assert isinstance(value, int), f"Expected int, got {value}"
+        instruction = self.memory[self.index]
+        if instruction % 100 != OPCODE_READ_INPUT:
+            raise RuntimeError(f"Machine isn't waiting for input at index {self.index}")
+
+        addr = self.memory[self.index + 1]
+        if instruction // 100 % 10 == MODE_RELATIVE:
+            addr += self.relative_base
+        if addr < 0:
+            _invalid_address(addr, self.index)
+        while addr >= len(self.memory):
+            self._grow_memory()
+        self.memory[addr] = value
+        self.decoded[addr] = None
+        self.index += 2
+
+    def run(self) -> Optional[int]:
+        # runs until the next output (which is returned), or until the machine needs input or halted (returns None)
+        memory = self.memory
+        decoded = self.decoded
+        index = self.index
+        relative_base = self.relative_base
 
-    index = 0
-    relative_base = 0
+        # NOTE: this is the hot loop of all Intcode puzzles, so the OPCODE_* and MODE_* constants are inlined as
+        # literals (global lookups are measurably slower)
+        try:
+            while True:
+                try:
+                    instruction = decoded[index]
+                    if instruction is None:
+                        instruction = decoded[index] = _decode(memory[index])
+                    opcode, mode_a, mode_b, mode_c = instruction
+
+                    if opcode == 1 or opcode == 2 or opcode == 7 or opcode == 8:
+                        # OPCODE_ADD, OPCODE_MULTIPLY, OPCODE_LESS_THAN or OPCODE_EQUALS
+                        val_a = memory[index + 1]
+                        if mode_a == 0:
+                            val_a = memory[val_a if val_a >= 0 else _invalid_address(val_a, index)]
+                        elif mode_a == 2:
+                            val_a += relative_base
+                            val_a = memory[val_a if val_a >= 0 else _invalid_address(val_a, index)]
+                        val_b = memory[index + 2]
+                        if mode_b == 0:
+                            val_b = memory[val_b if val_b >= 0 else _invalid_address(val_b, index)]
+                        elif mode_b == 2:
+                            val_b += relative_base
+                            val_b = memory[val_b if val_b >= 0 else _invalid_address(val_b, index)]
+                        addr_out = memory[index + 3]
+                        if mode_c == 2:
+                            addr_out += relative_base
+                        if addr_out < 0:
+                            _invalid_address(addr_out, index)
+
+                        if opcode == 1:
+                            memory[addr_out] = val_a + val_b
+                        elif opcode == 2:
+                            memory[addr_out] = val_a * val_b
+                        elif opcode == 7:
+                            memory[addr_out] = 1 if val_a < val_b else 0
+                        else:
+                            memory[addr_out] = 1 if val_a == val_b else 0
+                        # the code could be self-modifying
+                        decoded[addr_out] = None
+                        index += 4
+                    elif opcode == 5 or opcode == 6:
+                        # OPCODE_JUMP_IF_TRUE or OPCODE_JUMP_IF_FALSE
+                        val_a = memory[index + 1]
+                        if mode_a == 0:
+                            val_a = memory[val_a if val_a >= 0 else _invalid_address(val_a, index)]
+                        elif mode_a == 2:
+                            val_a += relative_base
+                            val_a = memory[val_a if val_a >= 0 else _invalid_address(val_a, index)]
+
+                        if (val_a != 0) == (opcode == 5):
+                            val_b = memory[index + 2]
+                            if mode_b == 0:
+                                val_b = memory[val_b if val_b >= 0 else _invalid_address(val_b, index)]
+                            elif mode_b == 2:
+                                val_b += relative_base
+                                val_b = memory[val_b if val_b >= 0 else _invalid_address(val_b, index)]
+                            index = val_b if val_b >= 0 else _invalid_address(val_b, index)
+                        else:
+                            # skip jump
+                            index += 3
+                    elif opcode == 9:
+                        # OPCODE_ADJUST_RELATIVE_BASE
+                        val_a = memory[index + 1]
+                        if mode_a == 0:
+                            val_a = memory[val_a if val_a >= 0 else _invalid_address(val_a, index)]
+                        elif mode_a == 2:
+                            val_a += relative_base
+                            val_a = memory[val_a if val_a >= 0 else _invalid_address(val_a, index)]
+                        relative_base += val_a
+                        index += 2
+                    elif opcode == 4:
+                        # OPCODE_WRITE_OUTPUT
+                        val_a = memory[index + 1]
+                        if mode_a == 0:
+                            val_a = memory[val_a if val_a >= 0 else _invalid_address(val_a, index)]
+                        elif mode_a == 2:
+                            val_a += relative_base
+                            val_a = memory[val_a if val_a >= 0 else _invalid_address(val_a, index)]
+                        index += 2
+                        return val_a
+                    elif opcode == 3:
+                        # OPCODE_READ_INPUT: wait for send()
+                        return None
+                    elif opcode == 99:
+                        # OPCODE_EXIT
+                        self.halted = True
+                        return None
+                    else:
+                        raise RuntimeError(f"Invalid opcode {opcode} at index {index}")
+                except IndexError:
+                    # an address outside of memory was accessed, this always happens before the instruction modified
+                    # any state so grow memory and retry it
+                    if index >= len(memory):
+                        raise RuntimeError(f"Invalid instruction pointer {index}")
+                    self._grow_memory()
+        finally:
+            self.index = index
+            self.relative_base = relative_base
+
+    def run_until_input(self):
+        # for programs which are known to ask for input next, without producing any output first
+        output = self.run()
+        if output is not None:
+            raise RuntimeError(f"Unexpected output {output} while waiting for input at index {self.index}")
+
+
+def streaming_evaluate(instructions: Instructions) -> Generator[int, int, None]:
+    machine = IntcodeMachine(instructions)
     while True:
-        # fetch current opcode
-        instruction = memory[index]
-
-        param_modes = [
-            floor((instruction / 1e2) % 10),
-            floor((instruction / 1e3) % 10),
-            floor((instruction / 1e4) % 10),
-        ]
-        opcode = instruction % 100
-
-        def parse_param(number: int) -> int:
-            assert 0 < number < 4
-            mode = param_modes[number - 1]
-            assert 0 <= mode <= 2
-            val = memory[index + number]
-            if mode == MODE_POSITION:
-                val = memory[val]
-            elif mode == MODE_RELATIVE:
-                val = memory[relative_base + val]
-            return val
-
-        def parse_addr(number: int) -> int:
-            assert 0 < number < 4
-            mode = param_modes[number - 1]
-            assert 0 <= mode <= 2
-            val = memory[index + number]
-            if mode == MODE_RELATIVE:
-                val += relative_base
-            return val
-
-        if opcode == OPCODE_ADD:
-            val_a = parse_param(1)
-            val_b = parse_param(2)
-            addr_out = parse_addr(3)
-            memory[addr_out] = val_a + val_b
-            index += 4
-        elif opcode == OPCODE_MULTIPLY:
-            val_a = parse_param(1)
-            val_b = parse_param(2)
-            addr_out = parse_addr(3)
-            memory[addr_out] = val_a * val_b
-            index += 4
-        elif opcode == OPCODE_READ_INPUT:
-            addr = parse_addr(1)
-            memory[addr] = yield
-            assert isinstance(memory[addr], int), f"Expected int, got {memory[addr]}"
-            index += 2
-        elif opcode == OPCODE_WRITE_OUTPUT:
-            val_a = parse_param(1)
-            yield val_a
-            index += 2
-        elif opcode == OPCODE_JUMP_IF_TRUE:
-            val_a = parse_param(1)
-            val_b = parse_param(2)
-            if val_a != 0:
-                index = val_b
-            else:
-                # skip jump
-                index += 3
-        elif opcode == OPCODE_JUMP_IF_FALSE:
-            val_a = parse_param(1)
-            val_b = parse_param(2)
-            if val_a == 0:
-                index = val_b
-            else:
-                # skip jump
-                index += 3
-        elif opcode == OPCODE_LESS_THAN:
-            val_a = parse_param(1)
-            val_b = parse_param(2)
-            addr_out = parse_addr(3)
-            memory[addr_out] = 1 if val_a < val_b else 0
-            index += 4
-        elif opcode == OPCODE_EQUALS:
-            val_a = parse_param(1)
-            val_b = parse_param(2)
-            addr_out = parse_addr(3)
-            memory[addr_out] = 1 if val_a == val_b else 0
-            index += 4
-        elif opcode == OPCODE_ADJUST_RELATIVE_BASE:
-            relative_base += parse_param(1)
-            index += 2
-        elif opcode == OPCODE_EXIT:
+        output = machine.run()
+        if output is not None:
+            yield output
+        elif machine.halted:
             # evaluation ended, write back instructions from memory
-            for i in range(len(instructions)):
-                instructions[i] = memory[i]
+            instructions[:] = machine.memory[: len(instructions)]
             return
         else:
-            raise RuntimeError(f"Invalid opcode {opcode} at index {index}")
+            machine.send((yield))
 
 
 def evaluate(instructions: Instructions, input: int) -> int:
@@ -164,60 +243,61 @@ def _test_eval_with_multi_out(text: str) -> Tuple[int]:
     return outputs
 
 
-# day 5 tests
-assert _test_eval_simple("1101,100,-1,4,0") == "1101,100,-1,4,99"
-assert _test_eval_with_io("3,9,8,9,10,9,4,9,99,-1,8", 8) == 1
-assert _test_eval_with_io("3,9,8,9,10,9,4,9,99,-1,8", 5) == 0
-assert _test_eval_with_io("3,9,7,9,10,9,4,9,99,-1,8", 8) == 0
-assert _test_eval_with_io("3,9,7,9,10,9,4,9,99,-1,8", 5) == 1
-assert _test_eval_with_io("3,3,1108,-1,8,3,4,3,99", 8) == 1
-assert _test_eval_with_io("3,3,1108,-1,8,3,4,3,99", 5) == 0
-assert _test_eval_with_io("3,3,1107,-1,8,3,4,3,99", 8) == 0
-assert _test_eval_with_io("3,3,1107,-1,8,3,4,3,99", 5) == 1
-assert _test_eval_with_io("3,12,6,12,15,1,13,14,13,4,13,99,-1,0,1,9", 0) == 0
-assert _test_eval_with_io("3,12,6,12,15,1,13,14,13,4,13,99,-1,0,1,9", 5) == 1
-assert _test_eval_with_io("3,3,1105,-1,9,1101,0,0,12,4,12,99,1", 0) == 0
-assert _test_eval_with_io("3,3,1105,-1,9,1101,0,0,12,4,12,99,1", 5) == 1
-assert (
-    _test_eval_with_io(
-        "3,21,1008,21,8,20,1005,20,22,107,8,21,20,1006,20,31,1106,0,36,98,0,0,1002,21,125,20,4,20,1105,1,46,104,999,1105,1,46,1101,1000,1,20,4,20,1105,1,46,98,99",
-        5,
+def self_check():
+    # day 5 tests
+    assert _test_eval_simple("1101,100,-1,4,0") == "1101,100,-1,4,99"
+    assert _test_eval_with_io("3,9,8,9,10,9,4,9,99,-1,8", 8) == 1
+    assert _test_eval_with_io("3,9,8,9,10,9,4,9,99,-1,8", 5) == 0
+    assert _test_eval_with_io("3,9,7,9,10,9,4,9,99,-1,8", 8) == 0
+    assert _test_eval_with_io("3,9,7,9,10,9,4,9,99,-1,8", 5) == 1
+    assert _test_eval_with_io("3,3,1108,-1,8,3,4,3,99", 8) == 1
+    assert _test_eval_with_io("3,3,1108,-1,8,3,4,3,99", 5) == 0
+    assert _test_eval_with_io("3,3,1107,-1,8,3,4,3,99", 8) == 0
+    assert _test_eval_with_io("3,3,1107,-1,8,3,4,3,99", 5) == 1
+    assert _test_eval_with_io("3,12,6,12,15,1,13,14,13,4,13,99,-1,0,1,9", 0) == 0
+    assert _test_eval_with_io("3,12,6,12,15,1,13,14,13,4,13,99,-1,0,1,9", 5) == 1
+    assert _test_eval_with_io("3,3,1105,-1,9,1101,0,0,12,4,12,99,1", 0) == 0
+    assert _test_eval_with_io("3,3,1105,-1,9,1101,0,0,12,4,12,99,1", 5) == 1
+    assert (
+        _test_eval_with_io(
+            "3,21,1008,21,8,20,1005,20,22,107,8,21,20,1006,20,31,1106,0,36,98,0,0,1002,21,125,20,4,20,1105,1,46,104,999,1105,1,46,1101,1000,1,20,4,20,1105,1,46,98,99",
+            5,
+        )
+        == 999
     )
-    == 999
-)
-assert (
-    _test_eval_with_io(
-        "3,21,1008,21,8,20,1005,20,22,107,8,21,20,1006,20,31,1106,0,36,98,0,0,1002,21,125,20,4,20,1105,1,46,104,999,1105,1,46,1101,1000,1,20,4,20,1105,1,46,98,99",
-        8,
+    assert (
+        _test_eval_with_io(
+            "3,21,1008,21,8,20,1005,20,22,107,8,21,20,1006,20,31,1106,0,36,98,0,0,1002,21,125,20,4,20,1105,1,46,104,999,1105,1,46,1101,1000,1,20,4,20,1105,1,46,98,99",
+            8,
+        )
+        == 1000
     )
-    == 1000
-)
-assert (
-    _test_eval_with_io(
-        "3,21,1008,21,8,20,1005,20,22,107,8,21,20,1006,20,31,1106,0,36,98,0,0,1002,21,125,20,4,20,1105,1,46,104,999,1105,1,46,1101,1000,1,20,4,20,1105,1,46,98,99",
-        13,
+    assert (
+        _test_eval_with_io(
+            "3,21,1008,21,8,20,1005,20,22,107,8,21,20,1006,20,31,1106,0,36,98,0,0,1002,21,125,20,4,20,1105,1,46,104,999,1105,1,46,1101,1000,1,20,4,20,1105,1,46,98,99",
+            13,
+        )
+        == 1001
+    )
+
+    # day 9 tests
+    assert _test_eval_with_multi_out("109,1,204,-1,1001,100,1,100,1008,100,16,101,1006,101,0,99") == (
+        109,
+        1,
+        204,
+        -1,
+        1001,
+        100,
+        1,
+        100,
+        1008,
+        100,
+        16,
+        101,
+        1006,
+        101,
+        0,
+        99,
     )
-    == 1001
-)
-
-# day 9 tests
-assert _test_eval_with_multi_out("109,1,204,-1,1001,100,1,100,1008,100,16,101,1006,101,0,99") == (
-    109,
-    1,
-    204,
-    -1,
-    1001,
-    100,
-    1,
-    100,
-    1008,
-    100,
-    16,
-    101,
-    1006,
-    101,
-    0,
-    99,
-)
-assert _test_eval_with_multi_out("1102,34915192,34915192,7,4,7,99,0") == (1219070632396864,)
-assert _test_eval_with_multi_out("104,1125899906842624,99") == (1125899906842624,)
+    assert _test_eval_with_multi_out("1102,34915192,34915192,7,4,7,99,0") == (1219070632396864,)
+    assert _test_eval_with_multi_out("104,1125899906842624,99") == (1125899906842624,)
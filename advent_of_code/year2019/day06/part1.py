@@ -12,7 +12,8 @@ def calculate(text: str) -> int:
     return number_of_orbits
 
 
-puzzle = """COM)B
+def self_check():
+    puzzle = """COM)B
 B)C
 C)D
 D)E
@@ -23,4 +24,4 @@ D)I
 E)J
 J)K
 K)L"""
-assert calculate(puzzle) == 42
+    assert calculate(puzzle) == 42
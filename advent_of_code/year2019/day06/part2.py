@@ -19,7 +19,8 @@ def calculate(text: str) -> int:
         return our_idx + santa_idx
 
 
-puzzle = """COM)B
+def self_check():
+    puzzle = """COM)B
 B)C
 C)D
 D)E
@@ -32,4 +33,4 @@ J)K
 K)L
 K)YOU
 I)SAN"""
-assert calculate(puzzle) == 4
+    assert calculate(puzzle) == 4
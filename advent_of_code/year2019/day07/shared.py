@@ -14,9 +14,6 @@ def run_amplifier(text: str, phase_settings: Iterable[int]) -> int:
     return last_output_signal
 
 
-assert run_amplifier("3,15,3,16,1002,16,10,16,1,16,15,15,4,15,99,0,0", (4, 3, 2, 1, 0)) == 43210
-
-
 def run_amplifier_feedback_loop(text: str, phase_settings: Iterable[int]) -> int:
     def construct_amplifier(phase_setting: int):
         instructions = parse_instructions(text)
@@ -40,10 +37,13 @@ def run_amplifier_feedback_loop(text: str, phase_settings: Iterable[int]) -> int
     return last_output
 
 
-assert (
-    run_amplifier_feedback_loop(
-        "3,26,1001,26,-4,26,3,27,1002,27,2,27,1,27,26,27,4,27,1001,28,-1,28,1005,28,6,99,0,0,5",
-        (9, 8, 7, 6, 5),
+def self_check():
+    assert run_amplifier("3,15,3,16,1002,16,10,16,1,16,15,15,4,15,99,0,0", (4, 3, 2, 1, 0)) == 43210
+
+    assert (
+        run_amplifier_feedback_loop(
+            "3,26,1001,26,-4,26,3,27,1002,27,2,27,1,27,26,27,4,27,1001,28,-1,28,1005,28,6,99,0,0,5",
+            (9, 8, 7, 6, 5),
+        )
+        == 139629729
     )
-    == 139629729
-)
@@ -24,15 +24,16 @@ def composite_image(layers: Tuple[ImageLayer]) -> ImageLayer:
     return tuple(tuple(line) for line in final_image)
 
 
-assert composite_image(tuple(extract_image_layers((0, 2, 2, 2, 1, 1, 2, 2, 2, 2, 1, 2, 0, 0, 0, 0), 2, 2))) == (
-    (0, 1),
-    (1, 0),
-)
-
-
 def calculate(text: str) -> str:
     digits = tuple(map(int, text))
     layers = tuple(extract_image_layers(digits, 25, 6))
     final_image = composite_image(layers)
     answer = "\n".join("".join("x" if digit == 1 else " " for digit in line) for line in final_image) + "\n"
     return answer
+
+
+def self_check():
+    assert composite_image(tuple(extract_image_layers((0, 2, 2, 2, 1, 1, 2, 2, 2, 2, 1, 2, 0, 0, 0, 0), 2, 2))) == (
+        (0, 1),
+        (1, 0),
+    )
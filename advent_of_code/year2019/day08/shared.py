@@ -12,7 +12,8 @@ def extract_image_layers(digits: Tuple[int, ...], width: int, height: int) -> It
         yield tuple(layer)
 
 
-assert tuple(extract_image_layers((1, 2, 3, 4, 5, 6, 7, 8, 9, 0, 1, 2), 3, 2)) == (
-    ((1, 2, 3), (4, 5, 6)),
-    ((7, 8, 9), (0, 1, 2)),
-)
+def self_check():
+    assert tuple(extract_image_layers((1, 2, 3, 4, 5, 6, 7, 8, 9, 0, 1, 2), 3, 2)) == (
+        ((1, 2, 3), (4, 5, 6)),
+        ((7, 8, 9), (0, 1, 2)),
+    )
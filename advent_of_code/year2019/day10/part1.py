@@ -7,14 +7,15 @@ def calculate(text: str) -> int:
     return asteroid_count
 
 
-puzzle = """.#..#
+def self_check():
+    puzzle = """.#..#
 .....
 #####
 ....#
 ...##"""
-assert calculate(puzzle) == 8
+    assert calculate(puzzle) == 8
 
-puzzle = """......#.#.
+    puzzle = """......#.#.
 #..#.#....
 ..#######.
 .#.#.###..
@@ -24,9 +25,9 @@ puzzle = """......#.#.
 .##.#..###
 ##...#..#.
 .#....####"""
-assert calculate(puzzle) == 33
+    assert calculate(puzzle) == 33
 
-puzzle = """#.#...#.#.
+    puzzle = """#.#...#.#.
 .###....#.
 .#....#...
 ##.#.#.#.#
@@ -36,9 +37,9 @@ puzzle = """#.#...#.#.
 ..##....##
 ......#...
 .####.###."""
-assert calculate(puzzle) == 35
+    assert calculate(puzzle) == 35
 
-puzzle = """.#..#..###
+    puzzle = """.#..#..###
 ####.###.#
 ....###.#.
 ..###.##.#
@@ -48,9 +49,9 @@ puzzle = """.#..#..###
 #..#.#.###
 .##...##.#
 .....#.#.."""
-assert calculate(puzzle) == 41
+    assert calculate(puzzle) == 41
 
-puzzle = """.#..##.###...#######
+    puzzle = """.#..##.###...#######
 ##.############..##.
 .#.######.########.#
 .###.#######.####.#.
@@ -70,4 +71,4 @@ puzzle = """.#..##.###...#######
 .#.#.###########.###
 #.#.#.#####.####.###
 ###.##.####.##.#..##"""
-assert calculate(puzzle) == 210
+    assert calculate(puzzle) == 210
@@ -46,7 +46,8 @@ def calculate(text: str) -> int:
             return int(pos[0] * 100 + pos[1])
 
 
-puzzle = """.#..##.###...#######
+def self_check():
+    puzzle = """.#..##.###...#######
 ##.############..##.
 .#.######.########.#
 .###.#######.####.#.
@@ -66,4 +67,4 @@ puzzle = """.#..##.###...#######
 .#.#.###########.###
 #.#.#.#####.####.###
 ###.##.####.##.#..##"""
-assert calculate(puzzle) == 802
+    assert calculate(puzzle) == 802
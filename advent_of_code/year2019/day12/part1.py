@@ -8,14 +8,15 @@ def calculate(text: str, iterations: int = 1000) -> int:
     return sum(moon.total_energy for moon in moons)
 
 
-puzzle = """<x=-1, y=0, z=2>
+def self_check():
+    puzzle = """<x=-1, y=0, z=2>
 <x=2, y=-10, z=-7>
 <x=4, y=-8, z=8>
 <x=3, y=5, z=-1>"""
-assert calculate(puzzle, 10) == 179
+    assert calculate(puzzle, 10) == 179
 
-puzzle = """<x=-8, y=-10, z=0>
+    puzzle = """<x=-8, y=-10, z=0>
 <x=5, y=5, z=10>
 <x=2, y=-7, z=3>
 <x=9, y=-8, z=-3>"""
-assert calculate(puzzle, 100) == 1940
+    assert calculate(puzzle, 100) == 1940
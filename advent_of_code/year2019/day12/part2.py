@@ -33,14 +33,15 @@ def calculate(text: str) -> int:
     return lcm(lcm(cycles[0], cycles[1]), cycles[2])
 
 
-puzzle = """<x=-1, y=0, z=2>
+def self_check():
+    puzzle = """<x=-1, y=0, z=2>
 <x=2, y=-10, z=-7>
 <x=4, y=-8, z=8>
 <x=3, y=5, z=-1>"""
-assert calculate(puzzle) == 2772
+    assert calculate(puzzle) == 2772
 
-puzzle = """<x=-8, y=-10, z=0>
+    puzzle = """<x=-8, y=-10, z=0>
 <x=5, y=5, z=10>
 <x=2, y=-7, z=3>
 <x=9, y=-8, z=-3>"""
-assert calculate(puzzle) == 4686774924
+    assert calculate(puzzle) == 4686774924
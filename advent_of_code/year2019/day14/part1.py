@@ -6,24 +6,25 @@ def calculate(text: str) -> int:
     return minimum_ore(reactions, Quantity("FUEL", 1))
 
 
-puzzle = """10 ORE => 10 A
+def self_check():
+    puzzle = """10 ORE => 10 A
 1 ORE => 1 B
 7 A, 1 B => 1 C
 7 A, 1 C => 1 D
 7 A, 1 D => 1 E
 7 A, 1 E => 1 FUEL"""
-assert calculate(puzzle) == 31
+    assert calculate(puzzle) == 31
 
-puzzle = """9 ORE => 2 A
+    puzzle = """9 ORE => 2 A
 8 ORE => 3 B
 7 ORE => 5 C
 3 A, 4 B => 1 AB
 5 B, 7 C => 1 BC
 4 C, 1 A => 1 CA
 2 AB, 3 BC, 4 CA => 1 FUEL"""
-assert calculate(puzzle) == 165
+    assert calculate(puzzle) == 165
 
-puzzle = """157 ORE => 5 NZVS
+    puzzle = """157 ORE => 5 NZVS
 165 ORE => 6 DCFZ
 44 XJWVT, 5 KHKGT, 1 QDVJ, 29 NZVS, 9 GPVTF, 48 HKGWZ => 1 FUEL
 12 HKGWZ, 1 GPVTF, 8 PSHF => 9 QDVJ
@@ -32,9 +33,9 @@ puzzle = """157 ORE => 5 NZVS
 7 DCFZ, 7 PSHF => 2 XJWVT
 165 ORE => 2 GPVTF
 3 DCFZ, 7 NZVS, 5 HKGWZ, 10 PSHF => 8 KHKGT"""
-assert calculate(puzzle) == 13312
+    assert calculate(puzzle) == 13312
 
-puzzle = """2 VPVL, 7 FWMGM, 2 CXFTF, 11 MNCFX => 1 STKFG
+    puzzle = """2 VPVL, 7 FWMGM, 2 CXFTF, 11 MNCFX => 1 STKFG
 17 NVRVD, 3 JNWZP => 8 VPVL
 53 STKFG, 6 MNCFX, 46 VJHF, 81 HVMC, 68 CXFTF, 25 GNMV => 1 FUEL
 22 VJHF, 37 MNCFX => 5 FWMGM
@@ -46,9 +47,9 @@ puzzle = """2 VPVL, 7 FWMGM, 2 CXFTF, 11 MNCFX => 1 STKFG
 1 NVRVD => 8 CXFTF
 1 VJHF, 6 MNCFX => 4 RFSQX
 176 ORE => 6 VJHF"""
-assert calculate(puzzle) == 180697
+    assert calculate(puzzle) == 180697
 
-puzzle = """171 ORE => 8 CNZTR
+    puzzle = """171 ORE => 8 CNZTR
 7 ZLQW, 3 BMBT, 9 XCVML, 26 XMNCP, 1 WPTQ, 2 MZWV, 1 RJRHP => 4 PLWSL
 114 ORE => 4 BHXH
 14 VRPVC => 6 BMBT
@@ -65,4 +66,4 @@ puzzle = """171 ORE => 8 CNZTR
 121 ORE => 7 VRPVC
 7 XCVML => 6 RJRHP
 5 BHXH, 4 VRPVC => 5 LTCX"""
-assert calculate(puzzle) == 2210736
+    assert calculate(puzzle) == 2210736
@@ -1,7 +1,7 @@
 from collections import deque
 from typing import Set, Tuple
 
-from ..day05.shared import parse_instructions, streaming_evaluate
+from ..day05.shared import IntcodeMachine, parse_instructions
 
 
 STATUS_HIT_WALL = 0
@@ -24,63 +24,36 @@ Position = Tuple[int, int]
 
 
 def discover_map(text: str) -> Tuple[Set[Position], Position]:
-    instructions = parse_instructions(text)
-    gen = streaming_evaluate(instructions)
+    # BFS over the map, every reached position keeps a clone of the droid program so its neighbours can be explored
+    # without having to move the droid back and forth
+    machine = IntcodeMachine(parse_instructions(text))
+    machine.run_until_input()
 
     walls = set()
-    visited_path = deque(((0, 0),))
     visited_places = {(0, 0)}
-    x = 0
-    y = 0
-    direction = None
     oxygen_location = None
-    while True:
-        try:
-            res = next(gen)
-            if res is None:
-                # move to next position
-                for i in range(1, 5):
-                    new_x = x + MOVEMENT_VECTORS[i - 1][0]
-                    new_y = y + MOVEMENT_VECTORS[i - 1][1]
-                    if (new_x, new_y) in walls:
-                        continue
-                    elif (new_x, new_y) in visited_places:
-                        continue
-
-                    direction = i
-                    break
-                else:
-                    #  we have to backtrack
-                    if len(visited_path) == 1:
-                        # nothing to do anymore
-                        break
-                    visited_path.pop()
-                    old_x, old_y = visited_path.pop()
-                    direction = MOVEMENT_VECTORS.index((old_x - x, old_y - y)) + 1
-
-                status = gen.send(direction)
-            else:
-                status = res
+    queue = deque((((0, 0), machine),))
+    while len(queue) > 0:
+        (x, y), machine = queue.popleft()
+        for direction, (d_x, d_y) in enumerate(MOVEMENT_VECTORS, start=1):
+            new_position = (x + d_x, y + d_y)
+            if new_position in walls or new_position in visited_places:
+                continue
 
+            new_machine = machine.clone()
+            new_machine.send(direction)
+            status = new_machine.run()
             if status == STATUS_HIT_WALL:
-                wall_x = x + MOVEMENT_VECTORS[direction - 1][0]
-                wall_y = y + MOVEMENT_VECTORS[direction - 1][1]
-                walls.add((wall_x, wall_y))
-            elif status == STATUS_MOVED_STEP:
-                x += MOVEMENT_VECTORS[direction - 1][0]
-                y += MOVEMENT_VECTORS[direction - 1][1]
-                visited_places.add((x, y))
-                visited_path.append((x, y))
+                walls.add(new_position)
+                continue
             elif status == STATUS_FOUND_OXYGEN:
-                x += MOVEMENT_VECTORS[direction - 1][0]
-                y += MOVEMENT_VECTORS[direction - 1][1]
-                oxygen_location = (x, y)
-                visited_places.add((x, y))
-                visited_path.append((x, y))
-            else:
+                oxygen_location = new_position
+            elif status != STATUS_MOVED_STEP:
                 raise RuntimeError(f"unknown statuscode {status}")
-        except StopIteration:
-            break
+
+            new_machine.run_until_input()
+            visited_places.add(new_position)
+            queue.append((new_position, new_machine))
 
     return walls, oxygen_location
 
@@ -166,19 +139,20 @@ def flood_region(walls: Set[Position], start: Position):
     return iterations
 
 
-_ = {
-    (1, 0),
-    (2, 0),
-    (0, 1),
-    (3, 1),
-    (4, 1),
-    (0, 2),
-    (2, 2),
-    (5, 2),
-    (0, 3),
-    (4, 3),
-    (1, 4),
-    (2, 4),
-    (3, 4),
-}
-assert flood_region(_, (2, 3)) == 4
+def self_check():
+    _ = {
+        (1, 0),
+        (2, 0),
+        (0, 1),
+        (3, 1),
+        (4, 1),
+        (0, 2),
+        (2, 2),
+        (5, 2),
+        (0, 3),
+        (4, 3),
+        (1, 4),
+        (2, 4),
+        (3, 4),
+    }
+    assert flood_region(_, (2, 3)) == 4
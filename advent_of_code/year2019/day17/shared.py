@@ -111,18 +111,6 @@ def calculate_alignment_parameters(
     return sum(x * y for x, y in intersections)
 
 
-_ = parse_text(
-    """..#..........
-..#..........
-#######...###
-#.#...#...#.#
-#############
-..#...#...#..
-..#####...^.."""
-)
-assert calculate_alignment_parameters(*_) == 76
-
-
 def compress_path(directions: Iterable[Position]) -> Iterable[str]:
     # robot starts facing upwards
     last = (0, -1)
@@ -155,55 +143,6 @@ def compress_path(directions: Iterable[Position]) -> Iterable[str]:
         yield str(counter + 1)
 
 
-_ = parse_text(
-    """#######...#####
-#.....#...#...#
-#.....#...#...#
-......#...#...#
-......#...###.#
-......#.....#.#
->########...#.#
-......#.#...#.#
-......#########
-........#...#..
-....#########..
-....#...#......
-....#...#......
-....#...#......
-....#####......"""
-)
-assert tuple(compress_path(dir for dir, pos in walk_path(*_))) == (
-    "R",
-    "8",
-    "R",
-    "8",
-    "R",
-    "4",
-    "R",
-    "4",
-    "R",
-    "8",
-    "L",
-    "6",
-    "L",
-    "2",
-    "R",
-    "4",
-    "R",
-    "4",
-    "R",
-    "8",
-    "R",
-    "8",
-    "R",
-    "8",
-    "L",
-    "6",
-    "L",
-    "2",
-)
-
-
 class ConfigurableVacuumRobot(object):
     def __init__(self, instructions: str):
         self._instructions = parse_instructions(instructions)
@@ -258,3 +197,64 @@ class ConfigurableVacuumRobot(object):
             res = next(self._cpu)
             if res > 0xFF:
                 return res
+
+
+def self_check():
+    _ = parse_text(
+        """..#..........
+..#..........
+#######...###
+#.#...#...#.#
+#############
+..#...#...#..
+..#####...^.."""
+    )
+    assert calculate_alignment_parameters(*_) == 76
+
+    _ = parse_text(
+        """#######...#####
+#.....#...#...#
+#.....#...#...#
+......#...#...#
+......#...###.#
+......#.....#.#
+>########...#.#
+......#.#...#.#
+......#########
+........#...#..
+....#########..
+....#...#......
+....#...#......
+....#...#......
+....#####......"""
+    )
+    assert tuple(compress_path(dir for dir, pos in walk_path(*_))) == (
+        "R",
+        "8",
+        "R",
+        "8",
+        "R",
+        "4",
+        "R",
+        "4",
+        "R",
+        "8",
+        "L",
+        "6",
+        "L",
+        "2",
+        "R",
+        "4",
+        "R",
+        "4",
+        "R",
+        "8",
+        "R",
+        "8",
+        "R",
+        "8",
+        "L",
+        "6",
+        "L",
+        "2",
+    )
@@ -1,20 +1,23 @@
 from typing import Callable
 
-from ..day05.shared import parse_instructions, streaming_evaluate
+from ..day05.shared import IntcodeMachine, parse_instructions
 
 
 DroneQuerier = Callable[[int, int], int]
 
 
 def create_drone_querier(text: str) -> Callable[[int, int], int]:
-    instructions = parse_instructions(text)
+    # run the program up to the point where it asks for the coordinates, so every query can start from there
+    initial_machine = IntcodeMachine(parse_instructions(text))
+    initial_machine.run_until_input()
 
     def query_drone(x: int, y: int) -> int:
         assert x >= 0
         assert y >= 0
-        gen = streaming_evaluate(instructions)
-        next(gen)
-        gen.send(x)
-        return gen.send(y)
+        machine = initial_machine.clone()
+        machine.send(x)
+        machine.run_until_input()
+        machine.send(y)
+        return machine.run()
 
     return query_drone
@@ -1,6 +1,8 @@
 from itertools import product
 from typing import Tuple
 
+from advent_of_code.utils.cycles import record_cycle
+
 from .shared import Grid, Position, parse_grid
 
 
@@ -36,12 +38,6 @@ def calculate_biodiversity_rating(grid: Grid) -> int:
 
 
 def calculate(text: str) -> int:
-    grid = parse_grid(text)
-    seen_states = set()
-    while True:
-        grid = evolve_grid(grid)
-        state = tuple(grid)
-        if state in seen_states:
-            break
-        seen_states.add(state)
-    return calculate_biodiversity_rating(grid)
+    # the biodiversity rating uniquely identifies a layout
+    states, _ = record_cycle(parse_grid(text), evolve_grid, key=calculate_biodiversity_rating)
+    return calculate_biodiversity_rating(states[-1])
@@ -2,7 +2,7 @@ import re
 
 from itertools import combinations
 
-from ..day05.shared import parse_instructions, streaming_evaluate
+from ..day05.shared import IntcodeMachine, parse_instructions
 
 
 def parse_text(text: str):
@@ -51,25 +51,19 @@ def calculate(text: str) -> str:
         "photons",
     }
 
-    instructions = parse_instructions(text)
-    gen = streaming_evaluate(instructions)
+    machine = IntcodeMachine(parse_instructions(text))
 
-    def send(text: str):
-        for c in text:
-            gen.send(ord(c))
-        gen.send(ord("\n"))
+    def send(text: str, machine: IntcodeMachine = machine):
+        for c in text + "\n":
+            machine.run_until_input()
+            machine.send(ord(c))
 
-    def read():
+    def read(machine: IntcodeMachine = machine) -> str:
         buf = ""
-        c = next(gen)
-        buf += chr(c)
+        c = machine.run()
         while c is not None:
-            try:
-                c = next(gen)
-            except StopIteration:
-                break
-            if c is not None:
-                buf += chr(c)
+            buf += chr(c)
+            c = machine.run()
         return buf
 
     # discover all rooms
@@ -126,22 +120,20 @@ def calculate(text: str) -> str:
         send(f"drop {item}")
         read()  # discard output
 
-    # bruteforce all inventory combinations to enter the pressure sensitive room
+    # bruteforce all inventory combinations to enter the pressure sensitive room, every attempt starts from a clone
+    # of the droid standing at the checkpoint without any items
     for i in range(1, len(inventory)):
         for c in combinations(inventory, r=i):
+            attempt = machine.clone()
+
             # take the required items for this combination
             for item in c:
-                send(f"take {item}")
-                read()  # discard output
-
-            # sanity check
-            send("inv")
-            buf = read()
-            assert set(line[2:] for line in buf.splitlines() if line.startswith("- ")) == set(c)
+                send(f"take {item}", attempt)
+                read(attempt)  # discard output
 
             # try entring the pressure-sensitive floor
-            send("north")
-            buf = read()
+            send("north", attempt)
+            buf = read(attempt)
             if "Alert! Droids on this ship are lighter" in buf:
                 # too heavy!
                 pass
@@ -151,8 +143,3 @@ def calculate(text: str) -> str:
             else:
                 # success! Extract number from string
                 return re.search(r"by typing (\d+) on the keypad", buf).group(1)
-
-            # drop items again
-            for item in c:
-                send(f"drop {item}")
-                read()  # discard output
@@ -7,11 +7,12 @@ def calculate(text: str) -> int:
                 return entries[i] * entries[j]
 
 
-_input = """1721
+def self_check():
+    _input = """1721
 979
 366
 299
 675
 1456
 """.strip()
-assert calculate(_input) == 514579
+    assert calculate(_input) == 514579
@@ -8,11 +8,12 @@ def calculate(text: str) -> int:
                     return entries[i] * entries[j] * entries[k]
 
 
-_input = """1721
+def self_check():
+    _input = """1721
 979
 366
 299
 675
 1456
 """.strip()
-assert calculate(_input) == 241861950
+    assert calculate(_input) == 241861950
@@ -10,7 +10,8 @@ def calculate(text: str):
     return valid_passwords
 
 
-puzzle = """1-3 a: abcde
+def self_check():
+    puzzle = """1-3 a: abcde
 1-3 b: cdefg
 2-9 c: ccccccccc"""
-assert calculate(puzzle) == 1
+    assert calculate(puzzle) == 1
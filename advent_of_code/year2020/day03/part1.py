@@ -6,7 +6,8 @@ def calculate(text: str) -> int:
     return count_trees_for_slope_pattern(max_x, max_y, trees, slope_pattern=(3, 1))
 
 
-puzzle = """..##.......
+def self_check():
+    puzzle = """..##.......
 #...#...#..
 .#....#..#.
 ..#.#...#.#
@@ -17,4 +18,4 @@ puzzle = """..##.......
 #.##...#...
 #...##....#
 .#..#...#.#"""
-assert calculate(puzzle) == 7
+    assert calculate(puzzle) == 7
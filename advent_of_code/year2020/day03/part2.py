@@ -12,7 +12,8 @@ def calculate(text: str) -> int:
     )
 
 
-puzzle = """..##.......
+def self_check():
+    puzzle = """..##.......
 #...#...#..
 .#....#..#.
 ..#.#...#.#
@@ -23,4 +24,4 @@ puzzle = """..##.......
 #.##...#...
 #...##....#
 .#..#...#.#"""
-assert calculate(puzzle) == 336
+    assert calculate(puzzle) == 336
@@ -11,7 +11,8 @@ def calculate(text: str) -> int:
     return valid_passwords
 
 
-puzzle = """ecl:gry pid:860033327 eyr:2020 hcl:#fffffd
+def self_check():
+    puzzle = """ecl:gry pid:860033327 eyr:2020 hcl:#fffffd
 byr:1937 iyr:2017 cid:147 hgt:183cm
 
 iyr:2013 ecl:amb cid:350 eyr:2023 pid:028048884
@@ -24,4 +25,4 @@ hgt:179cm
 
 hcl:#cfa07d eyr:2025 pid:166559648
 iyr:2011 ecl:brn hgt:59in"""
-assert calculate(puzzle) == 2
+    assert calculate(puzzle) == 2
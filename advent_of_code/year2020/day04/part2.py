@@ -45,7 +45,8 @@ def calculate(text: str) -> int:
     return valid_passwords
 
 
-puzzle = """eyr:1972 cid:100
+def self_check():
+    puzzle = """eyr:1972 cid:100
 hcl:#18171d ecl:amb hgt:170 pid:186cm iyr:2018 byr:1926
 
 iyr:2019
@@ -58,8 +59,8 @@ ecl:brn hgt:182cm pid:021572410 eyr:2020 byr:1992 cid:277
 hgt:59cm ecl:zzz
 eyr:2038 hcl:74454a iyr:2023
 pid:3556412378 byr:2007"""
-assert calculate(puzzle) == 0
-puzzle = """pid:087499704 hgt:74in ecl:grn iyr:2012 eyr:2030 byr:1980
+    assert calculate(puzzle) == 0
+    puzzle = """pid:087499704 hgt:74in ecl:grn iyr:2012 eyr:2030 byr:1980
 hcl:#623a2f
 
 eyr:2029 ecl:blu cid:129 byr:1989
@@ -71,4 +72,4 @@ pid:545766238 ecl:hzl
 eyr:2022
 
 iyr:2010 hgt:158cm hcl:#b6652a ecl:blu byr:1944 eyr:2021 pid:093154719"""
-assert calculate(puzzle) == 4
+    assert calculate(puzzle) == 4
@@ -32,7 +32,8 @@ def decode_seat_id(text: str) -> int:
     return seat_id
 
 
-assert decode_seat_id("FBFBBFFRLR") == 357
-assert decode_seat_id("BFFFBBFRRR") == 567
-assert decode_seat_id("FFFBBBFRRR") == 119
-assert decode_seat_id("BBFFBBFRLL") == 820
+def self_check():
+    assert decode_seat_id("FBFBBFFRLR") == 357
+    assert decode_seat_id("BFFFBBFRRR") == 567
+    assert decode_seat_id("FFFBBBFRRR") == 119
+    assert decode_seat_id("BBFFBBFRLL") == 820
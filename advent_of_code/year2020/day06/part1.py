@@ -11,7 +11,8 @@ def calculate(text: str) -> int:
     return total_answers
 
 
-puzzle = """abc
+def self_check():
+    puzzle = """abc
 
 a
 b
@@ -26,4 +27,4 @@ a
 a
 
 b"""
-assert calculate(puzzle) == 11
+    assert calculate(puzzle) == 11
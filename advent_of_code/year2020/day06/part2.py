@@ -14,7 +14,8 @@ def calculate(text: str) -> int:
     return total_answers
 
 
-puzzle = """abc
+def self_check():
+    puzzle = """abc
 
 a
 b
@@ -29,4 +30,4 @@ a
 a
 
 b"""
-assert calculate(puzzle) == 6
+    assert calculate(puzzle) == 6
@@ -24,7 +24,8 @@ def calculate(text: str):
     return len(parents)
 
 
-puzzle = """light red bags contain 1 bright white bag, 2 muted yellow bags.
+def self_check():
+    puzzle = """light red bags contain 1 bright white bag, 2 muted yellow bags.
 dark orange bags contain 3 bright white bags, 4 muted yellow bags.
 bright white bags contain 1 shiny gold bag.
 muted yellow bags contain 2 shiny gold bags, 9 faded blue bags.
@@ -33,4 +34,4 @@ dark olive bags contain 3 faded blue bags, 4 dotted black bags.
 vibrant plum bags contain 5 faded blue bags, 6 dotted black bags.
 faded blue bags contain no other bags.
 dotted black bags contain no other bags."""
-assert calculate(puzzle) == 4
+    assert calculate(puzzle) == 4
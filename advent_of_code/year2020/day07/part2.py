@@ -14,7 +14,8 @@ def calculate(text: str):
     return dfs("shiny gold") - 1
 
 
-puzzle = """light red bags contain 1 bright white bag, 2 muted yellow bags.
+def self_check():
+    puzzle = """light red bags contain 1 bright white bag, 2 muted yellow bags.
 dark orange bags contain 3 bright white bags, 4 muted yellow bags.
 bright white bags contain 1 shiny gold bag.
 muted yellow bags contain 2 shiny gold bags, 9 faded blue bags.
@@ -23,13 +24,13 @@ dark olive bags contain 3 faded blue bags, 4 dotted black bags.
 vibrant plum bags contain 5 faded blue bags, 6 dotted black bags.
 faded blue bags contain no other bags.
 dotted black bags contain no other bags."""
-assert calculate(puzzle) == 32
+    assert calculate(puzzle) == 32
 
-puzzle = """shiny gold bags contain 2 dark red bags.
+    puzzle = """shiny gold bags contain 2 dark red bags.
 dark red bags contain 2 dark orange bags.
 dark orange bags contain 2 dark yellow bags.
 dark yellow bags contain 2 dark green bags.
 dark green bags contain 2 dark blue bags.
 dark blue bags contain 2 dark violet bags.
 dark violet bags contain no other bags."""
-assert calculate(puzzle) == 126
+    assert calculate(puzzle) == 126
@@ -10,7 +10,8 @@ def calculate(text: str) -> int:
     return cpu.accumulator
 
 
-puzzle = """nop +0
+def self_check():
+    puzzle = """nop +0
 acc +1
 jmp +4
 acc +3
@@ -19,4 +20,4 @@ acc -99
 acc +1
 jmp -4
 acc +6"""
-assert calculate(puzzle) == 5
+    assert calculate(puzzle) == 5
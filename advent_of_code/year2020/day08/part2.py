@@ -35,7 +35,8 @@ def calculate(text: str) -> int:
     raise RuntimeError("did not find patch")
 
 
-puzzle = """nop +0
+def self_check():
+    puzzle = """nop +0
 acc +1
 jmp +4
 acc +3
@@ -44,4 +45,4 @@ acc -99
 acc +1
 jmp -4
 acc +6"""
-assert calculate(puzzle) == 8
+    assert calculate(puzzle) == 8
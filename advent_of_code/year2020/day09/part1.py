@@ -6,7 +6,8 @@ def calculate(text: str, preamble_length: int = 25) -> int:
     return find_first_non_sum(numbers, preamble_length)
 
 
-puzzle = """35
+def self_check():
+    puzzle = """35
 20
 15
 25
@@ -26,4 +27,4 @@ puzzle = """35
 277
 309
 576"""
-assert calculate(puzzle, 5) == 127
+    assert calculate(puzzle, 5) == 127
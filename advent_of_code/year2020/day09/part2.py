@@ -27,7 +27,8 @@ def calculate(text: str, preamble_length: int = 25) -> int:
     return min(subset) + max(subset)
 
 
-puzzle = """35
+def self_check():
+    puzzle = """35
 20
 15
 25
@@ -47,4 +48,4 @@ puzzle = """35
 277
 309
 576"""
-assert calculate(puzzle, 5) == 62
+    assert calculate(puzzle, 5) == 62
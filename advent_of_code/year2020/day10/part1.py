@@ -16,7 +16,8 @@ def calculate(text: str) -> int:
     return differences[1] * differences[3]
 
 
-puzzle = """16
+def self_check():
+    puzzle = """16
 10
 15
 5
@@ -27,9 +28,9 @@ puzzle = """16
 6
 12
 4"""
-assert calculate(puzzle) == 7 * 5
+    assert calculate(puzzle) == 7 * 5
 
-puzzle = """28
+    puzzle = """28
 33
 18
 42
@@ -60,4 +61,4 @@ puzzle = """28
 34
 10
 3"""
-assert calculate(puzzle) == 22 * 10
+    assert calculate(puzzle) == 22 * 10
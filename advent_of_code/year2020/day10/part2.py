@@ -52,7 +52,8 @@ def calculate(text: str) -> int:
     return total
 
 
-puzzle = """16
+def self_check():
+    puzzle = """16
 10
 15
 5
@@ -63,9 +64,9 @@ puzzle = """16
 6
 12
 4"""
-assert calculate(puzzle) == 8
+    assert calculate(puzzle) == 8
 
-puzzle = """28
+    puzzle = """28
 33
 18
 42
@@ -96,4 +97,4 @@ puzzle = """28
 34
 10
 3"""
-assert calculate(puzzle) == 19208
+    assert calculate(puzzle) == 19208
@@ -7,7 +7,8 @@ def calculate(text: str) -> int:
     return len(occupied_seats)
 
 
-puzzle = """L.LL.LL.LL
+def self_check():
+    puzzle = """L.LL.LL.LL
 LLLLLLL.LL
 L.L.L..L..
 LLLL.LL.LL
@@ -17,4 +18,4 @@ L.LLLLL.LL
 LLLLLLLLLL
 L.LLLLLL.L
 L.LLLLL.LL"""
-assert calculate(puzzle) == 37
+    assert calculate(puzzle) == 37
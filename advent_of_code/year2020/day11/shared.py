@@ -82,42 +82,6 @@ def _test_count_adjacent_seats(text: str):
     return count_adjacent_seats(start_seat, seats, occupied_seats, max_pos, True)
 
 
-assert (
-    _test_count_adjacent_seats(
-        """.......#.
-...#.....
-.#.......
-.........
-..#L....#
-....#....
-.........
-#........
-...#....."""
-    )
-    == 8
-)
-assert (
-    _test_count_adjacent_seats(
-        """.............
-.L.L.#.#.#.#.
-............."""
-    )
-    == 0
-)
-assert (
-    _test_count_adjacent_seats(
-        """.##.##.
-#.#.#.#
-##...##
-...L...
-##...##
-#.#.#.#
-.##.##."""
-    )
-    == 0
-)
-
-
 def find_stable_state(
     seats: Set[Seat],
     max_position: Seat,
@@ -153,3 +117,40 @@ def find_stable_state(
             break
 
     return available_seats, occupied_seats
+
+
+def self_check():
+    assert (
+        _test_count_adjacent_seats(
+            """.......#.
+...#.....
+.#.......
+.........
+..#L....#
+....#....
+.........
+#........
+...#....."""
+        )
+        == 8
+    )
+    assert (
+        _test_count_adjacent_seats(
+            """.............
+.L.L.#.#.#.#.
+............."""
+        )
+        == 0
+    )
+    assert (
+        _test_count_adjacent_seats(
+            """.##.##.
+#.#.#.#
+##...##
+...L...
+##...##
+#.#.#.#
+.##.##."""
+        )
+        == 0
+    )
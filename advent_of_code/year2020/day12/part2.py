@@ -23,9 +23,10 @@ def calculate(text: str) -> int:
     return manhattan_distance((0, 0), position)
 
 
-puzzle = """F10
+def self_check():
+    puzzle = """F10
 N3
 F7
 R90
 F11"""
-assert calculate(puzzle) == 286
+    assert calculate(puzzle) == 286
@@ -10,6 +10,7 @@ def calculate(text: str) -> int:
     return line * wait_time
 
 
-puzzle = """939
+def self_check():
+    puzzle = """939
 7,13,x,x,59,x,31,19"""
-assert calculate(puzzle) == 295
+    assert calculate(puzzle) == 295
@@ -50,21 +50,22 @@ def calculate(text: str) -> int:
     return sum(a[i] * M(i) * modinv(M(i), m[i]) for i in range(len(a))) % mult(m)
 
 
-puzzle = """0
+def self_check():
+    puzzle = """0
 7,13,x,x,59,x,31,19"""
-assert calculate(puzzle) == 1068781
-puzzle = """0
+    assert calculate(puzzle) == 1068781
+    puzzle = """0
 17,x,13,19"""
-assert calculate(puzzle) == 3417
-puzzle = """0
+    assert calculate(puzzle) == 3417
+    puzzle = """0
 67,7,59,61"""
-assert calculate(puzzle) == 754018
-puzzle = """0
+    assert calculate(puzzle) == 754018
+    puzzle = """0
 67,x,7,59,61"""
-assert calculate(puzzle) == 779210
-puzzle = """0
+    assert calculate(puzzle) == 779210
+    puzzle = """0
 67,7,x,59,61"""
-assert calculate(puzzle) == 1261476
-puzzle = """0
+    assert calculate(puzzle) == 1261476
+    puzzle = """0
 1789,37,47,1889"""
-assert calculate(puzzle) == 1202161486
+    assert calculate(puzzle) == 1202161486
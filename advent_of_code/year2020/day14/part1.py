@@ -14,8 +14,9 @@ def calculate(text: str) -> int:
     return sum(memory.values())
 
 
-puzzle = """mask = XXXXXXXXXXXXXXXXXXXXXXXXXXXXX1XXXX0X
+def self_check():
+    puzzle = """mask = XXXXXXXXXXXXXXXXXXXXXXXXXXXXX1XXXX0X
 mem[8] = 11
 mem[7] = 101
 mem[8] = 0"""
-assert calculate(puzzle) == 165
+    assert calculate(puzzle) == 165
@@ -21,8 +21,9 @@ def calculate(text: str) -> int:
     return sum(memory.values())
 
 
-puzzle = """mask = 000000000000000000000000000000X1001X
+def self_check():
+    puzzle = """mask = 000000000000000000000000000000X1001X
 mem[42] = 100
 mask = 00000000000000000000000000000000X0XX
 mem[26] = 1"""
-assert calculate(puzzle) == 208
+    assert calculate(puzzle) == 208
@@ -16,7 +16,8 @@ def calculate(text: str) -> int:
     return invalid_values_sum
 
 
-puzzle = """class: 1-3 or 5-7
+def self_check():
+    puzzle = """class: 1-3 or 5-7
 row: 6-11 or 33-44
 seat: 13-40 or 45-50
 
@@ -28,4 +29,4 @@ nearby tickets:
 40,4,50
 55,2,20
 38,6,12"""
-assert calculate(puzzle) == 71
+    assert calculate(puzzle) == 71
@@ -8,7 +8,8 @@ def calculate(text: str) -> int:
     return len(grid)
 
 
-puzzle = """.#.
+def self_check():
+    puzzle = """.#.
 ..#
 ###"""
-assert calculate(puzzle) == 848
+    assert calculate(puzzle) == 848
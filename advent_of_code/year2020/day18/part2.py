@@ -23,9 +23,10 @@ def calculate(text: str) -> int:
     return total
 
 
-assert calculate("1 + 2 * 3 + 4 * 5 + 6") == 231
-assert calculate("1 + (2 * 3) + (4 * (5 + 6))") == 51
-assert calculate("2 * 3 + (4 * 5)") == 46
-assert calculate("5 + (8 * 3 + 9 + 3 * 4 * 3)") == 1445
-assert calculate("5 * 9 * (7 * 3 * 3 + 9 * 3 + (8 + 6 * 4))") == 669060
-assert calculate("((2 + 4 * 9) * (6 + 9 * 8 + 6) + 6) + 2 + 4 * 2") == 23340
+def self_check():
+    assert calculate("1 + 2 * 3 + 4 * 5 + 6") == 231
+    assert calculate("1 + (2 * 3) + (4 * (5 + 6))") == 51
+    assert calculate("2 * 3 + (4 * 5)") == 46
+    assert calculate("5 + (8 * 3 + 9 + 3 * 4 * 3)") == 1445
+    assert calculate("5 * 9 * (7 * 3 * 3 + 9 * 3 + (8 + 6 * 4))") == 669060
+    assert calculate("((2 + 4 * 9) * (6 + 9 * 8 + 6) + 6) + 2 + 4 * 2") == 23340
@@ -12,7 +12,8 @@ def calculate(text: str) -> int:
     return valid_messages_count
 
 
-puzzle = """0: 4 1 5
+def self_check():
+    puzzle = """0: 4 1 5
 1: 2 3 | 3 2
 2: 4 4 | 5 5
 3: 4 5 | 5 4
@@ -24,4 +25,4 @@ bababa
 abbbab
 aaabbb
 aaaabbb"""
-assert calculate(puzzle) == 2
+    assert calculate(puzzle) == 2
@@ -53,7 +53,8 @@ def calculate(text: str) -> int:
     return valid_messages_count
 
 
-puzzle = """42: 9 14 | 10 1
+def self_check():
+    puzzle = """42: 9 14 | 10 1
 9: 14 27 | 1 26
 10: 23 14 | 28 1
 1: "a"
@@ -100,4 +101,4 @@ aaaabbaaaabbaaa
 aaaabbaabbaaaaaaabbbabbbaaabbaabaaa
 babaaabbbaaabaababbaabababaaab
 aabbbbbaabbbaaaaaabbbbbababaaaaabbaaabba"""
-assert calculate(puzzle) == 12
+    assert calculate(puzzle) == 12
@@ -9,7 +9,8 @@ def calculate(text: str) -> int:
     return reduce(lambda a, b: a * b, (tile_id for tile_id, matches in matched_tiles.items() if len(matches) == 2))
 
 
-puzzle = """Tile 2311:
+def self_check():
+    puzzle = """Tile 2311:
 ..##.#..#.
 ##..#.....
 #...##..#.
@@ -116,4 +117,4 @@ Tile 3079:
 ..#.###...
 ..#.......
 ..#.###..."""
-assert calculate(puzzle) == 20899048083289
+    assert calculate(puzzle) == 20899048083289
@@ -189,7 +189,8 @@ def calculate(text: str) -> int:
     return max_roughness
 
 
-puzzle = """Tile 2311:
+def self_check():
+    puzzle = """Tile 2311:
 ..##.#..#.
 ##..#.....
 #...##..#.
@@ -296,4 +297,4 @@ Tile 3079:
 ..#.###...
 ..#.......
 ..#.###..."""
-assert calculate(puzzle) == 273
+    assert calculate(puzzle) == 273
@@ -18,8 +18,9 @@ def calculate(text: str) -> int:
     return sum(v for k, v in freq_table.items() if k not in mapping)
 
 
-puzzle = """mxmxvkd kfcds sqjhc nhms (contains dairy, fish)
+def self_check():
+    puzzle = """mxmxvkd kfcds sqjhc nhms (contains dairy, fish)
 trh fvjkl sbzzf mxmxvkd (contains dairy)
 sqjhc fvjkl (contains soy)
 sqjhc mxmxvkd sbzzf (contains fish)"""
-assert calculate(puzzle) == 5
+    assert calculate(puzzle) == 5
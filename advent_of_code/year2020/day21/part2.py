@@ -6,8 +6,9 @@ def calculate(text: str) -> str:
     return ",".join(k for k, v in sorted(mapping.items(), key=lambda x: x[1]))
 
 
-puzzle = """mxmxvkd kfcds sqjhc nhms (contains dairy, fish)
+def self_check():
+    puzzle = """mxmxvkd kfcds sqjhc nhms (contains dairy, fish)
 trh fvjkl sbzzf mxmxvkd (contains dairy)
 sqjhc fvjkl (contains soy)
 sqjhc mxmxvkd sbzzf (contains fish)"""
-assert calculate(puzzle) == "mxmxvkd,sqjhc,fvjkl"
+    assert calculate(puzzle) == "mxmxvkd,sqjhc,fvjkl"
@@ -13,7 +13,8 @@ def calculate(text: str) -> int:
     return sum(i * x for i, x in enumerate(reversed(winning_player), start=1))
 
 
-puzzle = """Player 1:
+def self_check():
+    puzzle = """Player 1:
 9
 2
 6
@@ -26,4 +27,4 @@ Player 2:
 4
 7
 10"""
-assert calculate(puzzle) == 306
+    assert calculate(puzzle) == 306
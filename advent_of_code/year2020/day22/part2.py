@@ -39,7 +39,8 @@ def calculate(text: str) -> int:
     return sum(i * x for i, x in enumerate(reversed(winning_player), start=1))
 
 
-puzzle = """Player 1:
+def self_check():
+    puzzle = """Player 1:
 43
 19
 
@@ -47,10 +48,9 @@ Player 2:
 2
 29
 14"""
-assert calculate(puzzle) > 0
+    assert calculate(puzzle) > 0
 
-
-puzzle = """Player 1:
+    puzzle = """Player 1:
 9
 2
 6
@@ -63,4 +63,4 @@ Player 2:
 4
 7
 10"""
-assert calculate(puzzle) == 291
+    assert calculate(puzzle) == 291
@@ -10,5 +10,6 @@ def calculate(text: str, moves: int = 100) -> str:
     return "".join(map(str, cups[1:]))
 
 
-assert calculate("389125467", 10) == "92658374"
-assert calculate("389125467", 100) == "67384529"
+def self_check():
+    assert calculate("389125467", 10) == "92658374"
+    assert calculate("389125467", 100) == "67384529"
@@ -12,7 +12,8 @@ def calculate(text: str) -> int:
     return sum(1 for v in tiles.values() if v)
 
 
-puzzle = """sesenwnenenewseeswwswswwnenewsewsw
+def self_check():
+    puzzle = """sesenwnenenewseeswwswswwnenewsewsw
 neeenesenwnwwswnenewnwwsewnenwseswesw
 seswneswswsenwwnwse
 nwnwneseeswswnenewneswwnewseswneseene
@@ -32,4 +33,4 @@ nenewswnwewswnenesenwnesewesw
 eneswnwswnwsenenwnwnwwseeswneewsenese
 neswnwewnwnwseenwseesewsenwsweewe
 wseweeenwnesenwwwswnew"""
-assert calculate(puzzle) == 10
+    assert calculate(puzzle) == 10
@@ -57,7 +57,8 @@ def calculate(text: str) -> int:
     return sum(1 for v in tiles.values() if v)
 
 
-puzzle = """sesenwnenenewseeswwswswwnenewsewsw
+def self_check():
+    puzzle = """sesenwnenenewseeswwswswwnenewsewsw
 neeenesenwnwwswnenewnwwsewnenwseswesw
 seswneswswsenwwnwse
 nwnwneseeswswnenewneswwnewseswneseene
@@ -77,4 +78,4 @@ nenewswnwewswnenesenwnesewesw
 eneswnwswnwsenenwnwnwwseeswneewsenese
 neswnwewnwnwseenwseesewsenwsweewe
 wseweeenwnesenwwwswnew"""
-assert calculate(puzzle) == 2208
+    assert calculate(puzzle) == 2208
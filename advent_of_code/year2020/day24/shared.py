@@ -36,10 +36,6 @@ def move(position: Coordinate, path: Iterable[str]) -> Coordinate:
     return position
 
 
-assert move((0, 0), ["e", "se", "w"]) == (0, 1)
-assert move((0, 0), ["nw", "w", "sw", "e", "e"]) == (0, 0)
-
-
 def adjacent_tiles(position: Coordinate) -> Iterable[Coordinate]:
     yield position[0] + 1, position[1]
     yield position[0], position[1] + 1
@@ -47,3 +43,8 @@ def adjacent_tiles(position: Coordinate) -> Iterable[Coordinate]:
     yield position[0] - 1, position[1]
     yield position[0], position[1] - 1
     yield position[0] + 1, position[1] - 1
+
+
+def self_check():
+    assert move((0, 0), ["e", "se", "w"]) == (0, 1)
+    assert move((0, 0), ["nw", "w", "sw", "e", "e"]) == (0, 0)
@@ -13,10 +13,6 @@ except ImportError:
                 return loop_size
 
 
-assert determine_loop_size(5764801) == 8
-assert determine_loop_size(17807724) == 11
-
-
 try:
     from .part1_native import transform
 except ImportError:
@@ -29,18 +25,21 @@ except ImportError:
         return value
 
 
-assert transform(7, 8) == 5764801
-assert transform(7, 11) == 17807724
-assert transform(17807724, 8) == 14897079
-assert transform(5764801, 11) == 14897079
-
-
 def calculate(text: str) -> int:
     a_key, b_key = map(int, text.splitlines())
     a_loop_size = determine_loop_size(a_key)
     return transform(b_key, a_loop_size)
 
 
-puzzle = """5764801
+def self_check():
+    assert determine_loop_size(5764801) == 8
+    assert determine_loop_size(17807724) == 11
+
+    assert transform(7, 8) == 5764801
+    assert transform(7, 11) == 17807724
+    assert transform(17807724, 8) == 14897079
+    assert transform(5764801, 11) == 14897079
+
+    puzzle = """5764801
 17807724"""
-assert calculate(puzzle) == 14897079
+    assert calculate(puzzle) == 14897079
@@ -0,0 +1,27 @@
+import pytest
+
+from advent_of_code.runner import parse_time_budgets
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--time-budget",
+        action="append",
+        default=[],
+        metavar="[YEAR=]SECONDS",
+        help="Fail puzzles which take longer than this, optionally only for a certain year",
+    )
+    parser.addoption(
+        "--enforce-goals",
+        action="store_true",
+        default=False,
+        help="Apply the time budgets of the personal goals in the README",
+    )
+
+
+@pytest.fixture(scope="session")
+def time_budgets(pytestconfig):
+    try:
+        return parse_time_budgets(pytestconfig.getoption("time_budget"), pytestconfig.getoption("enforce_goals"))
+    except ValueError as e:
+        raise pytest.UsageError(str(e))
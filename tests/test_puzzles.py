@@ -2,6 +2,7 @@ import os
 import re
 
 from glob import iglob
+from importlib import import_module
 
 import pytest
 
@@ -10,9 +11,15 @@ from advent_of_code.loader import (
     load_puzzle_input,
     load_puzzle_solver,
 )
+from advent_of_code.runner import (
+    PuzzleTimeoutError,
+    get_time_budget,
+    solve_puzzle_in_subprocess,
+)
 
 
 PUZZLE_PATH = os.path.normpath(os.path.join(os.path.dirname(__file__), "..", "puzzles"))
+SOLUTION_PATH = os.path.normpath(os.path.join(os.path.dirname(__file__), "..", "advent_of_code"))
 
 
 def list_all_puzzle_answers():
@@ -29,15 +36,38 @@ def list_all_puzzle_answers():
 
 
 @pytest.mark.parametrize("year,day,part", list_all_puzzle_answers())
-def test_correctly_solve_puzzle(year: int, day: int, part: int):
-    puzzle_input = load_puzzle_input(year, day)
+def test_correctly_solve_puzzle(year: int, day: int, part: int, time_budgets):
     expected_answer = load_puzzle_answer(year, day, part)
-    solver = load_puzzle_solver(year, day, part)
 
-    actual_answer = solver(puzzle_input)
+    time_budget = get_time_budget(year, time_budgets)
+    if time_budget is None:
+        puzzle_input = load_puzzle_input(year, day)
+        solver = load_puzzle_solver(year, day, part)
+        actual_answer = solver(puzzle_input)
+    else:
+        try:
+            actual_answer, _ = solve_puzzle_in_subprocess(year, day, part, timeout=time_budget)
+        except PuzzleTimeoutError as e:
+            pytest.fail(f"Puzzle is over budget: {e}")
 
     # coerce expected answer to correct type, if needed
     if type(actual_answer) != str:
         expected_answer = (type(actual_answer))(expected_answer)
 
     assert actual_answer == expected_answer
+
+
+def list_all_self_checks():
+    for filename in sorted(iglob(os.path.join(SOLUTION_PATH, "year*", "day*", "*.py"))):
+        with open(filename, mode="r") as f:
+            if "\ndef self_check(" not in f.read():
+                continue
+
+        module_path = os.path.splitext(os.path.relpath(filename, os.path.dirname(SOLUTION_PATH)))[0]
+        yield module_path.replace(os.sep, ".")
+
+
+@pytest.mark.parametrize("module_name", list_all_self_checks())
+def test_self_check(module_name: str):
+    module = import_module(module_name)
+    module.self_check()
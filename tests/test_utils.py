@@ -0,0 +1,231 @@
+import random
+
+from functools import partial
+from hashlib import md5
+from itertools import combinations, islice, permutations, product
+from typing import List, Optional, Sequence
+
+import pytest
+
+from advent_of_code.utils import md5 as md5_utils
+from advent_of_code.utils.cycles import Cycle, detect_cycle, fast_forward, record_cycle
+from advent_of_code.utils.graph import (
+    DisjointSet,
+    build_distance_matrix,
+    find_optimal_route,
+)
+from advent_of_code.utils.grid import count_regions, iter_runs, label_regions
+from advent_of_code.utils.md5 import find_hash, find_hashes
+from advent_of_code.utils.parallel import (
+    find_first_success,
+    parallel_map,
+    scan_for_first_success,
+)
+from advent_of_code.utils.subsets import count_subsets_by_size, find_balanced_groups
+
+
+# the parallel code paths are forced with two jobs, regardless of the amount of CPUs
+JOBS = [1, 2]
+
+
+def _succeeds_from(threshold: int, candidate: int) -> Optional[int]:
+    # module level, so it can be sent to worker processes
+    return candidate * 10 if candidate >= threshold else None
+
+
+@pytest.mark.parametrize("jobs", JOBS + [3])
+def test_find_first_success(jobs: int):
+    for start in (0, 1, 5):
+        for threshold in range(start, start + 70):
+            fn = partial(_succeeds_from, threshold)
+            assert find_first_success(fn, start, jobs=jobs) == (threshold, threshold * 10)
+
+
+def _brute_force_route(distances: List[List[int]], maximize: bool, closed: bool) -> int:
+    n = len(distances)
+    weights = []
+    for order in permutations(range(n)):
+        if closed and order[0] != 0:
+            continue
+        edges = list(zip(order, order[1:])) + ([(order[-1], order[0])] if closed else [])
+        weights.append(sum(distances[a][b] for a, b in edges))
+    return max(weights) if maximize else min(weights)
+
+
+@pytest.mark.parametrize("maximize,closed", list(product([False, True], repeat=2)))
+def test_find_optimal_route(maximize: bool, closed: bool):
+    rng = random.Random(9)
+    for n in range(1, 8):
+        for _ in range(10):
+            distances = [[0 if a == b else rng.randint(-20, 100) for b in range(n)] for a in range(n)]
+            assert find_optimal_route(distances, maximize, closed) == _brute_force_route(distances, maximize, closed)
+
+
+def test_build_distance_matrix():
+    nodes, distances = build_distance_matrix({("b", "a"): 3, ("a", "c"): 5})
+    assert nodes == ["a", "b", "c"]
+    assert distances == [[0, 0, 5], [3, 0, 0], [0, 0, 0]]
+
+
+def _is_partition(values: List[int], groups: int) -> bool:
+    total = sum(values) / groups
+    return any(
+        all(sum(v for v, g in zip(values, assignment) if g == group) == total for group in range(groups))
+        for assignment in product(range(groups), repeat=len(values))
+    )
+
+
+def test_find_balanced_groups():
+    rng = random.Random(7)
+    for _ in range(40):
+        values = [rng.randint(1, 12) for _ in range(rng.randint(1, 7))]
+        for groups in (2, 3):
+            expected = set()
+            for size in range(1, len(values) + 1):
+                for indices in combinations(range(len(values)), size):
+                    group = [values[idx] for idx in indices]
+                    remaining = [value for idx, value in enumerate(values) if idx not in indices]
+                    if sum(group) * groups == sum(values) and _is_partition(remaining, groups - 1):
+                        expected.add(tuple(sorted(group, reverse=True)))
+
+            actual = list(find_balanced_groups(values, groups))
+            assert len(actual) == len(set(actual))
+            assert set(actual) == expected
+            # ordered by size
+            assert [len(group) for group in actual] == sorted(len(group) for group in actual)
+
+
+def test_count_subsets_by_size():
+    rng = random.Random(11)
+    for _ in range(50):
+        values = [rng.randint(1, 10) for _ in range(rng.randint(0, 9))]
+        total = rng.randint(0, 30)
+        expected = [
+            sum(1 for subset in combinations(values, size) if sum(subset) == total) for size in range(len(values) + 1)
+        ]
+        assert count_subsets_by_size(values, total) == expected
+
+
+def test_disjoint_set():
+    rng = random.Random(3)
+    regions = DisjointSet(50)
+    labels = list(range(50))
+    for _ in range(40):
+        a, b = rng.randrange(50), rng.randrange(50)
+        assert regions.union(a, b) == (labels[a] != labels[b])
+        old, new = labels[b], labels[a]
+        labels = [new if label == old else label for label in labels]
+
+    for a, b in combinations(range(50), 2):
+        assert (regions.find(a) == regions.find(b)) == (labels[a] == labels[b])
+    assert regions.find(regions.add()) == 50
+
+
+def _brute_force_regions(rows: List[int], width: int) -> int:
+    cells = {(x, y) for y, row in enumerate(rows) for x in range(width) if row >> x & 1}
+    regions = 0
+    while cells:
+        regions += 1
+        queue = [cells.pop()]
+        while queue:
+            x, y = queue.pop()
+            for neighbour in ((x - 1, y), (x + 1, y), (x, y - 1), (x, y + 1)):
+                if neighbour in cells:
+                    cells.remove(neighbour)
+                    queue.append(neighbour)
+    return regions
+
+
+def test_iter_runs():
+    assert list(iter_runs(0)) == []
+    assert list(iter_runs(0b1110011010)) == [(1, 2), (3, 5), (7, 10)]
+
+
+def test_count_regions():
+    rng = random.Random(5)
+    for _ in range(200):
+        width, height = rng.randint(1, 12), rng.randint(1, 12)
+        rows = [rng.getrandbits(width) for _ in range(height)]
+        assert count_regions(rows) == _brute_force_regions(rows, width)
+
+    # every run is labeled, the U shape is a single region
+    labels = {label for runs in label_regions([0b101, 0b101, 0b111]) for _, _, label in runs}
+    assert len(labels) == 1
+
+
+def _brute_force_cycle(initial: int, step) -> Cycle:
+    seen = {}
+    state = initial
+    while state not in seen:
+        seen[state] = len(seen)
+        state = step(state)
+    return Cycle(start=seen[state], length=len(seen) - seen[state])
+
+
+def _square_plus_one(modulus: int, state: int) -> int:
+    return (state * state + 1) % modulus
+
+
+def test_detect_cycle():
+    for modulus in range(1, 200):
+        for initial in (0, 2, modulus // 2):
+            step = partial(_square_plus_one, modulus)
+            expected = _brute_force_cycle(initial, step)
+            assert detect_cycle(initial, step) == expected
+
+            states, cycle = record_cycle(initial, step)
+            assert cycle == expected
+            assert states[-1] == states[cycle.start]
+            # states can also be compared through a key, here the state itself wrapped in a tuple
+            assert detect_cycle(initial, step, key=lambda state: (state,)) == expected
+
+
+def test_fast_forward():
+    step = partial(_square_plus_one, 1009)
+    state = 3
+    for steps in range(300):
+        assert fast_forward(3, step, steps) == state
+        state = step(state)
+
+    # far ahead, the state only depends on the position within the cycle
+    cycle = detect_cycle(3, step)
+    steps = 10**12
+    assert fast_forward(3, step, steps) == fast_forward(3, step, cycle.start + (steps - cycle.start) % cycle.length)
+
+
+def _succeeds_at(successes: Sequence[int], candidate: int) -> Optional[int]:
+    return candidate * 10 if candidate in successes else None
+
+
+@pytest.mark.parametrize("jobs", JOBS + [3])
+def test_scan_for_first_success(jobs: int):
+    # successes aren't monotone, so the lowest one has to be found regardless of the ones after it
+    assert scan_for_first_success(partial(_succeeds_at, (4, 9, 10)), 0, jobs=jobs) == (4, 40)
+    assert scan_for_first_success(partial(_succeeds_at, (4, 9, 10)), 5, jobs=jobs) == (9, 90)
+    assert scan_for_first_success(partial(_succeeds_at, (0,)), 0, jobs=jobs) == (0, 0)
+
+
+@pytest.mark.parametrize("jobs", JOBS)
+def test_parallel_map(jobs: int):
+    assert parallel_map(abs, range(-50, 50), jobs=jobs) == [abs(x) for x in range(-50, 50)]
+    assert parallel_map(abs, [], jobs=jobs) == []
+
+
+@pytest.mark.parametrize("jobs", JOBS)
+def test_find_hashes(jobs: int, monkeypatch):
+    # small chunks, so the hashes are spread over several of them
+    monkeypatch.setattr(md5_utils, "CHUNK_SIZE", 1000)
+
+    prefix = "abcdef"
+    expected = []
+    idx = 0
+    while len(expected) < 10:
+        digest = md5(f"{prefix}{idx}".encode()).digest()
+        if digest.hex().startswith("000"):
+            expected.append((idx, digest))
+        idx += 1
+
+    assert list(islice(find_hashes(prefix, 3, jobs=jobs), 10)) == expected
+    assert find_hash(prefix, 3, start=expected[3][0] + 1, jobs=jobs) == expected[4][0]
+    # an even amount of zeroes only checks whole bytes
+    assert all(digest.hex().startswith("00") for _, digest in islice(find_hashes(prefix, 2, jobs=jobs), 20))